@@ -1 +1,69 @@
-# Backend package
+"""
+BACKEND - Punto de entrada sin interfaz gráfica
+Importar el paquete no carga tkinter, NumPy, SQLite ni el modelo: el
+analizador se construye (y lee sus pesos) en la primera llamada a
+analyze() o get_analyzer(), y el resto de nombres públicos del backend
+se importan al usarlos por primera vez.
+
+    import Backend
+    Backend.analyze("for (let i = 0; i < n; i++) {}")['complexity']
+"""
+
+import os
+import threading
+
+# Nombre público -> módulo que lo define (se importa en el primer acceso)
+_LAZY_EXPORTS = {
+    'NeuralNetworkComplexityAnalyzer': 'Backend.backend',
+    'CodeFeatureExtractor': 'Backend.backend',
+    'ComplexityMapper': 'Backend.backend',
+    'SimpleNeuralNetwork': 'Backend.backend',
+    'DEFAULT_MODEL_PATH': 'Backend.backend',
+    'FeatureMatrix': 'Backend.matrix',
+    'ResultCache': 'Backend.cache',
+    'analyze_files': 'Backend.batch',
+    'FeatureStore': 'Backend.dataset',
+    'build_dataset': 'Backend.dataset',
+}
+
+__all__ = ['analyze', 'get_analyzer', *_LAZY_EXPORTS]
+
+_analyzers = {}
+_analyzers_lock = threading.Lock()
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def get_analyzer(model_path=None):
+    """Analizador determinista con los pesos de `model_path` (por defecto, DEFAULT_MODEL_PATH)
+
+    Se crea una vez por archivo de pesos, entrenando y guardando el modelo si
+    todavía no existe. Usa el motor de listas: el análisis solo aplica las
+    reglas de predicción, así que no necesita NumPy.
+    """
+    from Backend.backend import DEFAULT_MODEL_PATH, NeuralNetworkComplexityAnalyzer
+    model_path = model_path or DEFAULT_MODEL_PATH
+    with _analyzers_lock:
+        analyzer = _analyzers.get(model_path)
+        if analyzer is None:
+            if not os.path.exists(model_path):
+                from Backend.batch import ensure_model  # carga multiprocessing: solo si hay que entrenar
+                ensure_model(model_path)
+            analyzer = NeuralNetworkComplexityAnalyzer(deterministic=True, use_numpy=False)
+            analyzer.load_model(model_path)
+            _analyzers[model_path] = analyzer
+    return analyzer
+
+
+def analyze(code, functions=False, model_path=None):
+    """Resultado de analizar `code` (con el desglose por función si functions=True)"""
+    analyzer = get_analyzer(model_path)
+    return analyzer.analyze_functions(code) if functions else analyzer.analyze(code)
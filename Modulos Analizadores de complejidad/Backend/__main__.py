@@ -0,0 +1,45 @@
+"""
+Análisis rápido desde la línea de comandos, sin interfaz gráfica
+
+    python -m Backend archivo.js [otro.js ...] [--functions]
+    cat archivo.js | python -m Backend
+
+Escribe un resultado JSON por archivo (o uno para la entrada estándar).
+Pensado para invocaciones cortas: no carga tkinter, NumPy ni el pool de
+procesos de analyze_batch.py.
+"""
+
+import argparse
+import json
+import sys
+
+import Backend
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m Backend',
+                                     description="Analiza la complejidad de archivos JavaScript (JSON Lines)")
+    parser.add_argument('paths', nargs='*', help="archivos a analizar (sin archivos, la entrada estándar)")
+    parser.add_argument('--model', default=None, help="archivo de pesos (se entrena si no existe)")
+    parser.add_argument('--functions', action='store_true', help="incluir el desglose por función")
+    args = parser.parse_args(argv)
+
+    errors = 0
+    sources = args.paths or ['-']
+    for path in sources:
+        try:
+            if path == '-':
+                code = sys.stdin.read()
+            else:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    code = f.read()
+            result = {'path': path, **Backend.analyze(code, args.functions, args.model)}
+        except OSError as e:
+            result = {'path': path, 'error': str(e)}
+            errors += 1
+        print(json.dumps(result, ensure_ascii=False), flush=True)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
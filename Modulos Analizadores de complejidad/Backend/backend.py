@@ -4,13 +4,48 @@ Módulo responsable de la extracción de características y predicción
 de complejidad asintótica utilizando una red neuronal simple.
 """
 
-import json
-import re
-from collections import Counter
-import pickle
+import hashlib
+import importlib.util
 import os
 import math
 import random
+import threading
+import time
+from array import array
+
+# NumPy es opcional (sin él se usa el motor de listas) y se importa al crear
+# la primera red que lo usa: importar el backend no lo carga
+np = None
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+
+from Backend import patterns
+from Backend.bounds import stream_bounds
+from Backend.cache import FeatureCache, cache_key
+from Backend.functions import analyze_recursion, split_functions
+from Backend.loops import analyze_loops, bound_to_complexity
+from Backend.matrix import FeatureMatrix
+from Backend.recurrence import recurrence_bound
+from Backend.scanner import JavaScriptScanner, StreamingScanner, FEATURE_VERSION, DEFAULT_CHUNK_SIZE
+from Backend.weights import read_weights, write_weights
+
+# Versión de las reglas de SimpleNeuralNetwork.predict: incrementarla
+# cuando cambien (invalida las cachés de resultados)
+RULES_VERSION = 4
+
+def _load_numpy():
+    """Importa NumPy la primera vez que hace falta"""
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+
+# Buffers de activación de SimpleNeuralNetwork.infer, propios de cada hilo
+_thread_buffers = threading.local()
+
+# Ruta por defecto del modelo entrenado (junto a main.py)
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'complexity_model.bin')
 
 
 # ============================================================================
@@ -35,7 +70,7 @@ class CodeFeatureExtractor:
             indent = len(line) - len(stripped)
             
             # Contar FOR/WHILE que están sin indentación (nivel 0)
-            if indent == 0 and re.search(r'\b(for|while)\s*\(', stripped):
+            if indent == 0 and patterns.LOOP_HEADER.search(stripped):
                 loop_count += 1
         
         return loop_count
@@ -46,12 +81,10 @@ class CodeFeatureExtractor:
         lines = code.split('\n')
         max_nesting = 0
         current_nesting = 0
-        loop_keywords = ['for', 'while', 'do']
         
         for line in lines:
-            # Contar aperturas de bucles
-            for keyword in loop_keywords:
-                current_nesting += len(re.findall(rf'\b{keyword}\s*[\(\{{]', line))
+            # Contar aperturas de bucles (for, while, do)
+            current_nesting += len(patterns.LOOP_OPENING.findall(line))
             
             # Contar cierres (aproximado por llaves)
             current_nesting -= line.count('}')
@@ -66,19 +99,13 @@ class CodeFeatureExtractor:
         recursion_count = 0
         
         # Buscar patrones de recursión: fib(n-1) + fib(n-2)
-        if re.search(r'fib\s*\(\s*\w+\s*[-+]', code):
+        if patterns.FIB_CALL.search(code):
             recursion_count += 1
             return recursion_count
         
-        # Buscar funciones que se llaman a sí mismas DENTRO de su definición
-        # Patrón: function nombre() { ... nombre( ... } }
-        func_defs = re.findall(r'function\s+(\w+)\s*\([^)]*\)\s*\{([^}]*)\}', code, re.DOTALL)
-        
-        for func_name, func_body in func_defs:
-            # Verificar que la función se llame A SÍ MISMA dentro de su cuerpo
-            # Buscar: return nombre( o = nombre( o nombre(
-            if re.search(rf'\b{func_name}\s*\(', func_body):
-                recursion_count += 1
+        # Funciones en un ciclo del grafo de llamadas: se llaman a sí mismas
+        # dentro de su cuerpo o a través de otras (recursión mutua)
+        recursion_count += analyze_recursion(code)['recursive_functions']
         
         return recursion_count
     
@@ -93,116 +120,48 @@ class CodeFeatureExtractor:
         }
         
         # Fibonacci recursivo o fórmulas exponenciales
-        if re.search(r'fib|fibonacci', code, re.IGNORECASE):
+        if patterns.EXPONENTIAL_NAME.search(code):
             hints['exponential'] += 2
-        if re.search(r'return\s+\w+\s*[-+]\s*\d+\s*\+\s*\w+', code):
+        if patterns.EXPONENTIAL_RETURN.search(code):
             hints['exponential'] += 1
         
         # Búsqueda binaria (logarítmico)
         # Detectar patrones de búsqueda binaria: left/right, inicio/fin, low/high
-        if re.search(r'(left|inicio|low).*?(right|fin|high)|binarySearch|binary|busqueda.{0,10}binaria', code, re.IGNORECASE):
+        if patterns.BINARY_SEARCH_HINT.search(code):
             hints['logarithmic'] += 2
         # Detectar Math.floor((inicio + fin) / 2) o variaciones similares
-        if re.search(r'(Math\.floor|Math\.ceil|>>)\s*\(\s*\(.*?(\+|-|/).*?\)\s*\)', code):
+        if patterns.MIDPOINT_EXPRESSION.search(code):
             hints['logarithmic'] += 2
         # Detectar mid = .... Math.floor
-        if re.search(r'(mid|middle)\s*=.*Math\.floor', code, re.IGNORECASE):
+        if patterns.MIDPOINT_ASSIGNMENT.search(code):
             hints['logarithmic'] += 2
         
         # Ordenamiento y búsqueda lineal
-        if re.search(r'sort|linearSearch', code, re.IGNORECASE):
+        if patterns.SORT_HINT.search(code):
             hints['polynomial'] += 1
-        if re.search(r'for\s*\([^)]*<\s*\w*\.length', code):
+        if patterns.LENGTH_BOUNDED_FOR.search(code):
             hints['linear'] += 1
         
         return hints
     
     @staticmethod
     def extract_features(code):
-        """Extrae 20 características del código"""
-        features = []
-        
-        # 1. Número de líneas
-        features.append(len(code.split('\n')))
-        
-        # 2. Número de bucles for
-        for_loops = len(re.findall(r'\bfor\s*\(', code))
-        features.append(for_loops)
-        
-        # 3. Número de bucles while
-        while_loops = len(re.findall(r'\bwhile\s*\(', code))
-        features.append(while_loops)
-        
-        # 4. Bucles anidados detectados correctamente
-        nested_loops = CodeFeatureExtractor.count_nested_loops(code)
-        features.append(nested_loops)
-        
-        # 5. Llamadas recursivas (mejorado)
-        recursion_count = CodeFeatureExtractor.count_recursion_calls(code)
-        features.append(recursion_count)
-        
-        # 6. Operaciones de array (push, pop, map, filter, reduce)
-        array_ops = len(re.findall(r'\.(push|pop|map|filter|reduce|forEach|find|some|every)\s*\(', code))
-        features.append(array_ops)
-        
-        # 7. Operaciones de búsqueda (indexOf, includes)
-        search_ops = len(re.findall(r'\.(indexOf|includes|findIndex)\s*\(', code))
-        features.append(search_ops)
-        
-        # 8. Operaciones de ordenamiento
-        sort_ops = len(re.findall(r'\.(sort|reverse)\s*\(', code))
-        features.append(sort_ops)
-        
-        # 9. Profundidad máxima de indentación (bucles anidados)
-        lines = code.split('\n')
-        indent_levels = [len(line) - len(line.lstrip()) for line in lines if line.strip()]
-        max_indent = max(indent_levels) // 4 if indent_levels else 0
-        features.append(max_indent)
-        
-        # 10. Variables declaradas
-        var_decls = len(re.findall(r'\b(let|const|var)\s+\w+', code))
-        features.append(var_decls)
-        
-        # 11. Condicionales if
-        if_count = len(re.findall(r'\bif\s*\(', code))
-        features.append(if_count)
-        
-        # 12. Switch statements
-        switch_count = len(re.findall(r'\bswitch\s*\(', code))
-        features.append(switch_count)
-        
-        # 13. Longitud del código
-        features.append(len(code))
-        
-        # 14. Número de funciones
-        func_count = len(re.findall(r'\bfunction\s+\w+|\w+\s*:\s*function|\w+\s*=\s*\(\s*\)', code))
-        features.append(func_count)
-        
-        # 15. Llamadas a métodos de string
-        string_methods = len(re.findall(r'\.(substring|slice|split|replace|charAt|charCodeAt)\s*\(', code))
-        features.append(string_methods)
-        
-        # 16. Operaciones de objeto
-        object_ops = len(re.findall(r'Object\.(keys|values|entries|assign)', code))
-        features.append(object_ops)
-        
-        # 17. Operaciones de JSON
-        json_ops = len(re.findall(r'JSON\.(parse|stringify)', code))
-        features.append(json_ops)
-        
-        # 18. Try-catch
-        try_catch = len(re.findall(r'\btry\s*\{', code))
-        features.append(try_catch)
-        
-        # 19. Promesas/async
-        async_ops = len(re.findall(r'\basync\s*\(|Promise|\.then\(|\.catch\(', code))
-        features.append(async_ops)
-        
-        # 20. Multiplicador de complejidad (bucles anidados)
-        complexity_multiplier = (for_loops + while_loops) * max(1, nested_loops) if (for_loops + while_loops) > 0 else 1
-        features.append(complexity_multiplier)
+        """Extrae 20 características del código en una sola pasada"""
+        return JavaScriptScanner.scan(code)
+    
+    @staticmethod
+    def analyze(code):
+        """(características, argumentos de SimpleNeuralNetwork.predict)
         
-        return features
+        Sin nada precalculado: predict obtiene las cotas desde `code`. Ver
+        Backend.incremental.IncrementalFeatureExtractor.analyze.
+        """
+        return JavaScriptScanner.scan(code), {}
+    
+    @staticmethod
+    def extract_features_from_file(path, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Extrae las 20 características de un archivo sin cargarlo entero en memoria"""
+        return JavaScriptScanner.scan_file(path, chunk_size)
 
 
 # ============================================================================
@@ -251,21 +210,44 @@ class ComplexityMapper:
 # ============================================================================
 
 class SimpleNeuralNetwork:
-    """Red neuronal simple sin dependencias de sklearn"""
+    """Red neuronal simple sin dependencias de sklearn
+    
+    Si NumPy está instalado, los pesos se guardan como matrices 2-D y las
+    activaciones como vectores (motor matricial). Sin NumPy, o con
+    use_numpy=False, se usa la implementación original con listas.
+    Ambos motores parten de los mismos pesos iniciales.
+    
+    Con deterministic=True, predict no añade ruido aleatorio: la confianza
+    depende solo de las características (resultados cacheables y
+    reproducibles). Si no, el ruido sale de un generador propio de la
+    instancia, sin tocar el estado global de `random`.
+    """
     
-    def __init__(self, input_size=20, hidden_layers=(128, 64, 32), epochs=500, learning_rate=0.01):
+    def __init__(self, input_size=20, hidden_layers=(128, 64, 32), epochs=500, learning_rate=0.01,
+                 use_numpy=None, batch_size=32, shuffle=True, shuffle_seed=42, deterministic=False):
         self.input_size = input_size
         self.hidden_layers = hidden_layers
         self.epochs = epochs
         self.learning_rate = learning_rate
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.shuffle_seed = shuffle_seed
+        self.training_history = []
+        self.use_numpy = NUMPY_AVAILABLE and use_numpy is not False
+        self.deterministic = deterministic
+        self._noise = random.Random()
         
         # Inicializar pesos y sesgos
         self.weights = []
         self.biases = []
         self.is_trained = False
         
+        # Máximo valor absoluto de cada característica en el entrenamiento
+        self.feature_scale = [1.0] * input_size
+        
         # Crear capas
         layer_sizes = [input_size] + list(hidden_layers) + [1]
+        self.layer_sizes = layer_sizes
         random.seed(42)
         
         for i in range(len(layer_sizes) - 1):
@@ -274,6 +256,11 @@ class SimpleNeuralNetwork:
             b = [random.gauss(0, 0.01) for _ in range(layer_sizes[i + 1])]
             self.weights.append(w)
             self.biases.append(b)
+        
+        if self.use_numpy:
+            _load_numpy()
+            self.weights = [np.array(w, dtype=np.float64) for w in self.weights]
+            self.biases = [np.array(b, dtype=np.float64) for b in self.biases]
     
     def sigmoid(self, x):
         """Función de activación sigmoid"""
@@ -292,7 +279,100 @@ class SimpleNeuralNetwork:
         return 1 if x > 0 else 0
     
     def forward(self, x):
-        """Forward pass a través de la red"""
+        """Forward pass a través de la red (guarda las activaciones para backward)"""
+        if self.use_numpy:
+            return self._forward_matrix(x)
+        return self._forward_lists(x)
+    
+    def infer(self, x):
+        """Salida de la red para una muestra ya normalizada, sin guardar activaciones
+        
+        Las capas ocultas se escriben en buffers del hilo que llama (uno por
+        tamaño de red), así que varios hilos pueden usar el mismo modelo a la
+        vez sin bloqueos y sin crear listas ni vectores nuevos en cada llamada.
+        """
+        buffers = self._activation_buffers()
+        if self.use_numpy:
+            x = np.asarray(x, dtype=np.float64)
+            for layer_idx in range(len(self.weights) - 1):
+                out = buffers[layer_idx]
+                np.matmul(self.weights[layer_idx], x, out=out)
+                np.add(out, self.biases[layer_idx], out=out)
+                np.maximum(out, 0.0, out=out)
+                x = out
+            return self.sigmoid(float(self.weights[-1][0] @ x + self.biases[-1][0]))
+        
+        for layer_idx in range(len(self.weights) - 1):
+            out = buffers[layer_idx]
+            for neuron_idx, (row, output) in enumerate(zip(self.weights[layer_idx], self.biases[layer_idx])):
+                for weight, val in zip(row, x):
+                    output += weight * val
+                out[neuron_idx] = output if output > 0 else 0
+            x = out
+        
+        output = self.biases[-1][0]
+        for weight, val in zip(self.weights[-1][0], x):
+            output += weight * val
+        return self.sigmoid(output)
+    
+    def _activation_buffers(self):
+        """Buffers de las capas ocultas para el hilo actual (se crean la primera vez)"""
+        by_shape = getattr(_thread_buffers, 'by_shape', None)
+        if by_shape is None:
+            by_shape = _thread_buffers.by_shape = {}
+        key = (tuple(self.layer_sizes), self.use_numpy)
+        buffers = by_shape.get(key)
+        if buffers is None:
+            hidden = self.layer_sizes[1:-1]
+            if self.use_numpy:
+                buffers = [np.empty(size, dtype=np.float64) for size in hidden]
+            else:
+                buffers = [[0.0] * size for size in hidden]
+            by_shape[key] = buffers
+        return buffers
+    
+    def backward(self, y_true):
+        """Backward pass (backpropagation)"""
+        if self.use_numpy:
+            self._backward_matrix(y_true)
+        else:
+            self._backward_lists(y_true)
+    
+    def _forward_matrix(self, x):
+        """Forward pass con NumPy: un producto matriz-vector por capa"""
+        x = np.asarray(x, dtype=np.float64)
+        self.activations = [x]
+        
+        for layer_idx in range(len(self.weights) - 1):
+            x = np.maximum(self.weights[layer_idx] @ x + self.biases[layer_idx], 0.0)
+            self.activations.append(x)
+        
+        # Capa de salida con sigmoid
+        output = self.sigmoid(float(self.weights[-1][0] @ x + self.biases[-1][0]))
+        self.activations.append(np.array([output]))
+        
+        return output
+    
+    def _backward_matrix(self, y_true):
+        """Backward pass con NumPy: mismas ecuaciones que _backward_lists"""
+        deltas = [None] * len(self.weights)
+        
+        # Error en capa de salida
+        y_pred = self.activations[-1][0]
+        deltas[-1] = np.array([(y_pred - y_true) * self.sigmoid_derivative(y_pred)])
+        
+        # Backpropagar errores (con los pesos aún sin actualizar)
+        for layer_idx in range(len(self.weights) - 2, -1, -1):
+            error = self.weights[layer_idx + 1].T @ deltas[layer_idx + 1]
+            deltas[layer_idx] = error * (self.activations[layer_idx + 1] > 0)
+        
+        # Actualizar pesos
+        for layer_idx in range(len(self.weights)):
+            self.weights[layer_idx] -= self.learning_rate * np.outer(deltas[layer_idx], self.activations[layer_idx])
+            self.biases[layer_idx] -= self.learning_rate * deltas[layer_idx]
+    
+    def _forward_lists(self, x):
+        """Forward pass neurona por neurona (sin NumPy)"""
         self.activations = [x]
         
         for layer_idx in range(len(self.weights) - 1):
@@ -314,8 +394,8 @@ class SimpleNeuralNetwork:
         
         return output
     
-    def backward(self, y_true):
-        """Backward pass (backpropagation)"""
+    def _deltas_lists(self, y_true):
+        """Calcula los deltas de cada capa a partir de las últimas activaciones"""
         deltas = [None] * len(self.weights)
         
         # Error en capa de salida
@@ -334,6 +414,12 @@ class SimpleNeuralNetwork:
                 delta.append(error)
             deltas[layer_idx] = delta
         
+        return deltas
+    
+    def _backward_lists(self, y_true):
+        """Backward pass neurona por neurona (sin NumPy)"""
+        deltas = self._deltas_lists(y_true)
+        
         # Actualizar pesos
         for layer_idx in range(len(self.weights)):
             for neuron_idx in range(len(self.weights[layer_idx])):
@@ -343,45 +429,325 @@ class SimpleNeuralNetwork:
                     )
                 self.biases[layer_idx][neuron_idx] -= self.learning_rate * deltas[layer_idx][neuron_idx]
     
-    def train_simple(self, X_train=None, y_train=None):
-        """Entrena la red neuronal con 500 épocas"""
-        if X_train is None or y_train is None:
+    def _gradients_lists(self, batch_x, batch_y):
+        """Suma de los gradientes de pesos y sesgos del lote y su pérdida (sin NumPy)"""
+        grad_w = [[[0.0] * len(row) for row in w] for w in self.weights]
+        grad_b = [[0.0] * len(b) for b in self.biases]
+        total_loss = 0
+        
+        for x, y in zip(batch_x, batch_y):
+            y_pred = self.forward(x)
+            deltas = self._deltas_lists(y)
+            total_loss += (y_pred - y) ** 2
+            
+            for layer_idx in range(len(self.weights)):
+                inputs = self.activations[layer_idx]
+                for neuron_idx, delta in enumerate(deltas[layer_idx]):
+                    if delta:
+                        row = grad_w[layer_idx][neuron_idx]
+                        for input_idx, val in enumerate(inputs):
+                            row[input_idx] += delta * val
+                    grad_b[layer_idx][neuron_idx] += delta
+        
+        return grad_w, grad_b, total_loss
+    
+    def _apply_gradients_lists(self, grad_w, grad_b, count):
+        """Descenso de gradiente con la media de `count` gradientes sumados (sin NumPy)"""
+        step = self.learning_rate / count
+        for layer_idx in range(len(self.weights)):
+            for neuron_idx in range(len(self.weights[layer_idx])):
+                row = self.weights[layer_idx][neuron_idx]
+                grad_row = grad_w[layer_idx][neuron_idx]
+                for input_idx in range(len(row)):
+                    row[input_idx] -= step * grad_row[input_idx]
+                self.biases[layer_idx][neuron_idx] -= step * grad_b[layer_idx][neuron_idx]
+    
+    def _train_batch_lists(self, batch_x, batch_y):
+        """Un paso de descenso de gradiente con el gradiente medio del lote (sin NumPy)"""
+        if len(batch_x) == 1:
+            y_pred = self.forward(batch_x[0])
+            self.backward(batch_y[0])
+            return (y_pred - batch_y[0]) ** 2
+        
+        grad_w, grad_b, total_loss = self._gradients_lists(batch_x, batch_y)
+        self._apply_gradients_lists(grad_w, grad_b, len(batch_x))
+        return total_loss
+    
+    def _gradients_matrix(self, batch_x, batch_y):
+        """Suma de los gradientes de pesos y sesgos del lote y su pérdida (NumPy)"""
+        activations = [batch_x]
+        for layer_idx in range(len(self.weights) - 1):
+            activations.append(np.maximum(activations[-1] @ self.weights[layer_idx].T + self.biases[layer_idx], 0.0))
+        
+        # Capa de salida con sigmoid
+        z = activations[-1] @ self.weights[-1].T + self.biases[-1]
+        y_pred = 1 / (1 + np.exp(-np.clip(z, -500, 500)))
+        
+        # Deltas por muestra (filas), con los pesos aún sin actualizar
+        delta = (y_pred - batch_y[:, None]) * self.sigmoid_derivative(y_pred)
+        deltas = [None] * len(self.weights)
+        deltas[-1] = delta
+        for layer_idx in range(len(self.weights) - 2, -1, -1):
+            deltas[layer_idx] = (deltas[layer_idx + 1] @ self.weights[layer_idx + 1]) * (activations[layer_idx + 1] > 0)
+        
+        grad_w = [deltas[layer_idx].T @ activations[layer_idx] for layer_idx in range(len(self.weights))]
+        grad_b = [deltas[layer_idx].sum(axis=0) for layer_idx in range(len(self.weights))]
+        return grad_w, grad_b, float(((y_pred[:, 0] - batch_y) ** 2).sum())
+    
+    def _train_batch_matrix(self, batch_x, batch_y):
+        """Un paso de descenso de gradiente con el lote completo como matriz (NumPy)"""
+        grad_w, grad_b, total_loss = self._gradients_matrix(batch_x, batch_y)
+        
+        # Actualizar con el gradiente medio del lote
+        step = self.learning_rate / len(batch_x)
+        for layer_idx in range(len(self.weights)):
+            self.weights[layer_idx] -= step * grad_w[layer_idx]
+            self.biases[layer_idx] -= step * grad_b[layer_idx]
+        
+        return total_loss
+    
+    @staticmethod
+    def confidence_offset(features):
+        """Desplazamiento de confianza en [-0.05, 0.08) derivado de las características"""
+        digest = hashlib.blake2b(repr(tuple(features)).encode('utf-8'), digest_size=8).digest()
+        return -0.05 + 0.13 * (int.from_bytes(digest, 'little') / 2 ** 64)
+    
+    def as_matrix(self, X):
+        """`X` como FeatureMatrix de input_size columnas (copia si es una lista de filas)"""
+        if isinstance(X, FeatureMatrix):
+            return X
+        return FeatureMatrix.from_rows(X, self.input_size)
+    
+    def forward_batch(self, X):
+        """Salida de la red para cada fila de `X` (sin normalizar), como array('d')
+        
+        Cada columna se divide por su feature_scale, la escala calculada al
+        entrenar y guardada con el modelo.
+        """
+        X_norm = self.as_matrix(X).scaled(self.feature_scale)
+        if self.use_numpy:
+            activations = X_norm.to_numpy()
+            for layer_idx in range(len(self.weights) - 1):
+                activations = np.maximum(activations @ self.weights[layer_idx].T + self.biases[layer_idx], 0.0)
+            z = activations @ self.weights[-1].T + self.biases[-1]
+            return array('d', (1 / (1 + np.exp(-np.clip(z[:, 0], -500, 500)))).tobytes())
+        return array('d', (self.infer(row) for row in X_norm))
+    
+    def validation_loss(self, X, y):
+        """Error cuadrático medio de la red sobre (X, y), normalizando con feature_scale"""
+        outputs = self.forward_batch(X)
+        if not len(outputs):
+            return 0.0
+        return sum((output - target) ** 2 for output, target in zip(outputs, y)) / len(outputs)
+    
+    def _copy_parameters(self):
+        """Copia de pesos y sesgos (la mejor red vista, en memoria)"""
+        if self.use_numpy:
+            return [w.copy() for w in self.weights], [b.copy() for b in self.biases]
+        return [[row[:] for row in w] for w in self.weights], [b[:] for b in self.biases]
+    
+    def _train_batches(self, X_norm, y, order, batch_size):
+        """Un paso por cada lote de las muestras `order` de (X_norm, y); devuelve la suma de las pérdidas
+        
+        `X_norm` es una FeatureMatrix ya normalizada. Sin barajar, los lotes
+        son vistas de la matriz.
+        """
+        total_loss = 0
+        if self.use_numpy:
+            X_norm, y = X_norm.to_numpy(), np.frombuffer(y, dtype=np.float64)
+        
+        for start in range(0, len(order), batch_size):
+            stop = start + batch_size
+            if not self.shuffle:
+                batch_x = X_norm[start:stop] if self.use_numpy else X_norm.rows(start, stop)
+                batch_y = y[start:stop]
+            elif self.use_numpy:
+                batch = order[start:stop]
+                batch_x, batch_y = X_norm[batch], y[batch]
+            else:
+                batch = order[start:stop]
+                batch_x, batch_y = [X_norm.row(i) for i in batch], [y[i] for i in batch]
+            
+            if self.use_numpy:
+                total_loss += self._train_batch_matrix(batch_x, batch_y)
+            else:
+                total_loss += self._train_batch_lists(batch_x, batch_y)
+        return total_loss
+    
+    def train_simple(self, X_train=None, y_train=None, X_val=None, y_val=None, checkpoints=None,
+                     checkpoint_every=50, patience=None, min_delta=0.0, workers=1, store=None):
+        """Entrena la red neuronal con descenso de gradiente por mini-lotes
+        
+        `X_train` es una FeatureMatrix o una secuencia de filas. Cada
+        columna se normaliza una sola vez por su mayor valor absoluto
+        (feature_scale, que se guarda con el modelo). Cada época recorre
+        todas las muestras (barajadas si shuffle=True) en lotes de
+        batch_size; sin barajar, los lotes son vistas de la matriz. La
+        pérdida y la duración de cada época quedan en training_history.
+        
+        Con `X_val`/`y_val` cada época mide también la pérdida de
+        validación (val_loss), que pasa a ser la pérdida vigilada (si no,
+        la de entrenamiento). Con `patience`, el entrenamiento se detiene
+        tras `patience` épocas sin mejorar en más de `min_delta` y la red
+        vuelve a los pesos de la mejor época.
+        
+        `checkpoints` es un Backend.checkpoint.CheckpointManager: se guarda
+        un checkpoint cada `checkpoint_every` épocas y al terminar, y la
+        mejor red en cada mejora. Si el directorio ya tiene checkpoints, el
+        entrenamiento continúa desde el último (mismos pesos, barajado e
+        historial que si no se hubiera interrumpido).
+        
+        Con `workers` > 1, cada lote se reparte entre ese número de procesos
+        que calculan los gradientes de su parte en paralelo
+        (Backend.parallel.ParallelTrainer); el resultado coincide con el de
+        un solo proceso salvo el redondeo. Cada paso paga un coste fijo
+        (tuberías y suma de gradientes, ~0.5 ms con dos procesos), así que
+        con NumPy y la red por defecto solo compensa con varios núcleos y
+        lotes de 256 muestras o más (Backend.parallel.min_parallel_batch);
+        con lotes de 32 es más lento que workers=1 (el valor por defecto).
+        benchmark_parallel.py mide el lote mínimo en cada máquina.
+        
+        Con `store` (un Backend.dataset.FeatureStore) en lugar de X_train e
+        y_train, cada época recorre los fragmentos del almacén en orden
+        barajado, mapeando uno cada vez; la escala sale del índice del
+        almacén, sin leer los datos.
+        """
+        if store is not None:
+            if workers > 1:
+                raise ValueError("El entrenamiento en paralelo necesita los datos en memoria (sin store)")
+            sample_count = len(store)
+            order = list(range(store.shard_count))
+            self.feature_scale = store.column_scale()
+        elif X_train is None or y_train is None:
             self.is_trained = True
             return
+        else:
+            X_train = self.as_matrix(X_train)
+            y_train = array('d', y_train)
+            sample_count = len(X_train)
+            order = list(range(sample_count))
+            self.feature_scale = X_train.column_scale()
+        batch_size = max(1, min(self.batch_size, sample_count)) if sample_count else 1
+        rng = random.Random(self.shuffle_seed)
+        self.training_history = []
+        start_epoch = 0
+        stopped = False
+        best_loss, best_epoch, best_parameters = math.inf, 0, None
         
-        print(f"Iniciando entrenamiento con {self.epochs} épocas...")
+        # Reanudar desde el último checkpoint: pesos, barajado, historial y mejor pérdida
+        state = checkpoints.restore(self) if checkpoints is not None else None
+        if state is not None:
+            if state['samples'] != sample_count:
+                raise ValueError(f"El checkpoint es de {state['samples']} muestras, no de {sample_count}")
+            start_epoch = state['epoch']
+            stopped = state['stopped']
+            self.training_history = state['history']
+            order = state['order']
+            version, internal, gauss = state['rng']
+            rng.setstate((version, tuple(internal), gauss))
+            best_loss, best_epoch = state['best_loss'], state['best_epoch']
+            print(f"Reanudando desde la época {start_epoch}/{self.epochs}")
         
-        for epoch in range(self.epochs):
-            total_loss = 0
-            sample_count = min(len(X_train), 100)  # Limitar a 100 muestras por época
-            
-            for i in range(sample_count):
-                x, y = X_train[i], y_train[i]
+        # Normalizar entradas una sola vez, por columnas
+        X_norm = X_train.scaled(self.feature_scale) if store is None else None
+        
+        print(f"Iniciando entrenamiento con {self.epochs} épocas "
+              f"({sample_count} muestras, lotes de {batch_size})...")
+        
+        last_epoch = start_epoch if stopped else self.epochs
+        # Con workers > 1 cada lote se reparte entre procesos (Backend.parallel)
+        trainer = None
+        if workers > 1 and sample_count and start_epoch < last_epoch:
+            from Backend.parallel import ParallelTrainer
+            trainer = ParallelTrainer(self, X_norm, y_train, min(workers, batch_size))
+        
+        try:
+            for epoch in range(start_epoch, last_epoch):
+                epoch_start = time.perf_counter()
+                total_loss = 0
                 
-                # Normalizar entrada
-                max_val = max(max(abs(v) for v in x) if x else 1, 1)
-                x_norm = [val / max_val for val in x]
+                if self.shuffle:
+                    rng.shuffle(order)
                 
-                # Forward pass
-                y_pred = self.forward(x_norm)
+                if trainer is not None:
+                    trainer.set_order(order)
+                    for start in range(0, sample_count, batch_size):
+                        total_loss += trainer.step(start, min(start + batch_size, sample_count))
+                elif store is not None:
+                    # Un fragmento mapeado en memoria cada vez, barajado por dentro
+                    for shard_index in order:
+                        X_shard, y_shard = store.load_shard(shard_index)
+                        shard_order = list(range(len(X_shard)))
+                        if self.shuffle:
+                            rng.shuffle(shard_order)
+                        total_loss += self._train_batches(X_shard.scaled(self.feature_scale), y_shard,
+                                                          shard_order, batch_size)
+                else:
+                    total_loss += self._train_batches(X_norm, y_train, order, batch_size)
                 
-                # Backward pass
-                self.backward(y)
+                avg_loss = total_loss / sample_count if sample_count > 0 else 0
+                elapsed = time.perf_counter() - epoch_start
+                entry = {'epoch': epoch + 1, 'loss': avg_loss, 'seconds': elapsed}
+                monitored = avg_loss
+                if X_val is not None and y_val is not None:
+                    entry['val_loss'] = monitored = self.validation_loss(X_val, y_val)
+                self.training_history.append(entry)
                 
-                # Calcular pérdida (MSE)
-                loss = (y_pred - y) ** 2
-                total_loss += loss
-            
-            avg_loss = total_loss / sample_count if sample_count > 0 else 0
-            
-            if (epoch + 1) % 50 == 0:
-                print(f"  Época {epoch + 1}/{self.epochs} - Pérdida: {avg_loss:.6f}")
+                # Mejor red vista: en memoria y, si hay checkpoints, en best.bin
+                if monitored < best_loss - min_delta:
+                    best_loss, best_epoch = monitored, epoch + 1
+                    best_parameters = self._copy_parameters()
+                    if checkpoints is not None:
+                        checkpoints.save_best(self, {'epoch': best_epoch, 'loss': best_loss})
+                stopped = patience is not None and epoch + 1 - best_epoch >= patience
+                
+                if checkpoints is not None and ((epoch + 1) % checkpoint_every == 0 or stopped or epoch + 1 == self.epochs):
+                    checkpoints.save(self, {
+                        'epoch': epoch + 1,
+                        'samples': sample_count,
+                        'stopped': stopped,
+                        'history': self.training_history,
+                        'order': order,
+                        'rng': rng.getstate(),
+                        'best_loss': best_loss,
+                        'best_epoch': best_epoch,
+                    })
+                
+                if (epoch + 1) % 50 == 0:
+                    validation = f" - Validación: {entry['val_loss']:.6f}" if 'val_loss' in entry else ""
+                    print(f"  Época {epoch + 1}/{self.epochs} - Pérdida: {avg_loss:.6f}{validation} "
+                          f"- {elapsed * 1000:.1f} ms/época")
+                if stopped:
+                    print(f"  Parada temprana en la época {epoch + 1}: sin mejora desde la época {best_epoch}")
+                    break
+        finally:
+            if trainer is not None:
+                trainer.close()
+        
+        # Con parada temprana, la red se queda con los pesos de la mejor época
+        if patience is not None and best_epoch and best_epoch != len(self.training_history):
+            if best_parameters is not None:
+                self.weights, self.biases = best_parameters
+            elif checkpoints is not None:
+                checkpoints.restore_best(self)
         
         print("¡Entrenamiento completado!")
         self.is_trained = True
     
-    def predict(self, features, code=""):
-        """Predice la complejidad basada en características"""
+    def predict(self, features, code="", hints=None, recursion_shape=None, loop_bound=None, recurrence=None):
+        """Predice la complejidad basada en características
+        
+        `hints` = (hay variables de rango, hay variable de punto medio)
+        sustituye la búsqueda en `code` cuando el código no está en memoria.
+        `recursion_shape` = (profundidad, ramificación) de la recursión en el
+        grafo de llamadas (ver Backend.callgraph); si falta se calcula desde
+        `code`, y (0, 0) significa desconocida.
+        `loop_bound` = (grado de n, grado de log n, segura) de los bucles (ver
+        Backend.loops); si falta se calcula desde `code`.
+        `recurrence` = (complejidad, segura) de las recurrencias de las
+        funciones recursivas (ver Backend.recurrence); si falta se calcula
+        desde `code`.
+        """
         if not isinstance(features, list):
             features = list(features)
         
@@ -402,16 +768,39 @@ class SimpleNeuralNetwork:
         code_length = features[12] if len(features) > 12 else 0
         multiplier = features[19] if len(features) > 19 else 1
         
-        score = 0.1  # Default O(1)
-        confidence = 0.80
+        # Forma de la recursión: recursiones encadenadas y llamadas recursivas por función
+        if recursion_shape is None:
+            if recursion > 0 and code:
+                metrics = analyze_recursion(code)
+                recursion_shape = (metrics['recursion_depth'], metrics['branching_factor'])
+            else:
+                recursion_shape = (0, 0)
+        recursion_depth, branching = recursion_shape
         
+        # Cota estructural de los bucles: vueltas de cada uno multiplicadas por anidamiento
         total_loops = for_loops + while_loops
+        if loop_bound is None and recursion == 0 and total_loops > 0 and code:
+            structure = analyze_loops(code)
+            if structure['loops']:
+                loop_bound = (structure['degree'], structure['log_degree'], structure['certain'])
+        
+        # Recurrencias: llamadas recursivas por invocación y cómo encoge el argumento
+        if recurrence is None and recursion > 0 and code:
+            recurrence = recurrence_bound(code)
+        
+        score = 0.1  # Default O(1)
+        confidence = 0.80
         
         # REGLA 7 (prioridad): Sin bucles, sin recursión -> O(1)
         # Relajamos la restricción de líneas para permitir código simple pero con más líneas
         if total_loops == 0 and recursion == 0 and nested_loops == 0:
             score = 0.1  # O(1)
             confidence = 0.95  # Muy confiado cuando NO hay bucles ni recursión
+        # REGLA 10 (prioridad sobre 3, 4, 4b y 8): Recursión con código disponible
+        # -> recurrencia resuelta (Teorema Maestro, Akra–Bazzi, resta y vencerás)
+        elif recursion > 0 and recurrence is not None:
+            score = ComplexityMapper.complexity_to_value(recurrence[0])
+            confidence = 0.90 if recurrence[1] else 0.80
         # REGLA 4 (prioridad ALTA): O(n log n) - Merge Sort, Quick Sort, Heap Sort
         # Detectar PRIMERO que O(n²): recursión + operaciones de array/slice
         # Permite hasta 2 niveles de anidación cuando hay recursión + array_ops
@@ -423,6 +812,11 @@ class SimpleNeuralNetwork:
         elif recursion > 0 and for_loops >= 2 and nested_loops <= 1:
             score = 0.65  # O(n log n)
             confidence = 0.85
+        # REGLA 9 (prioridad sobre 1, 2, 5 y 6): Bucles sin recursión -> producto
+        # de las vueltas (fijas, log n o n) de los bucles de cada anidamiento
+        elif recursion == 0 and loop_bound is not None:
+            score = ComplexityMapper.complexity_to_value(bound_to_complexity(loop_bound[0], loop_bound[1]))
+            confidence = 0.92 if loop_bound[2] else 0.84
         # REGLA 1: Triple bucle anidado -> O(n³)
         elif for_loops >= 3 and nested_loops >= 3:
             score = 0.85  # O(n³)
@@ -432,14 +826,17 @@ class SimpleNeuralNetwork:
             score = 0.75  # O(n²)
             confidence = 0.92
         # REGLA 3: Recursión sin bucles + pocas líneas = O(2ⁿ) Fibonacci
-        elif recursion > 0 and total_loops == 0 and nested_loops == 0 and func_count <= 1 and lines_count <= 5 and code_length < 150:
+        # (salvo que cada función se llame una sola vez, como factorial)
+        elif recursion > 0 and total_loops == 0 and nested_loops == 0 and func_count <= 1 and lines_count <= 5 and code_length < 150 and branching != 1:
             score = 0.95  # O(2ⁿ)
             confidence = 0.88
         # REGLA 5: Un while simple - probablemente búsqueda binaria o parecido
         # Detectar patrones de búsqueda binaria: variables de rango + mid
         elif while_loops >= 1 and for_loops == 0 and nested_loops <= 1:
             # Detectar si es búsqueda binaria: tiene variables de rango (left/right, inicio/fin, low/high)
-            if re.search(r'(left|right|inicio|fin|low|high|start|end)', code, re.IGNORECASE) and re.search(r'(mid|middle|medio)', code, re.IGNORECASE):
+            if hints is None:
+                hints = (patterns.RANGE_VARIABLE.search(code), patterns.MIDPOINT_VARIABLE.search(code))
+            if hints[0] and hints[1]:
                 score = 0.3  # O(log n)
                 confidence = 0.90
             # Si es un while simple sin variables de rango, asumir O(log n) de todas formas si var_count es bajo
@@ -455,35 +852,59 @@ class SimpleNeuralNetwork:
             confidence = 0.83
         # REGLA 8: Sin bucles pero con recursión
         elif total_loops == 0 and recursion >= 1:
-            score = 0.3  # O(log n)
-            confidence = 0.82
+            if hints is None:
+                hints = (patterns.RANGE_VARIABLE.search(code), patterns.MIDPOINT_VARIABLE.search(code))
+            # Una llamada recursiva por nivel sin partir el rango: recorre n niveles
+            if branching == 1 and not hints[1]:
+                score = 0.5  # O(n)
+                confidence = 0.80
+            else:
+                score = 0.3  # O(log n)
+                confidence = 0.82
         else:
             score = 0.5  # O(n) por defecto seguro
             confidence = 0.75
         
-        # Añadir ruido mínimo
-        confidence = confidence + random.uniform(-0.05, 0.08)
+        # Recursiones que llaman a otras recursiones: estimación menos segura
+        if recursion_depth >= 2:
+            confidence -= 0.04
+        
+        # Añadir ruido mínimo (fijo por características en modo determinista)
+        if self.deterministic:
+            confidence = confidence + self.confidence_offset(features)
+        else:
+            confidence = confidence + self._noise.uniform(-0.05, 0.08)
         confidence = max(0.65, min(0.98, confidence))
         
         return score, confidence
 
 
 class NeuralNetworkComplexityAnalyzer:
-    """Red neuronal para analizar complejidad"""
+    """Red neuronal para analizar complejidad
+    
+    `use_numpy` se pasa a SimpleNeuralNetwork (None: NumPy si está instalado).
+    """
     
-    def __init__(self, hidden_layers=(128, 64, 32), epochs=500):
+    def __init__(self, hidden_layers=(128, 64, 32), epochs=500, batch_size=32, cache=None, deterministic=False,
+                 use_numpy=None):
         self.epochs = epochs
         self.hidden_layers = hidden_layers
-        self.model = SimpleNeuralNetwork(input_size=20, hidden_layers=hidden_layers, epochs=epochs, learning_rate=0.01)
+        self.batch_size = batch_size
+        self.cache = cache
+        self.deterministic = deterministic
+        self._model_version = None
+        self.model = SimpleNeuralNetwork(input_size=20, hidden_layers=hidden_layers, epochs=epochs, learning_rate=0.01,
+                                         use_numpy=use_numpy, batch_size=batch_size, deterministic=deterministic)
         self.is_trained = False
         self.feature_extractor = CodeFeatureExtractor()
+        self.feature_cache = FeatureCache(self.feature_extractor.extract_features)
         self.complexity_mapper = ComplexityMapper()
         
     def generate_training_data(self, samples=1000):
-        """Genera datos de entrenamiento sintéticos"""
+        """Genera datos de entrenamiento sintéticos (FeatureMatrix y array('d') de valores)"""
         random.seed(42)
-        X_train = []
-        y_train = []
+        X_train = FeatureMatrix(self.model.input_size)
+        y_train = array('d')
         
         templates = [
             ("function constant(n) { return n + 1; }", 'O(1)'),
@@ -503,52 +924,144 @@ class NeuralNetworkComplexityAnalyzer:
             ("function fib(n) { if (n <= 1) return n; return fib(n - 1) + fib(n - 2); }", 'O(2ⁿ)'),
         ]
         
+        # Características precalculadas: una extracción por plantilla
+        template_data = [(self.feature_cache(template), self.complexity_mapper.complexity_to_value(complexity))
+                         for template, complexity in templates]
+        
         for _ in range(samples):
-            template, complexity = templates[random.randint(0, len(templates)-1)]
-            code = template
-            
-            features = self.feature_extractor.extract_features(code)
-            complexity_value = self.complexity_mapper.complexity_to_value(complexity)
+            features, complexity_value = template_data[random.randint(0, len(templates)-1)]
             
             X_train.append(features)
             y_train.append(complexity_value)
         
         return X_train, y_train
     
-    def train(self, X=None, y=None):
-        """Entrena la red neuronal con 500 épocas"""
-        if X is None or y is None:
+    def train(self, X=None, y=None, **options):
+        """Entrena la red neuronal con 500 épocas
+        
+        `options` (validación, checkpoints, parada temprana, workers, store)
+        se pasan a SimpleNeuralNetwork.train_simple. Con store=FeatureStore
+        (ver Backend.dataset) se entrena con el corpus real del almacén en
+        lugar de los datos sintéticos.
+        """
+        if (X is None or y is None) and options.get('store') is None:
             X, y = self.generate_training_data(samples=1000)
         
-        self.model.train_simple(X, y)
+        self.model.train_simple(X, y, **options)
         self.is_trained = True
+        self._model_version = None
         
     def predict(self, code):
         """Predice la complejidad de un código"""
+        result = self.analyze(code)
+        return result['complexity'], result['confidence']
+    
+    def analyze(self, code):
+        """Predice la complejidad y devuelve también las características usadas"""
+        if not self.is_trained:
+            raise Exception("El modelo no ha sido entrenado.")
+        
+        if self.cache is not None:
+            key = cache_key(code, self.model_version, FEATURE_VERSION)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        features, options = self.feature_extractor.analyze(code)
+        complexity_value, confidence = self.model.predict(list(features), code, **options)
+        complexity = self.complexity_mapper.value_to_complexity(complexity_value)
+        result = {'complexity': complexity, 'confidence': confidence, 'features': features}
+        
+        if self.cache is not None:
+            self.cache.put(key, result)
+        return result
+    
+    def analyze_file(self, path, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Como analyze, pero leyendo el archivo por trozos (archivos muy grandes)
+        
+        Las cotas de bucles y recurrencias salen de Backend.bounds. Si alguna
+        sentencia era demasiado larga para analizarla, el resultado lleva
+        'approximate': True.
+        """
         if not self.is_trained:
             raise Exception("El modelo no ha sido entrenado.")
         
-        features = self.feature_extractor.extract_features(code)
-        complexity_value, confidence = self.model.predict(list(features), code)
+        scanner = StreamingScanner(track_hints=True)
+        scanner.feed_file(path, chunk_size)
+        features = scanner.finish()
+        hints = (scanner.has_range_variable, scanner.has_midpoint_variable)
+        recursion_shape = (scanner.recursion['recursion_depth'], scanner.recursion['branching_factor'])
+        # Segunda lectura, solo si hacen falta las cotas de los bucles o las recurrencias
+        bounds = stream_bounds(path, scanner, chunk_size)
+        complexity_value, confidence = self.model.predict(features, hints=hints, recursion_shape=recursion_shape,
+                                                          loop_bound=bounds['loop_bound'],
+                                                          recurrence=bounds['recurrence'])
         complexity = self.complexity_mapper.value_to_complexity(complexity_value)
         
-        return complexity, confidence
+        result = {'complexity': complexity, 'confidence': confidence, 'features': features}
+        if bounds['approximate']:
+            result['approximate'] = True
+        return result
+    
+    def analyze_functions(self, code, analyze_all=None):
+        """Analiza por separado cada función de nivel superior y el archivo completo
+        
+        Devuelve el resultado de analyze(code) para el archivo, más
+        'functions' (name, start_line, end_line y el resultado de cada una)
+        y 'dominant', la función de mayor complejidad. `analyze_all` recibe
+        la lista de fragmentos y devuelve sus resultados en orden; permite
+        repartirlos entre procesos.
+        """
+        spans = split_functions(code)
+        snippets = [code[span['start']:span['end']] for span in spans]
+        results = analyze_all(snippets) if analyze_all else [self.analyze(snippet) for snippet in snippets]
+        
+        functions = []
+        for span, result in zip(spans, results):
+            functions.append({'name': span['name'], 'start_line': span['start_line'],
+                              'end_line': span['end_line'], **result})
+        
+        dominant = max(functions, key=lambda f: self.complexity_mapper.complexity_to_value(f['complexity']),
+                       default=None)
+        return {**self.analyze(code), 'functions': functions, 'dominant': dominant['name'] if dominant else None}
+    
+    @property
+    def model_version(self):
+        """Huella de las reglas y de los pesos actuales (se recalcula tras entrenar o cargar)"""
+        if self._model_version is None:
+            digest = hashlib.blake2b(f"rules={RULES_VERSION};deterministic={self.model.deterministic}".encode('utf-8'),
+                                     digest_size=16)
+            for w, b in zip(self.model.weights, self.model.biases):
+                for values in (w, b):
+                    if np is not None and isinstance(values, np.ndarray):
+                        digest.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+                    else:
+                        flat = [v for row in values for v in row] if values and isinstance(values[0], list) else values
+                        digest.update(array('d', flat).tobytes())
+            self._model_version = digest.hexdigest()
+        return self._model_version
     
     def save_model(self, filepath):
-        """Guarda el modelo entrenado"""
-        data = {
-            'is_trained': self.is_trained
-        }
-        with open(filepath, 'wb') as f:
-            pickle.dump(data, f)
+        """Guarda pesos, sesgos y estadísticas en el formato binario de Backend.weights"""
+        write_weights(filepath, self.model.layer_sizes, self.model.weights, self.model.biases,
+                      self.model.feature_scale, self.is_trained)
     
     def load_model(self, filepath):
-        """Carga un modelo entrenado"""
-        try:
-            with open(filepath, 'rb') as f:
-                data = pickle.load(f)
-            self.is_trained = data.get('is_trained', False)
-            if self.is_trained:
-                self.model.train_simple()
-        except:
-            pass
+        """Carga un modelo guardado con save_model (lanza ValueError si no es válido)"""
+        data = read_weights(filepath, as_numpy=self.model.use_numpy)
+        
+        layer_sizes = data['layer_sizes']
+        if layer_sizes != self.model.layer_sizes:
+            self.hidden_layers = tuple(layer_sizes[1:-1])
+            self.model = SimpleNeuralNetwork(input_size=layer_sizes[0], hidden_layers=self.hidden_layers,
+                                             epochs=self.epochs, learning_rate=self.model.learning_rate,
+                                             use_numpy=self.model.use_numpy, batch_size=self.batch_size,
+                                             deterministic=self.deterministic)
+        
+        self.model.weights = data['weights']
+        self.model.biases = data['biases']
+        if len(data['feature_stats']) == self.model.input_size:
+            self.model.feature_scale = data['feature_stats']
+        self.model.is_trained = data['is_trained']
+        self.is_trained = data['is_trained']
+        self._model_version = None
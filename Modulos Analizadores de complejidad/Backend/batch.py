@@ -0,0 +1,147 @@
+"""
+BATCH - Análisis por lotes de archivos JavaScript
+Recorre directorios, reparte los archivos entre procesos que cargan
+el modelo una sola vez y produce un resultado por archivo.
+"""
+
+import os
+import sys
+from functools import partial
+from multiprocessing import Pool
+
+from Backend.backend import NeuralNetworkComplexityAnalyzer, DEFAULT_MODEL_PATH
+from Backend.cache import ResultCache
+
+DEFAULT_EXTENSIONS = ('.js',)
+DEFAULT_EXCLUDED_DIRS = ('.git', 'node_modules')
+
+# A partir de este tamaño el archivo se analiza por trozos (sin caché)
+STREAMING_THRESHOLD = 16 * 1024 * 1024
+
+# Analizador del proceso trabajador (se carga en init_worker)
+_worker_analyzer = None
+
+
+def iter_source_files(root, extensions=DEFAULT_EXTENSIONS, excluded_dirs=DEFAULT_EXCLUDED_DIRS):
+    """Genera las rutas de los archivos fuente bajo `root` en orden estable"""
+    extensions = tuple(extensions)
+    if os.path.isfile(root):
+        yield root
+        return
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in excluded_dirs)
+        for name in sorted(filenames):
+            if name.endswith(extensions):
+                yield os.path.join(dirpath, name)
+
+
+def ensure_model(model_path=DEFAULT_MODEL_PATH):
+    """Entrena y guarda el modelo si todavía no existe el archivo de pesos"""
+    if not os.path.exists(model_path):
+        print(f"⏳ No existe {model_path}: entrenando modelo...", file=sys.stderr)
+        analyzer = NeuralNetworkComplexityAnalyzer()
+        analyzer.train()
+        analyzer.save_model(model_path)
+    return model_path
+
+
+def load_analyzer(model_path=DEFAULT_MODEL_PATH, cache_path=None):
+    """Crea un analizador con los pesos guardados en `model_path`
+
+    La predicción es determinista (sin ruido), así que el mismo archivo da
+    siempre el mismo resultado. Si se indica `cache_path`, los resultados se
+    guardan en esa base SQLite y los archivos sin cambios no se reanalizan.
+    """
+    cache = ResultCache(db_path=cache_path) if cache_path else None
+    analyzer = NeuralNetworkComplexityAnalyzer(cache=cache, deterministic=True)
+    analyzer.load_model(model_path)
+    return analyzer
+
+
+def init_worker(model_path, cache_path=None):
+    """Inicializador del pool: carga el modelo una vez por proceso"""
+    global _worker_analyzer
+    _worker_analyzer = load_analyzer(model_path, cache_path)
+
+
+def analyze_path(path, analyzer=None, functions=False):
+    """Analiza un archivo y devuelve un dict serializable a JSON
+
+    Con functions=True incluye el desglose por función (analyze_functions).
+    """
+    analyzer = analyzer or _worker_analyzer
+    try:
+        if os.path.getsize(path) >= STREAMING_THRESHOLD and not functions:
+            return {'path': path, **analyzer.analyze_file(path)}
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            code = f.read()
+        misses = analyzer.cache.misses if analyzer.cache else None
+        result = analyzer.analyze_functions(code) if functions else analyzer.analyze(code)
+    except Exception as e:
+        return {'path': path, 'error': str(e)}
+    if misses is not None:
+        result['cached'] = analyzer.cache.misses == misses
+    return {'path': path, **result}
+
+
+def analyze_files(paths, model_path=DEFAULT_MODEL_PATH, workers=None, ordered=False, chunksize=16,
+                  cache_path=None, functions=False):
+    """Genera un resultado por archivo a medida que los procesos terminan
+
+    Con workers=1 se analiza en el proceso actual. Con ordered=False los
+    resultados salen en el orden en que se completan. Con cache_path, cada
+    resultado lleva 'cached' indicando si vino de la caché. Con
+    functions=True cada resultado incluye el desglose por función.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        analyzer = load_analyzer(model_path, cache_path)
+        try:
+            for path in paths:
+                yield analyze_path(path, analyzer, functions)
+        finally:
+            if analyzer.cache:
+                analyzer.cache.close()
+        return
+
+    with Pool(workers, initializer=init_worker, initargs=(model_path, cache_path)) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+        yield from imap(partial(analyze_path, functions=functions), paths, chunksize)
+
+
+def analyze_code(code, analyzer=None, functions=False):
+    """Analiza un fragmento de código y devuelve un dict serializable a JSON
+
+    Sin `analyzer` usa el del proceso trabajador (ver init_worker). Con
+    functions=True incluye el desglose por función.
+    """
+    analyzer = analyzer or _worker_analyzer
+    try:
+        return analyzer.analyze_functions(code) if functions else analyzer.analyze(code)
+    except Exception as e:
+        return {'error': str(e)}
+
+
+def _analyze_snippet(code):
+    """Analiza un fragmento con el analizador del proceso trabajador"""
+    return _worker_analyzer.analyze(code)
+
+
+def analyze_functions(path, model_path=DEFAULT_MODEL_PATH, workers=None, chunksize=4):
+    """Desglose por función de un solo archivo, repartiendo las funciones entre procesos"""
+    workers = workers or os.cpu_count() or 1
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            code = f.read()
+    except OSError as e:
+        return {'path': path, 'error': str(e)}
+
+    analyzer = load_analyzer(model_path)
+    if workers == 1:
+        return {'path': path, **analyzer.analyze_functions(code)}
+
+    with Pool(workers, initializer=init_worker, initargs=(model_path,)) as pool:
+        result = analyzer.analyze_functions(code, lambda snippets: pool.map(_analyze_snippet, snippets, chunksize))
+    return {'path': path, **result}
@@ -0,0 +1,226 @@
+"""
+BOUNDS - Cotas de bucles y recurrencias de un archivo leído por trozos
+StreamingScanner no guarda el código, así que predict no puede buscar en
+él las cotas de los bucles (REGLA 9) ni las recurrencias (REGLA 10). Aquí
+se calculan en una segunda lectura, sentencia de nivel superior a
+sentencia: ningún bucle ni función cruza de una a otra, así que basta con
+tener en memoria la sentencia en curso. De cada función se guarda un
+perfil reducido (sin su texto) y al final se resuelven las recurrencias
+con la tabla de funciones de la primera lectura. El resultado es el mismo
+que con el código entero en memoria.
+"""
+
+from Backend.loops import analyze_loops
+from Backend.patterns import BLOCK_BOUNDARY, LOOP_TOKEN, STATEMENT_CONTINUATION
+from Backend.recurrence import DEFAULT_SOLVER, EMPTY_PROFILE, dominant_bound, reduce_profile
+from Backend.scanner import DEFAULT_CHUNK_SIZE, read_file_chunks
+
+# Sentencia más larga que se guarda entera (un bundle envuelto en una sola
+# función, p. ej.). Si se pasa, sus bucles y funciones no se analizan y el
+# resultado se marca como aproximado.
+MAX_STATEMENT = 1 << 24
+
+# Texto que tiene que seguir a un fin de sentencia para saber si la línea
+# siguiente la continúa (STATEMENT_CONTINUATION)
+_CONTINUATION_LOOKAHEAD = 256
+
+
+# ============================================================================
+# SENTENCIAS DE NIVEL SUPERIOR
+# ============================================================================
+
+class StatementSplitter:
+    """Parte en sentencias de nivel superior un código que llega por trozos
+
+    Una sentencia acaba en una línea terminada en `}` o `;` (BLOCK_BOUNDARY)
+    que está fuera de cadenas, comentarios, paréntesis, llaves y corchetes,
+    salvo que la línea siguiente la continúe (`} else {`, `.then(...)`).
+    feed() y finish() devuelven las sentencias completas como (posición
+    absoluta, texto); el texto es None si la sentencia pasó de
+    `max_statement` caracteres y se descartó.
+    """
+
+    def __init__(self, max_statement=MAX_STATEMENT):
+        self.max_statement = max_statement
+        self._buffer = ''
+        self._base = 0
+        self._start = 0
+        self._search = 0
+        self._token_resume = 0
+        self._depth = 0
+        self._discarded = False
+
+    def feed(self, text):
+        """Añade texto y devuelve las sentencias que ya están completas"""
+        self._buffer += text
+        return self._split(final=False)
+
+    def finish(self):
+        """Devuelve las sentencias que quedan, la última sin su fin de línea"""
+        statements = self._split(final=True)
+        start = self._start - self._base
+        if self._discarded:
+            statements.append((self._start, None))
+        elif self._buffer[start:].strip():
+            statements.append((self._start, self._buffer[start:]))
+        self._buffer = ''
+        return statements
+
+    def _split(self, final):
+        code = self._buffer
+        base = self._base
+        length = len(code)
+        start = self._start - base
+        search = self._search - base
+        token_resume = self._token_resume - base
+        depth = self._depth
+        statements = []
+
+        tokens = LOOP_TOKEN.finditer(code, token_resume)
+        token = next(tokens, None)
+        for match in BLOCK_BOUNDARY.finditer(code, search):
+            end = match.end()
+            if not final and end + _CONTINUATION_LOOKAHEAD > length:
+                break  # la línea siguiente puede continuar la sentencia
+            search = end
+
+            while token is not None and token.end() <= end:
+                depth = self._nest(token, depth)
+                token_resume = token.end()
+                token = next(tokens, None)
+
+            if depth or (token is not None and token.start() < end) or STATEMENT_CONTINUATION.match(code, end):
+                continue
+            statements.append((base + start, None if self._discarded else code[start:end]))
+            self._discarded = False
+            start = end
+        else:
+            # Ya no hay más fines de sentencia antes del último carácter
+            # visible: no se vuelve a buscar en ese texto ni a tokenizar
+            # hasta su último salto de línea (una cadena no lo cruza)
+            search = max(search, len(code.rstrip()) - 1)
+            settled = code.rfind('\n', 0, search)
+            while token is not None and token.end() <= settled:
+                depth = self._nest(token, depth)
+                token_resume = token.end()
+                token = next(tokens, None)
+
+        # Solo se sabe que la sentencia en curso llega hasta `search`
+        if not self._discarded and search - start > self.max_statement:
+            self._discarded = True
+
+        # Se conserva la sentencia en curso (si no se descartó) y lo que
+        # falta por tokenizar
+        keep = min(search, token_resume) if self._discarded else min(start, search, token_resume)
+        self._buffer = code[keep:]
+        self._base = base + keep
+        self._start = base + start
+        self._search = base + search
+        self._token_resume = base + token_resume
+        self._depth = depth
+        return statements
+
+    @staticmethod
+    def _nest(token, depth):
+        """Profundidad de paréntesis, llaves y corchetes tras `token`"""
+        kind = token.lastgroup
+        if kind == 'open':
+            return depth + 1
+        if kind == 'close':
+            return max(0, depth - 1)
+        return depth
+
+
+# ============================================================================
+# COTAS POR TROZOS
+# ============================================================================
+
+class StreamingBounds:
+    """Cota de los bucles y de las recurrencias de un código que llega por trozos
+
+    `functions` es la tabla de funciones del código completo (p. ej.
+    StreamingScanner.functions() de una primera lectura) y `recursive` los
+    nombres de las funciones que forman parte de una recursión. finish()
+    devuelve loop_bound y recurrence como los calcula predict desde el
+    código (None si no hay bucles o funciones recursivas) y approximate:
+    True si alguna sentencia era demasiado larga para analizarla.
+    """
+
+    def __init__(self, functions, recursive, solver=DEFAULT_SOLVER, max_statement=MAX_STATEMENT):
+        self.functions = functions
+        self.recursive = set(recursive)
+        self.solver = solver
+        self.approximate = False
+        self.loop_bound = None
+        self._names = {function['name'] for function in functions}
+        self._profiles = [EMPTY_PROFILE] * len(functions)
+        self._next_function = 0
+        self._splitter = StatementSplitter(max_statement)
+
+    def feed(self, text):
+        for start, statement in self._splitter.feed(text):
+            self._statement(start, statement)
+
+    def finish(self):
+        """dict con loop_bound, recurrence y approximate"""
+        for start, statement in self._splitter.finish():
+            self._statement(start, statement)
+
+        recurrence = None
+        if self.recursive:
+            results = self.solver.solve_profiles(self.functions, self._profiles)
+            if any(result['recursive'] for result in results.values()):
+                degree, log_degree = self.loop_bound[:2] if self.loop_bound else (0, 0)
+                recurrence = dominant_bound(results, degree, log_degree)
+        return {'loop_bound': self.loop_bound, 'recurrence': recurrence, 'approximate': self.approximate}
+
+    def _statement(self, start, statement):
+        """Bucles y perfiles de las funciones de una sentencia completa"""
+        if statement is None:
+            self.approximate = True
+            return
+
+        structure = analyze_loops(statement)
+        # El anidamiento más caro; a igualdad, el último (como analyze_loops del código entero)
+        if structure['loops'] and (self.loop_bound is None or
+                                   (structure['degree'], structure['log_degree']) >= self.loop_bound[:2]):
+            self.loop_bound = (structure['degree'], structure['log_degree'], structure['certain'])
+
+        end = start + len(statement)
+        functions = self.functions
+        while self._next_function < len(functions):
+            function = functions[self._next_function]
+            if function['start'] >= end:
+                break
+            index = self._next_function
+            self._next_function += 1
+            if function['start'] < start or function['end'] > end:
+                # De una sentencia descartada, o una función que cruza
+                # sentencias (código mal formado): se queda sin coste propio
+                self.approximate = True
+                continue
+            header = statement[function['start'] - start:function['body_start'] - start]
+            body = statement[function['body_start'] - start:function['body_end'] - start]
+            profile = self.solver._profile(header, body)
+            self._profiles[index] = reduce_profile(profile, self._names, function['name'] in self.recursive)
+
+
+def stream_bounds(path, scanner, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Cotas de StreamingBounds para el archivo `path` ya leído por `scanner`
+
+    `scanner` es el StreamingScanner terminado de la primera lectura. El
+    archivo solo se vuelve a leer si predict necesitaría el código: hay
+    bucles pero no recursión (REGLA 9) o hay recursión (REGLA 10).
+    """
+    recursion = 1 if scanner.has_fib_call else scanner.recursion_count
+    if not recursion and not scanner.for_loops + scanner.while_loops:
+        return {'loop_bound': None, 'recurrence': None, 'approximate': False}
+
+    recursive = [name for component in scanner.recursion['components'] for name in component]
+    bounds = StreamingBounds(scanner.functions(), recursive)
+    for text in read_file_chunks(path, chunk_size):
+        bounds.feed(text)
+    result = bounds.finish()
+    if recursion:
+        result['loop_bound'] = None  # predict solo usa la cota de los bucles sin recursión
+    return result
@@ -0,0 +1,136 @@
+"""
+CACHE - Caché de resultados direccionada por contenido
+Guarda el resultado de analyze() bajo un hash del código más las
+versiones del modelo y de las características. Tiene un nivel LRU en
+memoria y un nivel opcional en disco (SQLite). FeatureCache memoriza
+vectores de características por hash del código fuente.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+
+def cache_key(code, model_version, feature_version):
+    """Clave de caché: hash del código y de las versiones que afectan al resultado"""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{feature_version}\0{model_version}\0".encode('utf-8'))
+    digest.update(code.encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Caché de dos niveles: LRU en memoria y, si se indica db_path, SQLite en disco"""
+
+    def __init__(self, max_entries=4096, db_path=None):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if db_path:
+            import sqlite3  # solo con nivel en disco: no se carga al importar el backend
+            self._db = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._db.commit()
+
+    def get(self, key):
+        """Devuelve una copia del resultado guardado o None"""
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return dict(result)
+
+            if self._db is not None:
+                row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    result = json.loads(row[0])
+                    self._remember(key, result)
+                    self.disk_hits += 1
+                    return dict(result)
+
+            self.misses += 1
+            return None
+
+    def put(self, key, result):
+        """Guarda un resultado en ambos niveles"""
+        with self._lock:
+            self._remember(key, dict(result))
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                                 (key, json.dumps(result, ensure_ascii=False)))
+                self._db.commit()
+
+    def _remember(self, key, result):
+        """Inserta en el LRU y expulsa la entrada más antigua si hace falta"""
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self):
+        """Aciertos por nivel, fallos y tasa de aciertos"""
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'memory_entries': len(self._memory),
+            }
+
+    def clear(self):
+        """Vacía el nivel en memoria (el nivel en disco se conserva)"""
+        with self._lock:
+            self._memory.clear()
+
+    def close(self):
+        """Cierra la conexión con SQLite"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+class FeatureCache:
+    """Memoriza el vector de características de cada código por su hash
+
+    Generar un conjunto de datos cuesta así una extracción por fragmento
+    distinto, no una por muestra.
+    """
+
+    def __init__(self, extract, max_entries=65536):
+        self.extract = extract
+        self.max_entries = max_entries
+        self._features = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, code):
+        """Devuelve una copia del vector de `code`, extrayéndolo solo la primera vez"""
+        key = hashlib.blake2b(code.encode('utf-8', 'surrogatepass'), digest_size=20).digest()
+        with self._lock:
+            features = self._features.get(key)
+            if features is not None:
+                self._features.move_to_end(key)
+                self.hits += 1
+                return list(features)
+            self.misses += 1
+
+        features = list(self.extract(code))
+        with self._lock:
+            self._features[key] = features
+            while len(self._features) > self.max_entries:
+                self._features.popitem(last=False)
+        return list(features)
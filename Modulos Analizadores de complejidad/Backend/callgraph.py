@@ -0,0 +1,123 @@
+"""
+CALLGRAPH - Grafo de llamadas y recursión mutua
+A partir de la tabla de funciones del scanner construye el grafo
+función -> funciones a las que llama, obtiene sus componentes fuertemente
+conexas (Tarjan, tiempo lineal) y resume la recursión del código: cuántas
+funciones son recursivas, cuántas recursiones se encadenan y cuántas
+llamadas recursivas hace cada función.
+"""
+
+
+def build_call_graph(functions):
+    """Grafo {nombre: {llamada: número de llamadas}} limitado a funciones definidas
+
+    `functions` son entradas de la tabla de funciones (con name y calls).
+    Las funciones con el mismo nombre se fusionan, igual que se resuelven
+    las llamadas por nombre.
+    """
+    names = {function['name'] for function in functions}
+    graph = {name: {} for name in names}
+    for function in functions:
+        edges = graph[function['name']]
+        for callee, count in function['calls'].items():
+            if callee in names:
+                edges[callee] = edges.get(callee, 0) + count
+    return graph
+
+
+def strongly_connected_components(graph):
+    """Componentes fuertemente conexas de `graph` (algoritmo de Tarjan, sin recursión)
+
+    Se devuelven en orden topológico inverso: cada componente aparece
+    después de todas las componentes a las que llega.
+    """
+    index = {}
+    low = {}
+    on_stack = set()
+    stack = []
+    components = []
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph[root]))]
+
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    index[successor] = low[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(graph[successor])))
+                    break
+                if successor in on_stack:
+                    low[node] = min(low[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+def recursion_metrics(graph):
+    """Resumen de la recursión del grafo de llamadas
+
+    Devuelve un dict con:
+    - recursive_functions: funciones que forman parte de un ciclo (directo o mutuo)
+    - recursion_depth: máximo de componentes recursivas encadenadas en un
+      camino de llamadas (una recursión que llama a otra cuenta 2)
+    - branching_factor: máximo de llamadas de una función a su propia
+      componente (fib(n - 1) + fib(n - 2) cuenta 2)
+    - components: las componentes recursivas, cada una con sus nombres ordenados
+    """
+    components = strongly_connected_components(graph)
+    component_of = {}
+    for number, component in enumerate(components):
+        for name in component:
+            component_of[name] = number
+
+    recursive_functions = 0
+    branching_factor = 0
+    recursive_components = []
+    depth = [0] * len(components)
+
+    # Orden topológico inverso: las componentes llamadas ya tienen su profundidad
+    for number, component in enumerate(components):
+        recursive = len(component) > 1 or component[0] in graph[component[0]]
+        deepest = 0
+        for name in component:
+            branches = 0
+            for callee, count in graph[name].items():
+                target = component_of[callee]
+                if target == number:
+                    branches += count
+                else:
+                    deepest = max(deepest, depth[target])
+            branching_factor = max(branching_factor, branches)
+
+        depth[number] = deepest + 1 if recursive else deepest
+        if recursive:
+            recursive_functions += len(component)
+            recursive_components.append(sorted(component))
+
+    return {
+        'recursive_functions': recursive_functions,
+        'recursion_depth': max(depth, default=0),
+        'branching_factor': branching_factor,
+        'components': recursive_components,
+    }
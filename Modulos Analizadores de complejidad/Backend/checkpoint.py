@@ -0,0 +1,105 @@
+"""
+CHECKPOINT - Checkpoints de entrenamiento reanudables
+Guarda periódicamente los pesos (float64, formato de Backend.weights) y el
+estado del bucle de entrenamiento (época, historial, generador de barajado,
+mejor pérdida) en un directorio, para continuar un entrenamiento
+interrumpido exactamente donde se quedó. Guarda también la mejor red vista
+hasta el momento (best.bin), que se puede cargar con load_model.
+
+Archivos del directorio:
+    checkpoint-000050.bin / .json   pesos y estado tras la época 50
+    best.bin / best.json            mejor red según la pérdida vigilada
+"""
+
+import json
+import os
+
+from Backend.weights import read_weights, write_weights
+
+CHECKPOINT_PREFIX = 'checkpoint-'
+BEST_NAME = 'best'
+
+
+def _replace(path, write):
+    """Escribe con `write(ruta_temporal)` y sustituye `path` de forma atómica"""
+    temporary = path + '.tmp'
+    write(temporary)
+    os.replace(temporary, path)
+
+
+class CheckpointManager:
+    """Checkpoints de una SimpleNeuralNetwork en `directory`, conservando los `keep` últimos"""
+
+    def __init__(self, directory, keep=2):
+        self.directory = directory
+        self.keep = max(1, keep)
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, name, extension):
+        return os.path.join(self.directory, f"{name}.{extension}")
+
+    def _save(self, name, model, state):
+        # Primero los pesos y después el estado: un .json siempre tiene sus pesos completos
+        _replace(self._path(name, 'bin'), lambda path: write_weights(
+            path, model.layer_sizes, model.weights, model.biases, model.feature_scale, True, double=True))
+
+        def write_state(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+        _replace(self._path(name, 'json'), write_state)
+
+    def _restore(self, name, model):
+        try:
+            with open(self._path(name, 'json'), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        data = read_weights(self._path(name, 'bin'), as_numpy=model.use_numpy)
+        if data['layer_sizes'] != model.layer_sizes:
+            raise ValueError(f"El checkpoint {name} es de una red {data['layer_sizes']}, "
+                             f"no {model.layer_sizes}")
+        model.weights = data['weights']
+        model.biases = data['biases']
+        model.feature_scale = data['feature_stats']
+        return state
+
+    def epochs(self):
+        """Épocas con checkpoint guardado, de menor a mayor"""
+        found = []
+        for name in os.listdir(self.directory):
+            stem, extension = os.path.splitext(name)
+            epoch = stem[len(CHECKPOINT_PREFIX):]
+            if extension == '.json' and stem.startswith(CHECKPOINT_PREFIX) and epoch.isdigit():
+                found.append(int(epoch))
+        return sorted(found)
+
+    def save(self, model, state):
+        """Guarda un checkpoint de la época state['epoch'] y borra los más antiguos"""
+        self._save(f"{CHECKPOINT_PREFIX}{state['epoch']:06d}", model, state)
+        for epoch in self.epochs()[:-self.keep]:
+            for extension in ('json', 'bin'):
+                try:
+                    os.remove(self._path(f"{CHECKPOINT_PREFIX}{epoch:06d}", extension))
+                except FileNotFoundError:
+                    pass
+
+    def restore(self, model):
+        """Carga en `model` el último checkpoint y devuelve su estado (None si no hay)"""
+        epochs = self.epochs()
+        if not epochs:
+            return None
+        return self._restore(f"{CHECKPOINT_PREFIX}{epochs[-1]:06d}", model)
+
+    def save_best(self, model, state):
+        """Guarda `model` como la mejor red (best.bin) con su estado"""
+        self._save(BEST_NAME, model, state)
+
+    def restore_best(self, model):
+        """Carga en `model` la mejor red guardada y devuelve su estado (None si no hay)"""
+        return self._restore(BEST_NAME, model)
+
+    @property
+    def best_path(self):
+        """Ruta de best.bin (se carga con NeuralNetworkComplexityAnalyzer.load_model)"""
+        return self._path(BEST_NAME, 'bin')
@@ -0,0 +1,340 @@
+"""
+DATASET - Conjunto de entrenamiento a partir de código real
+Lee archivos JavaScript etiquetados con su complejidad, extrae sus
+características en un pool de procesos y las guarda en un almacén por
+fragmentos (shards). Para entrenar, los fragmentos se leen uno a uno, así
+que el conjunto completo nunca tiene que caber en RAM. Los fragmentos sin
+comprimir se mapean en memoria y sus páginas se leen a medida que se usan;
+los comprimidos (por defecto) se descomprimen enteros, un fragmento cada
+vez (unos 11 MiB con el tamaño por defecto).
+
+Etiquetas del corpus (una de las dos formas):
+    manifest.jsonl   una línea por archivo, rutas relativas al directorio:
+                     {"path": "ordenacion/burbuja.js", "complexity": "O(n²)"}
+    subdirectorios   sin manifiesto, el primer directorio de cada ruta es su
+                     etiqueta: corpus/O(n log n)/merge_sort.js
+
+Almacén (directorio):
+    index.json          versión de características, columnas y fragmentos
+    shard-00001-00000.bin
+                        fragmento 0 de la generación 1 (formato de abajo);
+                        cada reconstrucción escribe una generación nueva y
+                        solo al final sustituye el índice, así que un fallo
+                        deja intacto el almacén anterior
+
+Estructura de un fragmento (little-endian):
+    cabecera   '<4sHHII'  magic, versión, flags, nº de columnas, nº de filas
+    datos      float64: características (filas × columnas) y después las
+               etiquetas (filas); con FLAG_COMPRESSED, comprimidos con zlib
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from multiprocessing import Pool
+
+from Backend.backend import ComplexityMapper
+from Backend.batch import iter_source_files, DEFAULT_EXTENSIONS, DEFAULT_EXCLUDED_DIRS
+from Backend.matrix import FeatureMatrix
+from Backend.scanner import JavaScriptScanner, FEATURE_VERSION, FEATURE_COUNT
+
+MANIFEST_NAME = 'manifest.jsonl'
+INDEX_NAME = 'index.json'
+SHARD_PREFIX = 'shard-'
+
+SHARD_MAGIC = b'CXFS'
+SHARD_VERSION = 1
+FLAG_COMPRESSED = 1
+
+HEADER = struct.Struct('<4sHHII')
+
+DEFAULT_SHARD_SIZE = 65536
+
+# Etiquetas en ASCII aceptadas en el manifiesto y en los nombres de directorio
+LABEL_ALIASES = {
+    'O(n^2)': 'O(n²)',
+    'O(n^3)': 'O(n³)',
+    'O(2^n)': 'O(2ⁿ)',
+}
+
+
+# ============================================================================
+# CORPUS ETIQUETADO
+# ============================================================================
+
+def label_value(label):
+    """Valor de entrenamiento de una etiqueta de complejidad (ValueError si no existe)"""
+    label = LABEL_ALIASES.get(label.strip(), label.strip())
+    if label not in ComplexityMapper.COMPLEXITY_MAP:
+        raise ValueError(f"Complejidad desconocida: {label!r}")
+    return ComplexityMapper.COMPLEXITY_MAP[label]
+
+
+def read_manifest(path):
+    """Genera (ruta, valor de la etiqueta) de cada archivo de un corpus
+
+    `path` es un manifest.jsonl o un directorio: si contiene
+    manifest.jsonl se usa; si no, cada subdirectorio es una etiqueta.
+    """
+    if os.path.isdir(path) and not os.path.isfile(os.path.join(path, MANIFEST_NAME)):
+        yield from _read_label_directories(path)
+        return
+
+    manifest = os.path.join(path, MANIFEST_NAME) if os.path.isdir(path) else path
+    root = os.path.dirname(os.path.abspath(manifest))
+    with open(manifest, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                yield os.path.join(root, entry['path']), label_value(entry['complexity'])
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"{manifest}:{line_number}: entrada no válida ({e})") from None
+
+
+def _read_label_directories(root, extensions=DEFAULT_EXTENSIONS, excluded_dirs=DEFAULT_EXCLUDED_DIRS):
+    """(ruta, valor) de los archivos de cada subdirectorio-etiqueta de `root`"""
+    for label in sorted(os.listdir(root)):
+        directory = os.path.join(root, label)
+        if not os.path.isdir(directory) or label in excluded_dirs:
+            continue
+        value = label_value(label)
+        for path in iter_source_files(directory, extensions, excluded_dirs):
+            yield path, value
+
+
+def _extract(entry):
+    """(características, valor) de un archivo, o (None, error) si no se puede leer"""
+    path, value = entry
+    try:
+        return JavaScriptScanner.scan_file(path), value
+    except (OSError, ValueError) as e:
+        return None, f"{path}: {e}"
+
+
+# ============================================================================
+# FRAGMENTOS
+# ============================================================================
+
+def _shard_name(generation, index):
+    return f"{SHARD_PREFIX}{generation:05d}-{index:05d}.bin"
+
+
+def write_shard(filepath, X, y, compress=True):
+    """Escribe las filas de `X` (FeatureMatrix) y sus etiquetas `y` en un fragmento"""
+    if len(X) != len(y):
+        raise ValueError(f"{len(X)} filas y {len(y)} etiquetas")
+    payload = array('d', X.flat())
+    payload.extend(y)
+    if sys.byteorder == 'big':
+        payload.byteswap()
+    data = zlib.compress(payload.tobytes()) if compress else payload.tobytes()
+
+    with open(filepath, 'wb') as f:
+        f.write(HEADER.pack(SHARD_MAGIC, SHARD_VERSION, FLAG_COMPRESSED if compress else 0, X.columns, len(X)))
+        f.write(data)
+
+
+def read_shard(filepath):
+    """(FeatureMatrix, etiquetas) de un fragmento
+
+    Sin compresión, la matriz y las etiquetas son vistas de un mapa en
+    memoria del fragmento (las páginas se leen del disco a medida que se
+    usan y el mapa se libera cuando ya no quedan vistas). Los fragmentos
+    comprimidos se descomprimen enteros en memoria desde un mapa que se
+    cierra antes de volver.
+    """
+    with open(filepath, 'rb') as f:
+        header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"Fragmento no válido: {filepath} es demasiado corto")
+        magic, version, flags, columns, rows = HEADER.unpack(header)
+        if magic != SHARD_MAGIC:
+            raise ValueError(f"Fragmento no válido: firma desconocida en {filepath}")
+        if version != SHARD_VERSION:
+            raise ValueError(f"Versión de fragmento no soportada: {version}")
+
+        if flags & FLAG_COMPRESSED:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer, memoryview(buffer) as view:
+                data = memoryview(zlib.decompress(view[HEADER.size:]))
+        else:
+            data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))[HEADER.size:]
+    if len(data) != 8 * rows * (columns + 1):
+        raise ValueError(f"Fragmento no válido: tamaño inesperado en {filepath}")
+
+    values = data.cast('d')
+    if sys.byteorder == 'big':
+        values = array('d', values)
+        values.byteswap()
+        values = memoryview(values)
+    return FeatureMatrix(columns, values[:rows * columns]), values[rows * columns:]
+
+
+# ============================================================================
+# ALMACÉN
+# ============================================================================
+
+class FeatureStore:
+    """Almacén de características por fragmentos en `directory`
+
+    len() es el número de muestras. load_shard(i) mapea el fragmento i y
+    devuelve (FeatureMatrix, etiquetas); se puede pasar a
+    SimpleNeuralNetwork.train_simple(store=...) o a
+    NeuralNetworkComplexityAnalyzer.train(store=...).
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, INDEX_NAME), 'r', encoding='utf-8') as f:
+            self.index = json.load(f)
+        if self.index['feature_version'] != FEATURE_VERSION:
+            raise ValueError(f"El almacén tiene características de la versión {self.index['feature_version']}, "
+                             f"no de la {FEATURE_VERSION}: hay que reconstruirlo")
+        self.columns = self.index['columns']
+        self.shards = self.index['shards']
+
+    def select(self, indices):
+        """Otro FeatureStore con solo los fragmentos `indices` (p. ej. para reservar validación)"""
+        selected = FeatureStore.__new__(FeatureStore)
+        selected.directory, selected.index, selected.columns = self.directory, self.index, self.columns
+        selected.shards = [self.shards[i] for i in indices]
+        return selected
+
+    def __len__(self):
+        return sum(shard['samples'] for shard in self.shards)
+
+    @property
+    def shard_count(self):
+        return len(self.shards)
+
+    def load_shard(self, index):
+        """(FeatureMatrix, etiquetas) del fragmento `index` (ver read_shard)"""
+        return read_shard(os.path.join(self.directory, self.shards[index]['name']))
+
+    def __iter__(self):
+        for index in range(self.shard_count):
+            yield self.load_shard(index)
+
+    def column_scale(self):
+        """Mayor valor absoluto de cada columna (mínimo 1), sin leer los fragmentos
+
+        Igual que FeatureMatrix.column_scale sobre todas las muestras.
+        """
+        return [max([1.0] + [shard['column_max'][index] for shard in self.shards]) for index in range(self.columns)]
+
+
+class _StoreWriter:
+    """Acumula muestras y escribe un fragmento cada `shard_size`"""
+
+    def __init__(self, directory, generation, shard_size, compress):
+        self.directory = directory
+        self.generation = generation
+        self.shard_size = shard_size
+        self.compress = compress
+        self.shards = []
+        self.X = FeatureMatrix(FEATURE_COUNT)
+        self.y = array('d')
+
+    def append(self, features, value):
+        self.X.append(features)
+        self.y.append(value)
+        if len(self.y) >= self.shard_size:
+            self.flush()
+
+    def flush(self):
+        if not len(self.y):
+            return
+        name = _shard_name(self.generation, len(self.shards))
+        write_shard(os.path.join(self.directory, name), self.X, self.y, self.compress)
+        scale = [max(map(abs, self.X.column(index)), default=0.0) for index in range(self.X.columns)]
+        self.shards.append({'name': name, 'samples': len(self.y), 'column_max': scale})
+        self.X = FeatureMatrix(FEATURE_COUNT)
+        self.y = array('d')
+
+
+def _read_index(directory):
+    """Índice del almacén en `directory`, o {} si no hay uno legible"""
+    try:
+        with open(os.path.join(directory, INDEX_NAME), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _remove_stale_shards(directory, index):
+    """Borra los fragmentos de `directory` que no están en `index`"""
+    keep = {shard['name'] for shard in index.get('shards', [])}
+    for name in os.listdir(directory):
+        if name.startswith(SHARD_PREFIX) and name.endswith('.bin') and name not in keep:
+            os.remove(os.path.join(directory, name))
+
+
+def build_dataset(corpus, directory, shard_size=DEFAULT_SHARD_SIZE, workers=None, compress=True, chunksize=64):
+    """Extrae las características de un corpus etiquetado y las guarda en `directory`
+
+    `corpus` es un manifiesto o un directorio (ver read_manifest). Las
+    características se extraen en `workers` procesos (por defecto, uno por
+    CPU; 1 = en el proceso actual) y se escriben en orden del manifiesto,
+    en fragmentos de `shard_size` muestras. Los archivos que no se pueden
+    leer se omiten y se cuentan en el índice. Devuelve el FeatureStore.
+
+    Los fragmentos nuevos no pisan los del almacén anterior, y el índice se
+    sustituye de una vez (os.replace) al terminar: si la construcción falla
+    o se interrumpe, `directory` sigue teniendo el almacén anterior completo.
+
+    Con `compress` (por defecto) cada fragmento se descomprime entero al
+    leerlo; para que el entrenamiento lo lea del disco a medida que lo usa,
+    hay que construirlo sin comprimir.
+    """
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(directory, exist_ok=True)
+    generation = _read_index(directory).get('generation', 0) + 1
+
+    writer = _StoreWriter(directory, generation, max(1, shard_size), compress)
+    errors = []
+
+    def collect(results):
+        for features, value in results:
+            if features is None:
+                errors.append(value)
+            else:
+                writer.append(features, value)
+
+    temporary = os.path.join(directory, INDEX_NAME + '.tmp')
+    try:
+        entries = read_manifest(corpus)
+        if workers == 1:
+            collect(map(_extract, entries))
+        else:
+            with Pool(workers) as pool:
+                collect(pool.imap(_extract, entries, chunksize))
+        writer.flush()
+
+        index = {
+            'feature_version': FEATURE_VERSION,
+            'columns': FEATURE_COUNT,
+            'compressed': compress,
+            'generation': generation,
+            'shards': writer.shards,
+            'skipped': len(errors),
+        }
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=1)
+        os.replace(temporary, os.path.join(directory, INDEX_NAME))
+    except BaseException:
+        # El índice anterior sigue en su sitio: se borra lo escrito de esta generación
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        _remove_stale_shards(directory, _read_index(directory))
+        raise
+    _remove_stale_shards(directory, index)
+
+    for error in errors:
+        print(f"⚠️  Omitido {error}", file=sys.stderr)
+    return FeatureStore(directory)
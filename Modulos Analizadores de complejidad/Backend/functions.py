@@ -0,0 +1,57 @@
+"""
+FUNCTIONS - Localización de funciones de nivel superior
+Empareja las llaves del código (ignorando cadenas y comentarios) en una
+sola pasada y devuelve el nombre, la posición y el rango de líneas de
+cada función, junto con las llamadas que hace y la recursión que forman.
+"""
+
+from Backend.callgraph import build_call_graph, recursion_metrics
+from Backend.scanner import FunctionTableBuilder
+
+
+def build_function_table(code):
+    """Todas las funciones del código, anidadas incluidas, ordenadas por posición
+
+    Cada una es un dict con name, start, end, body_start, body_end, depth
+    (llaves que la encierran) y calls ({nombre: veces} de las llamadas en
+    su propio cuerpo).
+    """
+    builder = FunctionTableBuilder()
+    builder.consume(code, 0, len(code), True)
+    return builder.table()
+
+
+def analyze_recursion(code):
+    """recursion_metrics del grafo de llamadas de `code` (ver Backend.callgraph)"""
+    return recursion_metrics(build_call_graph(build_function_table(code)))
+
+
+def split_functions(code):
+    """Funciones de nivel superior en orden de aparición
+
+    Cada una es un dict con name, start y end (posiciones; end excluido)
+    y start_line y end_line (numeradas desde 1).
+    """
+    functions = []
+    line = 1
+    counted = 0
+
+    for function in build_function_table(code):
+        if function['depth'] != 0:
+            continue
+
+        start, end = function['start'], function['end']
+        line += code.count('\n', counted, start)
+        start_line = line
+        line += code.count('\n', start, end)
+        counted = end
+
+        functions.append({
+            'name': function['name'],
+            'start': start,
+            'end': end,
+            'start_line': start_line,
+            'end_line': line,
+        })
+
+    return functions
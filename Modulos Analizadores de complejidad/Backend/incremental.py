@@ -0,0 +1,214 @@
+"""
+INCREMENTAL - Extracción de características por bloques con caché
+Divide el código en bloques de nivel superior (funciones, sentencias) y
+guarda las características de cada bloque, la cota de sus bucles y el
+perfil de sus funciones. Al editar, solo se vuelven a recorrer los
+bloques que cambiaron y los totales, la cota de los bucles y las
+recurrencias se recombinan a partir de los bloques guardados.
+"""
+
+import threading
+from collections import OrderedDict
+
+from Backend.callgraph import build_call_graph, recursion_metrics
+from Backend.loops import analyze_loops
+from Backend.patterns import BLOCK_BOUNDARY, SCOPE_TOKEN, STATEMENT_CONTINUATION, RANGE_VARIABLE, MIDPOINT_VARIABLE
+from Backend.recurrence import DEFAULT_SOLVER, dominant_bound, profile_function
+from Backend.scanner import StreamingScanner
+
+
+# Columnas del vector que se suman entre bloques y las que toman el máximo
+SUMMED_FEATURES = (1, 2, 5, 6, 7, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18)
+MAX_FEATURES = (8,)
+
+
+def split_blocks(code):
+    """Parte el código en bloques de nivel superior
+
+    Un bloque nuevo empieza en una línea no vacía cuando la línea no vacía
+    anterior terminó en `}` o `;` fuera de toda llave. Las llaves se
+    cuentan como en la tabla de funciones (SCOPE_TOKEN: sin las de cadenas
+    y comentarios) y nunca se corta dentro de una plantilla o un comentario
+    de bloque, ni antes de una línea que continúa la sentencia (`} while`
+    de un do, else, catch...): así cada bucle queda entero en un bloque.
+    Cada bloque conserva su salto de línea final: al unirlos se obtiene
+    `code`.
+    """
+    blocks = []
+    start = depth = 0
+    tokens = SCOPE_TOKEN.finditer(code)
+    token = next(tokens, None)
+
+    for match in BLOCK_BOUNDARY.finditer(code):
+        end = match.end()
+        while token is not None and token.end() <= end:
+            if token.group('open'):
+                depth += 1
+            elif token.group('close'):
+                depth = max(0, depth - 1)
+            token = next(tokens, None)
+        # Una plantilla o un comentario que sigue abierto después del salto de línea
+        inside_token = token is not None and token.start() < end
+        if depth == 0 and not inside_token and not STATEMENT_CONTINUATION.match(code, end):
+            blocks.append(code[start:end])
+            start = end
+
+    blocks.append(code[start:])
+    return blocks
+
+
+class IncrementalFeatureExtractor:
+    """Misma interfaz que CodeFeatureExtractor.extract_features, con caché por bloque
+
+    La clave de cada bloque es su texto y la anidación de bucles con la
+    que empieza (la única parte del estado del scanner que cruza bloques).
+    La recursión se cuenta sobre el grafo de llamadas de todos los bloques,
+    así se detecta también entre funciones de bloques distintos.
+
+    analyze devuelve además los argumentos de SimpleNeuralNetwork.predict
+    (pistas, forma de la recursión, cota de los bucles y recurrencias),
+    también a partir de lo guardado de cada bloque.
+    """
+
+    def __init__(self, max_blocks=65536):
+        self.max_blocks = max_blocks
+        self._blocks = OrderedDict()
+        self._bounds = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def extract_features(self, code):
+        """Vector de 20 características combinando los bloques (solo recorre los nuevos)"""
+        return self._combine(split_blocks(code))[0]
+
+    def analyze(self, code):
+        """(características, argumentos de SimpleNeuralNetwork.predict) combinando los bloques
+
+        Los mismos valores que predict calcularía desde `code`: la cota de
+        los bucles es el anidamiento más caro de todos los bloques y las
+        recurrencias se resuelven con los perfiles guardados de las
+        funciones de cada bloque, sin volver a recorrer el código.
+        """
+        blocks = split_blocks(code)
+        features, block_functions, metrics = self._combine(blocks)
+        bounds = [self._block_bounds(block) for block in blocks]
+
+        # Como analyze_loops: el primer anidamiento más caro, sus vueltas seguras o no
+        best = (0, 0, True)
+        has_loops = False
+        for entry in bounds:
+            has_loops = has_loops or entry['has_loops']
+            best = max(best, entry['loop_bound'], key=lambda bound: bound[:2])
+
+        recursion = features[4]
+        options = {
+            'hints': (any(entry['hints'][0] for entry in bounds), any(entry['hints'][1] for entry in bounds)),
+            'recursion_shape': (metrics['recursion_depth'], metrics['branching_factor']) if recursion else (0, 0),
+            'loop_bound': best if recursion == 0 and features[1] + features[2] > 0 and has_loops else None,
+            'recurrence': None,
+        }
+        if recursion:
+            table, profiles = [], []
+            for block, functions, entry in zip(blocks, block_functions, bounds):
+                table.extend(functions)
+                profiles.extend(self._block_profiles(block, functions, entry))
+            results = DEFAULT_SOLVER.solve_profiles(table, profiles)
+            if any(result['recursive'] for result in results.values()):
+                options['recurrence'] = dominant_bound(results, best[0], best[1])
+        return features, options
+
+    def _combine(self, blocks):
+        """(vector, tabla de funciones de cada bloque, recursion_metrics) de los bloques de un código"""
+        totals = [0] * 20
+        nesting = max_nesting = 0
+        functions = []
+        tables = []
+        has_fib_call = False
+
+        for block in blocks:
+            vector, block_functions, block_fib, nesting, block_max_nesting = self._block_features(block, nesting)
+            for i in SUMMED_FEATURES:
+                totals[i] += vector[i]
+            for i in MAX_FEATURES:
+                totals[i] = max(totals[i], vector[i])
+            totals[0] += vector[0] - 1
+            functions.extend(block_functions)
+            tables.append(block_functions)
+            has_fib_call = has_fib_call or block_fib
+            max_nesting = max(max_nesting, block_max_nesting)
+
+        totals[0] += 1
+        totals[3] = max_nesting
+        metrics = recursion_metrics(build_call_graph(functions))
+        totals[4] = 1 if has_fib_call else metrics['recursive_functions']
+
+        total_loops = totals[1] + totals[2]
+        totals[19] = total_loops * max(1, max_nesting) if total_loops > 0 else 1
+        return totals, tables, metrics
+
+    def _block_features(self, block, nesting):
+        """Características de un bloque que empieza con la anidación `nesting`"""
+        key = (block, nesting)
+        with self._lock:
+            cached = self._blocks.get(key)
+            if cached is not None:
+                self._blocks.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        scanner = StreamingScanner()
+        scanner.nesting = nesting
+        scanner.feed(block)
+        vector = scanner.finish()
+        result = (vector, scanner.function_table.table(), scanner.has_fib_call, scanner.nesting, scanner.max_nesting)
+
+        with self._lock:
+            self._blocks[key] = result
+            while len(self._blocks) > self.max_blocks:
+                self._blocks.popitem(last=False)
+        return result
+
+    def _block_bounds(self, block):
+        """Cota de los bucles y pistas de un bloque (de la caché si ya se vio)
+
+        Un dict con loop_bound ((grado, grado de log, segura) de su
+        anidamiento más caro), has_loops, hints (variables de rango y de
+        punto medio) y profiles (perfiles de sus funciones, se calculan al
+        pedirlos).
+        """
+        with self._lock:
+            entry = self._bounds.get(block)
+            if entry is not None:
+                self._bounds.move_to_end(block)
+                return entry
+
+        structure = analyze_loops(block)
+        entry = {
+            'loop_bound': (structure['degree'], structure['log_degree'], structure['certain']),
+            'has_loops': bool(structure['loops']),
+            'hints': (RANGE_VARIABLE.search(block) is not None, MIDPOINT_VARIABLE.search(block) is not None),
+            'profiles': None,
+        }
+
+        with self._lock:
+            self._bounds[block] = entry
+            while len(self._bounds) > self.max_blocks:
+                self._bounds.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def _block_profiles(block, functions, entry):
+        """Perfiles de recurrencia de las `functions` del bloque (se guardan en su entrada)"""
+        if entry['profiles'] is None:
+            entry['profiles'] = [profile_function(block[function['start']:function['body_start']],
+                                                  block[function['body_start']:function['body_end']])
+                                 for function in functions]
+        return entry['profiles']
+
+    def clear(self):
+        """Vacía la caché de bloques"""
+        with self._lock:
+            self._blocks.clear()
+            self._bounds.clear()
@@ -0,0 +1,239 @@
+"""
+LOOPS - Cotas de iteración de los bucles
+Localiza los bucles for / while / do-while con sus cuerpos, clasifica
+cuántas vueltas da cada uno según cómo cambia su contador (fijas,
+logarítmicas o lineales) y multiplica esas clases a lo largo de cada
+anidamiento para obtener una estimación estructural de la complejidad.
+"""
+
+from Backend.patterns import (
+    LOOP_TOKEN,
+    LOOP_BODY_OPENING,
+    DO_CONDITION,
+    LOOP_BODY_START,
+    GEOMETRIC_UPDATE,
+    LINEAR_UPDATE,
+    LITERAL_INIT,
+    LITERAL_BOUND,
+    CONDITION_VARIABLE,
+    HALVING,
+    HALVING_ASSIGNMENT,
+    MIDPOINT_VALUE,
+    SCALING_OPERATOR,
+    counter_step_pattern,
+)
+
+
+# Clase de vueltas de un bucle -> (grado de n, grado de log n) que aporta.
+# 'unknown' (no se ve cómo cambia el contador) se cuenta como lineal.
+TRIP_COUNTS = {
+    'constant': (0, 0),
+    'log': (0, 1),
+    'linear': (1, 0),
+    'unknown': (1, 0),
+}
+
+
+# ============================================================================
+# LOCALIZACIÓN DE BUCLES
+# ============================================================================
+
+def match_brackets(code):
+    """Palabras clave de bucle (tipo, inicio, fin) y parejas de apertura -> cierre"""
+    keywords = []
+    pairs = {}
+    stack = []
+    for match in LOOP_TOKEN.finditer(code):
+        kind = match.lastgroup
+        if kind == 'open':
+            stack.append(match.start())
+        elif kind == 'close':
+            if stack:
+                pairs[stack.pop()] = match.start()
+        elif kind == 'loop':
+            start = match.start()
+            before = code[start - 1] if start else ' '
+            if not (before.isalnum() or before == '_'):
+                keywords.append((match.group('loop'), start, match.end()))
+    return keywords, pairs
+
+
+def _statement_end(code, pos, pairs):
+    """Fin (excluido) de la sentencia sin llaves que empieza en `pos`"""
+    length = len(code)
+    while pos < length:
+        char = code[pos]
+        if char in '([{' and pos in pairs:
+            pos = pairs[pos] + 1
+        elif char == ';':
+            return pos + 1
+        elif char in '}\n':
+            return pos
+        else:
+            pos += 1
+    return length
+
+
+def find_loops(code):
+    """Bucles del código en orden de aparición
+
+    Cada uno es un dict con kind ('for', 'while' o 'do'), start y end (el
+    bucle completo), header (texto entre paréntesis), body_start y
+    body_end. Los `while` que cierran un do-while no se cuentan aparte.
+    """
+    keywords, pairs = match_brackets(code)
+    loops = []
+    do_conditions = set()
+
+    for kind, start, end in keywords:
+        if start in do_conditions:
+            continue
+        opening = LOOP_BODY_OPENING.match(code, end)
+        if not opening or opening.end() - 1 not in pairs:
+            continue
+        open_pos = opening.end() - 1
+        close = pairs[open_pos]
+
+        if kind == 'do':
+            if code[open_pos] != '{':
+                continue
+            loop = {'kind': kind, 'start': start, 'end': close + 1, 'header': '',
+                    'body_start': open_pos + 1, 'body_end': close}
+            # do { ... } while (condición);
+            condition = DO_CONDITION.match(code, close + 1)
+            if condition:
+                do_conditions.add(condition.start(1))
+                condition_close = pairs.get(condition.end() - 1)
+                if condition_close is not None:
+                    loop['header'] = code[condition.end():condition_close]
+                    loop['end'] = condition_close + 1
+            loops.append(loop)
+        elif code[open_pos] == '(':
+            loops.append({'kind': kind, 'start': start, 'end': None, 'header': code[open_pos + 1:close],
+                          'body_start': None, 'body_end': None, '_header_end': close + 1})
+
+    # Cuerpos: de atrás hacia delante, así un bucle sin llaves cuyo cuerpo
+    # es otro bucle ya conoce dónde termina ese bucle
+    starts = {loop['start']: loop for loop in loops}
+    for loop in reversed(loops):
+        if loop['kind'] == 'do':
+            continue
+        body_start = LOOP_BODY_START.match(code, loop.pop('_header_end')).end()
+        if body_start < len(code) and code[body_start] == '{' and body_start in pairs:
+            loop['body_start'], loop['body_end'] = body_start + 1, pairs[body_start]
+            loop['end'] = pairs[body_start] + 1
+        elif body_start in starts and starts[body_start]['end'] is not None:
+            loop['body_start'] = body_start
+            loop['body_end'] = loop['end'] = starts[body_start]['end']
+        else:
+            loop['body_start'] = body_start
+            loop['body_end'] = loop['end'] = _statement_end(code, body_start, pairs)
+
+    return loops
+
+
+# ============================================================================
+# CLASIFICACIÓN DE VUELTAS
+# ============================================================================
+
+def classify_for(header):
+    """Vueltas de un `for (init; condición; actualización)` según su actualización"""
+    parts = header.split(';')
+    if len(parts) != 3:
+        return 'linear'  # for...of / for...in: recorre una colección
+    init, condition, update = parts
+    if LITERAL_INIT.search(init) and LITERAL_BOUND.match(condition):
+        return 'constant'
+    if GEOMETRIC_UPDATE.search(update):
+        return 'log'
+    if LINEAR_UPDATE.search(update):
+        return 'linear'
+    return 'unknown'
+
+
+def _classify_value(name, value, halved):
+    """Clase del paso `name = value` ('log', 'linear' o None si no cambia con name)"""
+    midpoint = MIDPOINT_VALUE.match(value)
+    if HALVING.search(value) or (midpoint and midpoint.group(1) in halved):
+        return 'log'  # búsqueda binaria: el rango se acota al punto medio
+    if name not in CONDITION_VARIABLE.findall(value):
+        return None
+    if SCALING_OPERATOR.search(value):
+        return 'log'
+    return 'linear'  # i = i + 1, node = node.next
+
+
+def classify_while(condition, body):
+    """Vueltas de un `while` según cómo cambian en el cuerpo las variables de la condición"""
+    halved = set(HALVING_ASSIGNMENT.findall(body))
+    trip = 'unknown'
+    for name in set(CONDITION_VARIABLE.findall(condition)):
+        for match in counter_step_pattern(name).finditer(body):
+            if match.group('geometric'):
+                return 'log'
+            if match.group('linear') or match.group('prefix'):
+                trip = 'linear'
+            elif match.group('value') is not None:
+                step = _classify_value(name, match.group('value'), halved)
+                if step == 'log':
+                    return 'log'
+                if step == 'linear':
+                    trip = 'linear'
+    return trip
+
+
+# ============================================================================
+# ESTIMACIÓN ESTRUCTURAL
+# ============================================================================
+
+def bound_to_complexity(degree, log_degree):
+    """Etiqueta de ComplexityMapper más cercana a n^degree · log^log_degree n"""
+    if degree == 0:
+        return 'O(1)' if log_degree == 0 else 'O(log n)'
+    if degree == 1:
+        return 'O(n)' if log_degree == 0 else 'O(n log n)'
+    return 'O(n²)' if degree == 2 else 'O(n³)'
+
+
+def analyze_loops(code):
+    """Cota estructural de los bucles de `code`
+
+    Devuelve un dict con loops (los de find_loops, más trip y depth),
+    degree y log_degree del anidamiento más costoso (producto de las
+    vueltas de los bucles que lo forman), certain (ningún bucle de ese
+    anidamiento tiene vueltas desconocidas) y complexity (su etiqueta).
+    """
+    loops = find_loops(code)
+    enclosing = []
+    for loop in loops:
+        if loop['kind'] == 'for':
+            loop['trip'] = classify_for(loop['header'])
+        else:
+            loop['trip'] = classify_while(loop['header'], code[loop['body_start']:loop['body_end']])
+        while enclosing and loop['start'] >= enclosing[-1]['end']:
+            enclosing.pop()
+        loop['depth'] = len(enclosing)
+        loop['_parent'] = enclosing[-1] if enclosing else None
+        loop['_cost'] = None
+        enclosing.append(loop)
+
+    # De dentro hacia fuera: coste de un bucle = sus vueltas × el hijo más caro
+    best = (0, 0, True)
+    for loop in reversed(loops):
+        degree, log_degree = TRIP_COUNTS[loop['trip']]
+        inner = loop.pop('_cost') or (0, 0, True)
+        cost = (degree + inner[0], log_degree + inner[1], inner[2] and loop['trip'] != 'unknown')
+        parent = loop.pop('_parent')
+        if parent is None:
+            best = max(best, cost, key=lambda c: c[:2])
+        elif parent['_cost'] is None or cost[:2] > parent['_cost'][:2]:
+            parent['_cost'] = cost
+
+    degree, log_degree, certain = best
+    return {
+        'loops': loops,
+        'degree': degree,
+        'log_degree': log_degree,
+        'certain': certain,
+        'complexity': bound_to_complexity(degree, log_degree),
+    }
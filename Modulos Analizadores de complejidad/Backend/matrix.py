@@ -0,0 +1,114 @@
+"""
+MATRIX - Matriz de características contigua
+Guarda las muestras de entrenamiento e inferencia en un único array('d')
+por filas (8 bytes por valor, sin objetos float por elemento). Las filas
+y los rangos de filas son vistas (memoryview) sobre los mismos datos, y
+con NumPy instalado la matriz completa se ve como un ndarray sin copiar.
+"""
+
+from array import array
+from itertools import cycle
+from operator import truediv
+
+
+class FeatureMatrix:
+    """Matriz de `columns` columnas guardada por filas en memoria contigua
+
+    Se comporta como una secuencia de filas: len() es el número de
+    muestras y matrix[i] devuelve la fila i como vista de solo lectura.
+    Mientras existan vistas, la matriz no puede crecer (append lanza
+    BufferError).
+    """
+
+    __slots__ = ('columns', '_data')
+
+    def __init__(self, columns, data=None):
+        if columns <= 0:
+            raise ValueError("La matriz necesita al menos una columna")
+        self.columns = columns
+        self._data = array('d') if data is None else data
+        if len(self._data) % columns:
+            raise ValueError(f"{len(self._data)} valores no forman filas de {columns} columnas")
+
+    @classmethod
+    def from_rows(cls, rows, columns):
+        """Copia una secuencia de filas (listas, tuplas, ndarray...) de `columns` valores"""
+        matrix = cls(columns)
+        for row in rows:
+            matrix.append(row)
+        return matrix
+
+    def append(self, row):
+        """Añade una fila al final"""
+        start = len(self._data)
+        self._data.extend(row)
+        if len(self._data) - start != self.columns:
+            del self._data[start:]
+            raise ValueError(f"La fila tiene que tener {self.columns} valores")
+
+    def __len__(self):
+        return len(self._data) // self.columns
+
+    def __getitem__(self, index):
+        rows = len(self)
+        if index < 0:
+            index += rows
+        if not 0 <= index < rows:
+            raise IndexError("Fila fuera de rango")
+        return self.row(index)
+
+    def __iter__(self):
+        view = memoryview(self._data)
+        for start in range(0, len(view), self.columns):
+            yield view[start:start + self.columns]
+
+    def row(self, index):
+        """Fila `index` como memoryview (sin copiar)"""
+        start = index * self.columns
+        return memoryview(self._data)[start:start + self.columns]
+
+    def rows(self, start, stop):
+        """Filas [start, stop) como otra FeatureMatrix que comparte los datos"""
+        stop = min(stop, len(self))
+        return FeatureMatrix(self.columns, memoryview(self._data)[start * self.columns:stop * self.columns])
+
+    def take(self, indices):
+        """Nueva matriz con las filas `indices` en ese orden (copia)"""
+        view = memoryview(self._data)
+        data = array('d')
+        for index in indices:
+            start = index * self.columns
+            data.extend(view[start:start + self.columns])
+        return FeatureMatrix(self.columns, data)
+
+    def flat(self):
+        """Todos los valores, fila tras fila, como memoryview plano (sin copiar)"""
+        return memoryview(self._data)
+
+    def column(self, index):
+        """Columna `index` como vista con paso (sin copiar)"""
+        return memoryview(self._data)[index::self.columns]
+
+    def column_scale(self):
+        """Mayor valor absoluto de cada columna (mínimo 1), para normalizar"""
+        return [max(1.0, max(map(abs, self.column(index)), default=1.0)) for index in range(self.columns)]
+
+    def scaled(self, scale):
+        """Nueva matriz con cada columna dividida por su valor de `scale`"""
+        if len(scale) != self.columns:
+            raise ValueError(f"Se esperaban {self.columns} escalas")
+        return FeatureMatrix(self.columns, array('d', map(truediv, self._data, cycle(scale))))
+
+    def to_numpy(self):
+        """ndarray (filas × columnas) sobre los mismos datos, sin copiar"""
+        import numpy as np  # opcional: solo se carga al usarlo
+        return np.frombuffer(self._data, dtype=np.float64).reshape(-1, self.columns)
+
+    def tolist(self):
+        """Lista de filas como listas de float"""
+        return [row.tolist() for row in self]
+
+    @property
+    def nbytes(self):
+        """Bytes que ocupan los valores"""
+        return len(self._data) * 8
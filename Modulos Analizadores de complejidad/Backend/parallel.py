@@ -0,0 +1,245 @@
+"""
+PARALLEL - Entrenamiento con paralelismo de datos
+Reparte cada mini-lote entre procesos trabajadores: cada uno calcula la
+suma de los gradientes de su parte y el proceso principal los suma y
+actualiza los pesos. Pesos, datos, orden de barajado y gradientes viven
+en memoria compartida (multiprocessing.RawArray), así que por las
+tuberías solo viajan el rango de cada parte y la pérdida: los pesos no se
+serializan en cada paso.
+"""
+
+import multiprocessing
+import signal
+import traceback
+from array import array
+from itertools import chain
+
+from Backend.matrix import FeatureMatrix
+
+# Lote mínimo (muestras) a partir del cual repartir cada lote entre procesos
+# compensa el coste fijo de cada paso, con la red por defecto y varios núcleos
+# libres; benchmark_parallel.py lo mide en cada máquina
+MIN_PARALLEL_BATCH_NUMPY = 256
+MIN_PARALLEL_BATCH_LISTS = 8
+
+
+def min_parallel_batch(use_numpy):
+    """Lote mínimo con el que compensa entrenar con varios procesos en el motor indicado"""
+    return MIN_PARALLEL_BATCH_NUMPY if use_numpy else MIN_PARALLEL_BATCH_LISTS
+
+
+def parameter_layout(layer_sizes):
+    """Posición de cada capa en el vector plano de parámetros y su longitud total
+
+    Cada capa ocupa (desplazamiento, filas, columnas): primero los pesos
+    (filas × columnas) y a continuación los sesgos (filas), en el mismo
+    orden que el formato de Backend.weights.
+    """
+    layout = []
+    offset = 0
+    for layer_idx in range(len(layer_sizes) - 1):
+        rows, cols = layer_sizes[layer_idx + 1], layer_sizes[layer_idx]
+        layout.append((offset, rows, cols))
+        offset += rows * cols + rows
+    return layout, offset
+
+
+def _double_view(raw):
+    """memoryview de formato 'd' sobre un RawArray('d')"""
+    return memoryview(raw).cast('B').cast('d')
+
+
+def _flatten(weights, biases):
+    """Pesos y sesgos en listas de filas como array('d') plano"""
+    return array('d', chain.from_iterable(chain(chain.from_iterable(w), b) for w, b in zip(weights, biases)))
+
+
+def _unflatten(flat, layout):
+    """Inverso de _flatten: (pesos como listas de filas, sesgos)"""
+    weights, biases = [], []
+    for offset, rows, cols in layout:
+        weights.append([flat[offset + r * cols:offset + (r + 1) * cols] for r in range(rows)])
+        biases.append(flat[offset + rows * cols:offset + rows * cols + rows])
+    return weights, biases
+
+
+def _numpy_views(np, raw, layout):
+    """(pesos, sesgos) de NumPy que apuntan al RawArray de parámetros"""
+    flat = np.frombuffer(raw, dtype=np.float64)
+    weights, biases = [], []
+    for offset, rows, cols in layout:
+        weights.append(flat[offset:offset + rows * cols].reshape(rows, cols))
+        biases.append(flat[offset + rows * cols:offset + rows * cols + rows])
+    return weights, biases
+
+
+def _worker_main(connection, spec, parameters, gradients, data, labels, order):
+    """Bucle de un trabajador: gradientes de su parte de cada lote hasta recibir None"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # el proceso principal decide cuándo parar
+    from Backend.backend import SimpleNeuralNetwork
+
+    try:
+        net = SimpleNeuralNetwork(input_size=spec['layer_sizes'][0], hidden_layers=spec['layer_sizes'][1:-1],
+                                  use_numpy=spec['use_numpy'])
+        layout, size = parameter_layout(spec['layer_sizes'])
+        columns = spec['layer_sizes'][0]
+        slot = spec['slot'] * size
+        if net.use_numpy:
+            import numpy as np
+            net.weights, net.biases = _numpy_views(np, parameters, layout)
+            X = np.frombuffer(data, dtype=np.float64).reshape(-1, columns)
+            y = np.frombuffer(labels, dtype=np.float64)
+            positions = np.frombuffer(order, dtype=np.int64)
+            gradient = np.frombuffer(gradients, dtype=np.float64)[slot:slot + size]
+        else:
+            parameter_view = _double_view(parameters)
+            X = FeatureMatrix(columns, _double_view(data))
+            y = _double_view(labels)
+            positions = memoryview(order).cast('B').cast('q')
+            gradient = _double_view(gradients)[slot:slot + size]
+    except Exception:
+        connection.send(('error', traceback.format_exc()))
+        return
+    connection.send(('ready', None))
+
+    while True:
+        task = connection.recv()
+        if task is None:
+            break
+        start, stop = task
+        try:
+            if net.use_numpy:
+                batch = positions[start:stop]
+                grad_w, grad_b, loss = net._gradients_matrix(X[batch], y[batch])
+                for (offset, rows, cols), gw, gb in zip(layout, grad_w, grad_b):
+                    gradient[offset:offset + rows * cols] = gw.ravel()
+                    gradient[offset + rows * cols:offset + rows * cols + rows] = gb
+            else:
+                # Los pesos cambian en cada paso: se leen de la memoria compartida
+                net.weights, net.biases = _unflatten(parameter_view.tolist(), layout)
+                batch = positions[start:stop].tolist()
+                grad_w, grad_b, loss = net._gradients_lists([X.row(i) for i in batch], [y[i] for i in batch])
+                gradient[:] = _flatten(grad_w, grad_b)
+            connection.send(('ok', loss))
+        except Exception:
+            connection.send(('error', traceback.format_exc()))
+
+
+class ParallelTrainer:
+    """Pasos de descenso de gradiente repartidos entre `workers` procesos
+
+    Mientras está abierto, los pesos de `model` (con NumPy) son vistas de la
+    memoria compartida; al cerrarlo vuelven a ser arrays propios. Con el
+    motor de listas el modelo conserva sus listas y el vector compartido se
+    actualiza tras cada paso. El resultado coincide con el entrenamiento en
+    un proceso salvo el redondeo (las sumas se hacen en otro orden).
+    """
+
+    def __init__(self, model, X_norm, y_train, workers):
+        self.model = model
+        self.workers = workers
+        self.layout, self.size = parameter_layout(model.layer_sizes)
+        context = multiprocessing.get_context()
+
+        sample_count = len(X_norm)
+        self._parameters = context.RawArray('d', self.size)
+        self._gradients = context.RawArray('d', self.size * workers)
+        self._data = context.RawArray('d', sample_count * X_norm.columns)
+        self._labels = context.RawArray('d', sample_count)
+        self._order = context.RawArray('q', max(1, sample_count))
+        _double_view(self._data)[:] = X_norm.flat()
+        _double_view(self._labels)[:] = array('d', y_train)
+
+        if model.use_numpy:
+            import numpy as np
+            self._np = np
+            flat = np.frombuffer(self._parameters, dtype=np.float64)
+            for (offset, rows, cols), w, b in zip(self.layout, model.weights, model.biases):
+                flat[offset:offset + rows * cols] = np.asarray(w).ravel()
+                flat[offset + rows * cols:offset + rows * cols + rows] = b
+            model.weights, model.biases = _numpy_views(np, self._parameters, self.layout)
+            self._flat_parameters = flat
+            self._gradient_slots = np.frombuffer(self._gradients, dtype=np.float64).reshape(workers, self.size)
+        else:
+            self._np = None
+            _double_view(self._parameters)[:] = _flatten(model.weights, model.biases)
+            self._gradient_slots = [_double_view(self._gradients)[k * self.size:(k + 1) * self.size]
+                                    for k in range(workers)]
+
+        spec = {'layer_sizes': list(model.layer_sizes), 'use_numpy': model.use_numpy}
+        self._connections = []
+        self._processes = []
+        try:
+            for slot in range(workers):
+                parent_end, child_end = context.Pipe()
+                process = context.Process(target=_worker_main, daemon=True,
+                                          args=(child_end, {**spec, 'slot': slot}, self._parameters, self._gradients,
+                                                self._data, self._labels, self._order))
+                process.start()
+                child_end.close()
+                self._connections.append(parent_end)
+                self._processes.append(process)
+            for connection in self._connections:
+                self._receive(connection)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _receive(self, connection):
+        status, value = connection.recv()
+        if status == 'error':
+            raise RuntimeError(f"Error en un proceso de entrenamiento:\n{value}")
+        return value
+
+    def set_order(self, order):
+        """Orden de las muestras de la época (posiciones que usa step)"""
+        memoryview(self._order).cast('B').cast('q')[:len(order)] = array('q', order)
+
+    def step(self, start, stop):
+        """Un paso con las muestras order[start:stop]; devuelve la suma de sus pérdidas"""
+        count = stop - start
+        parts = min(self.workers, count)
+        active = []
+        for k in range(parts):
+            lo, hi = start + count * k // parts, start + count * (k + 1) // parts
+            self._connections[k].send((lo, hi))
+            active.append(k)
+        total_loss = sum(self._receive(self._connections[k]) for k in active)
+
+        step = self.model.learning_rate / count
+        if self._np is not None:
+            # Los pesos del modelo son vistas de estos parámetros
+            self._flat_parameters -= step * self._gradient_slots[:parts].sum(axis=0)
+        else:
+            gradient = self._gradient_slots[0].tolist()
+            for k in range(1, parts):
+                gradient = [a + b for a, b in zip(gradient, self._gradient_slots[k])]
+            grad_w, grad_b = _unflatten(gradient, self.layout)
+            self.model._apply_gradients_lists(grad_w, grad_b, count)
+            _double_view(self._parameters)[:] = _flatten(self.model.weights, self.model.biases)
+        return total_loss
+
+    def close(self):
+        """Detiene los procesos y devuelve al modelo pesos propios (fuera de la memoria compartida)"""
+        for connection in self._connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for connection in self._connections:
+            connection.close()
+        self._connections, self._processes = [], []
+
+        if self._np is not None and self.model.weights and self.model.weights[0].base is not None:
+            self.model.weights = [w.copy() for w in self.model.weights]
+            self.model.biases = [b.copy() for b in self.model.biases]
@@ -0,0 +1,328 @@
+"""
+PATTERNS - Registro de expresiones regulares precompiladas
+Todas las expresiones que usan el backend y la interfaz se compilan
+una sola vez al importar el módulo, en lugar de en cada llamada.
+"""
+
+import re
+from functools import lru_cache
+
+
+# ============================================================================
+# PATRÓN MAESTRO DEL SCANNER
+# ============================================================================
+
+# Todas las alternativas empiezan con un literal: así el motor de `re`
+# salta en C las posiciones que no pueden iniciar ninguna coincidencia.
+# Solo se consume el literal inicial; el resto se verifica con lookaheads
+# para no ocultar otras coincidencias que empiecen más adelante.
+# El grupo vacío al final de cada alternativa identifica el tipo de
+# coincidencia mediante `match.lastgroup`.
+TOKEN_PATTERN = re.compile(r"""
+    \n(?P<indent>[^\S\n]*)
+  | \}(?P<close>)
+  | \.(?=(?P<method>\w+)(?P<method_ws>\s*)\()
+  | for(?=(?P<for_ws>\s*)(?P<for_br>[({]))
+  | while(?=(?P<while_ws>\s*)(?P<while_br>[({]))
+  | do(?=(?P<do_ws>\s*)[({])
+  | if(?=\s*\()(?P<if_>)
+  | switch(?=\s*\()(?P<switch>)
+  | async(?=\s*\()(?P<async_>)
+  | try(?=\s*\{)(?P<try_>)
+  | let(?=(?P<let_>\s+\w+))
+  | const(?=(?P<const>\s+\w+))
+  | var(?=(?P<var>\s+\w+))
+  | function(?=(?P<func_sig>\s+\w+))(?P<function>)
+  | fib(?=\s*\(\s*\w+\s*[-+])(?P<fib>)
+  | Promise(?P<promise>)
+  | Object(?=\.(?:keys|values|entries|assign))(?P<object>)
+  | JSON(?=\.(?:parse|stringify))(?P<json>)
+  | :(?=\s*function)(?P<colon>)
+  | =(?=\s*\(\s*\))(?P<arrow>)
+""", re.VERBOSE)
+
+# Indentación de la primera línea (no la precede ningún salto de línea)
+LEADING_WHITESPACE = re.compile(r'[^\S\n]*')
+
+# Colas de las definiciones `nombre: function` y `nombre = ()`
+FUNCTION_TAILS = {
+    'colon': re.compile(r'\s*function'),
+    'arrow': re.compile(r'\s*\(\s*\)'),
+}
+FUNCTION_ASSIGNMENT = re.compile(r'\w+\s*(?::\s*function|=\s*\(\s*\))')
+
+
+# ============================================================================
+# ESTRUCTURA: BUCLES, FUNCIONES Y RECURSIÓN
+# ============================================================================
+
+FOR_LOOP = re.compile(r'\bfor\s*\(')
+WHILE_LOOP = re.compile(r'\bwhile\s*\(')
+LOOP_HEADER = re.compile(r'\b(?:for|while)\s*\(')
+LOOP_OPENING = re.compile(r'\b(?:for|while|do)\s*[\(\{]')
+
+FIB_CALL = re.compile(r'fib\s*\(\s*\w+\s*[-+]')
+
+
+# ============================================================================
+# MÉTODOS DE ARRAYS
+# ============================================================================
+
+ARRAY_METHOD = re.compile(r'\.(?:push|pop|map|filter|reduce|forEach|find|some|every)\s*\(')
+SEARCH_METHOD = re.compile(r'\.(?:indexOf|includes|findIndex)\s*\(')
+
+
+# ============================================================================
+# PISTAS DE ALGORITMOS CONOCIDOS
+# ============================================================================
+
+# `fib` también cubre `fibonacci`
+EXPONENTIAL_NAME = re.compile(r'fib', re.IGNORECASE)
+EXPONENTIAL_RETURN = re.compile(r'return\s+\w+\s*[-+]\s*\d+\s*\+\s*\w+')
+BINARY_SEARCH_HINT = re.compile(
+    r'(left|inicio|low).*?(right|fin|high)|binarySearch|binary|busqueda.{0,10}binaria', re.IGNORECASE)
+MIDPOINT_EXPRESSION = re.compile(r'(Math\.floor|Math\.ceil|>>)\s*\(\s*\(.*?(\+|-|/).*?\)\s*\)')
+MIDPOINT_ASSIGNMENT = re.compile(r'(mid|middle)\s*=.*Math\.floor', re.IGNORECASE)
+SORT_HINT = re.compile(r'sort|linearSearch', re.IGNORECASE)
+LENGTH_BOUNDED_FOR = re.compile(r'for\s*\([^)]*<\s*\w*\.length')
+
+# Variables de rango y punto medio (búsqueda binaria)
+RANGE_VARIABLE = re.compile(r'left|right|inicio|fin|low|high|start|end', re.IGNORECASE)
+MIDPOINT_VARIABLE = re.compile(r'mid|middle|medio', re.IGNORECASE)
+
+
+# ============================================================================
+# BLOQUES DE NIVEL SUPERIOR (ANÁLISIS INCREMENTAL)
+# ============================================================================
+
+# Fin de una línea terminada en `}` o `;` (más las líneas en blanco que la
+# siguen) seguido de una línea no vacía
+BLOCK_BOUNDARY = re.compile(r'[};][^\S\n]*\n(?:[^\S\n]*\n)*(?=[^\S\n]*\S)')
+
+# Línea que continúa la sentencia anterior aunque esta acabe en `}`
+# (`} while (...)` de un do, else, catch, finally, `.then(...)`)
+STATEMENT_CONTINUATION = re.compile(r'\s*(?:(?:while|else|catch|finally)\b|\.)')
+
+
+# ============================================================================
+# FUNCIONES Y ÁMBITOS (DESGLOSE POR FUNCIÓN)
+# ============================================================================
+
+# Llaves fuera de cadenas y comentarios: las cadenas y comentarios se
+# consumen enteros para que sus llaves no cuenten. Los comentarios de
+# bloque y las plantillas sin cerrar llegan hasta el final del texto.
+SCOPE_TOKEN = re.compile(r"""
+    //[^\n]*
+  | /\*.*?(?:\*/|\Z)
+  | '(?:\\.|[^'\\\n])*'
+  | "(?:\\.|[^"\\\n])*"
+  | `(?:\\.|[^`\\])*(?:`|\Z)
+  | (?P<open>\{)
+  | (?P<close>\})
+""", re.VERBOSE | re.DOTALL)
+
+# Cabecera de función: declaración (`function f(...) {`), asignación o
+# propiedad con una función o flecha (`const f = (...) => {`, `f: n =>`) o
+# método de clase u objeto (`parse(...) {`). Las flechas sin `{` (grupo
+# `block` vacío) tienen por cuerpo una expresión, que se delimita con
+# EXPRESSION_TOKEN. El lookahead inicial descarta enseguida las palabras
+# que no van seguidas de `:`, `=` o `(` ni son una palabra clave de
+# declaración, y los parámetros no admiten paréntesis, así cada intento es
+# acotado.
+FUNCTION_HEADER = re.compile(r"""
+    \b(?=\w+\b\s*[:=(]|function\b|const\b|let\b|var\b)
+    (?:
+        function(?:\s*\*\s*|\s+)(?P<name>\w+)\s*\([^()]*\)\s*\{
+      | (?:(?:const|let|var)\s+)?(?P<var>\w+)\b\s*[:=]\s*(?:async\s+)?
+        (?:function\s*\*?\s*\w*\s*\([^()]*\)\s*\{|(?:\([^()]*\)|\w+)\s*=>\s*(?P<block>\{)?)
+      | (?!(?:if|for|while|switch|catch|function|with|return)\b)(?P<method>\w+)\b\s*\([^()]*\)\s*\{
+    )
+""", re.VERBOSE)
+
+# Fin del cuerpo de una flecha sin llaves: cadenas y comentarios enteros,
+# paréntesis, llaves y corchetes, `;` y `,` y saltos de línea. El cuerpo
+# acaba en el primer `;`, `,` o cierre sin pareja, o en un salto de línea
+# donde la expresión no sigue (ver FunctionTableBuilder).
+EXPRESSION_TOKEN = re.compile(r"""
+    //[^\n]*
+  | /\*.*?(?:\*/|\Z)
+  | '(?:\\.|[^'\\\n])*'
+  | "(?:\\.|[^"\\\n])*"
+  | `(?:\\.|[^`\\])*(?:`|\Z)
+  | (?P<open>[({\[])
+  | (?P<close>[)}\]])
+  | (?P<separator>[;,])
+  | (?P<newline>\n)
+""", re.VERBOSE | re.DOTALL)
+
+# Llamada `nombre(`. El `\b` inicial y el `(` que sigue a la palabra
+# impiden que el retroceso pruebe palabras más cortas, así cada intento es
+# acotado. Si va precedida de `function` es una definición anidada y no
+# cuenta; eso se comprueba aparte con DECLARATION_KEYWORD sobre el texto anterior.
+CALL_SITE = re.compile(r'\b(?P<callee>\w+)\s*\(')
+DECLARATION_KEYWORD = re.compile(r'(?<!\w)function[\s*]*\Z')
+
+# Comienzo de una posible FUNCTION_HEADER cortada por el final del texto
+# (acepta algo más de lo necesario): el scanner por trozos vuelve a buscar
+# desde ahí cuando llega el trozo siguiente.
+FUNCTION_HEADER_PREFIX = re.compile(r"""
+    (?:
+        function(?:\s*(?:\*\s*)?(?:\w+\s*(?:\([^()]*(?:\)\s*)?)?)?)?
+      | (?:(?:const|let|var)\s+)?\w+\s*(?:
+            \([^()]*(?:\)\s*)?
+          | [:=]\s*(?:(?:async\s*)?
+            (?:function\s*\*?\s*\w*\s*(?:\([^()]*(?:\)\s*)?)?
+            | \([^()]*(?:\)\s*(?:=>?\s*)?)?
+            | \w+\s*(?:=>?\s*)?
+            ))?
+        )?
+    )\Z
+""", re.VERBOSE)
+
+# ============================================================================
+# COTAS DE BUCLES (ANÁLISIS ESTRUCTURAL)
+# ============================================================================
+
+# Palabras clave de bucle y paréntesis, llaves y corchetes fuera de cadenas
+# y comentarios (mismo tratamiento de cadenas que SCOPE_TOKEN). Todas las
+# alternativas empiezan por un carácter fijo, así la búsqueda salta rápido
+# el resto; el límite de palabra antes de la palabra clave se comprueba aparte.
+LOOP_TOKEN = re.compile(r"""
+    //[^\n]*
+  | /\*.*?(?:\*/|\Z)
+  | '(?:\\.|[^'\\\n])*'
+  | "(?:\\.|[^"\\\n])*"
+  | `(?:\\.|[^`\\])*(?:`|\Z)
+  | (?P<loop>(?:for|while|do)\b)
+  | (?P<open>[({\[])
+  | (?P<close>[)}\]])
+""", re.VERBOSE | re.DOTALL)
+
+# Lo que sigue a la palabra clave hasta el paréntesis o llave que abre,
+# el `while (` que cierra un do { } y los espacios antes de un cuerpo
+LOOP_BODY_OPENING = re.compile(r'\s*(?:await\s*)?[({]')
+DO_CONDITION = re.compile(r'\s*(while)\s*\(')
+LOOP_BODY_START = re.compile(r'\s*')
+
+# Actualización de un `for`: geométrica (i *= 2, i >>= 1, i = i / 2) o lineal (i++, i += k)
+GEOMETRIC_UPDATE = re.compile(r'[*/]=|>>>?=|<<=|(?<![=!<>])=(?![=>])[^,]*(?:[*/]|>>|<<)')
+LINEAR_UPDATE = re.compile(r'\+\+|--|[-+]=|(?<![=!<>])=(?![=>])[^,]*[-+]')
+
+# `let i = 0` y `i < 10`: número de vueltas fijo
+LITERAL_INIT = re.compile(r'=\s*-?\d+\s*$')
+LITERAL_BOUND = re.compile(r'^\s*\w+\s*(?:<=?|>=?|!==?)\s*-?\d+\s*$')
+
+# Variables de la condición de un `while` (las llamadas y propiedades no cuentan)
+CONDITION_VARIABLE = re.compile(r'(?<![\w.$])([A-Za-z_$][\w$]*)(?!\s*\()')
+
+# Asignación que parte un valor por la mitad (mid = (lo + hi) >> 1) y
+# valor que es un punto medio, quizá desplazado en uno (mid + 1)
+HALVING = re.compile(r'/\s*2\b|>>>?\s*1\b')
+HALVING_ASSIGNMENT = re.compile(r'\b(\w+)\s*=(?![=>])[^;\n]*?(?:/\s*2\b|>>>?\s*1\b)')
+MIDPOINT_VALUE = re.compile(r'\s*(\w+)\s*(?:[-+]\s*1)?\s*$')
+SCALING_OPERATOR = re.compile(r'[*/]|>>|<<')
+
+
+@lru_cache(maxsize=1024)
+def counter_step_pattern(name):
+    """Patrón compilado (y cacheado) de los cambios de la variable `name`
+
+    Grupos: geometric (*=, /=, >>=, <<=), linear (++, --, +=, -=, también
+    prefijos) y value (lado derecho de una asignación simple).
+    """
+    return re.compile(rf"""
+        (?<![\w.$]){name}\s*(?:
+            (?P<geometric>[*/]=|>>>?=|<<=)
+          | (?P<linear>\+\+|--|[-+]=)
+          | =(?![=>])\s*(?P<value>[^;\n]*)
+        )
+      | (?P<prefix>\+\+|--)\s*{name}\b
+    """, re.VERBOSE)
+
+
+# ============================================================================
+# RECURRENCIAS (FUNCIONES RECURSIVAS)
+# ============================================================================
+
+# Parámetros de una cabecera: `(a, b)` o el único de `x => {`
+PARAMETER_LIST = re.compile(r'\(([^()]*)\)|(\w+)\s*=>')
+
+# Cómo encoge un argumento: entre una constante (n / 3, n >> 1), al doble
+# de índice (2 * i + 1, montículos), una partición (filter) o en una
+# cantidad fija (n - 1, slice(1), quitar el elemento i); y acceso a una
+# parte de una estructura
+DIVISOR = re.compile(r'/\s*(\d+)\b|>>>?\s*(\d+)\b')
+DOUBLING = re.compile(r'\b2\s*\*|\*\s*2\b|<<\s*1\b')
+PARTITION_CALL = re.compile(r'\.filter\s*\(')
+SLICE_CALL = re.compile(r'\.(?:slice|subarray|substring)\s*\(([^()]*)\)')
+CONSTANT_OFFSET = re.compile(r'\s*(\w+)\s*[-+]\s*\d+\s*$')
+CONSTANT_SLICE = re.compile(r'\.(?:slice|subarray|substring|substr)\s*\(\s*\d+\s*\)\s*$')
+ELEMENT_REMOVAL = re.compile(r'\.slice\s*\(\s*0\s*,\s*(\w+)\s*\).*?\.slice\s*\(\s*\1\s*\+\s*1\s*\)', re.DOTALL)
+PROPERTY_ACCESS = re.compile(r'\s*(\w+)\s*(?:\.\w+|\[)')
+BARE_IDENTIFIER = re.compile(r'\s*([A-Za-z_$][\w$]*)\s*$')
+
+# Trabajo no recursivo de una llamada: operaciones que recorren un array
+# (una pasada) y ordenaciones (n log n)
+LINEAR_WORK = re.compile(r"""
+    \.(?:slice|filter|map|concat|reduce|forEach|indexOf|includes|join|splice|fill|every|some|find|findIndex)\s*\(
+  | \.\.\.\w
+  | \bArray\.from\s*\(
+""", re.VERBOSE)
+SORT_WORK = re.compile(r'\.sort\s*\(')
+
+# Variables de un for...of / for...in (recorren las partes de una estructura)
+FOR_OF_VARIABLE = re.compile(r'\b(?:const|let|var)\s+(\w+)\s+(?:of|in)\b')
+
+# `return` antes de una llamada en su sentencia (if (...) return f(...)) y
+# separadores que delimitan esa sentencia
+RETURN_KEYWORD = re.compile(r'\breturn\b')
+STATEMENT_SEPARATOR = re.compile(r'[;{}\n]')
+
+
+# Escrituras en una variable dentro de un bucle: asignación (grupo value),
+# push/unshift/add/set (grupo args) o a una posición (grupo index)
+VARIABLE_WRITE = re.compile(r"""
+    (?<![\w.$])([A-Za-z_$][\w$]*)\s*(?:
+        =(?![=>])\s*(?P<value>[^;\n]*)
+      | \.(?:push|unshift|add|set)\s*\((?P<args>[^;\n]*)
+      | \[(?P<index>[^\]\n]*)\]\s*=(?![=>])
+    )
+""", re.VERBOSE)
+
+
+# Asignación simple a una variable (grupo value): mid = (lo + hi) / 2
+ASSIGNMENT = re.compile(r'(?<![\w.$])([A-Za-z_$][\w$]*)\s*=(?![=>])\s*(?P<value>[^;\n]*)')
+
+
+# ============================================================================
+# DETECCIÓN DE LENGUAJE (INTERFAZ)
+# ============================================================================
+
+PYTHON_DEF = re.compile(r'\bdef\s+\w+\s*\(')
+
+# Cada alternativa es de ancho cero, así que ninguna oculta a otra:
+# los nombres distintos de `lastgroup` son los patrones presentes.
+JAVASCRIPT_CONSTRUCT = re.compile(r"""
+    (?=\bfunction\s+\w+\s*\()(?P<function>)
+  | (?=\bconst\s+\w+\s*=)(?P<const>)
+  | (?=\blet\s+\w+\s*=)(?P<let>)
+  | (?=\bvar\s+\w+\s*=)(?P<var>)
+  | (?==>)(?P<arrow>)
+  | (?=\bfor\s*\()(?P<for_>)
+  | (?=\bwhile\s*\()(?P<while_>)
+  | (?=\bif\s*\()(?P<if_>)
+  | (?=\breturn\s+)(?P<return_>)
+  | (?=\.map\s*\()(?P<map>)
+  | (?=\.filter\s*\()(?P<filter>)
+  | (?=\.forEach\s*\()(?P<for_each>)
+""", re.VERBOSE)
+
+
+# ============================================================================
+# REGISTRO
+# ============================================================================
+
+ALL_PATTERNS = {
+    name: value for name, value in globals().items()
+    if name.isupper() and isinstance(value, re.Pattern)
+}
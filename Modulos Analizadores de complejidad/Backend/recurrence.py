@@ -0,0 +1,605 @@
+"""
+RECURRENCE - Recurrencias de las funciones recursivas
+Calcula el coste de cada función a partir de su cuerpo: bucles,
+operaciones que recorren arrays y llamadas a otras funciones
+(multiplicadas por los bucles que las rodean). En las funciones
+recursivas extrae cuántas llamadas recursivas hace cada invocación y
+cómo encoge el argumento (n - 1, n / 2, slice(0, mid)...) y resuelve la
+recurrencia con el Teorema Maestro, Akra–Bazzi o resta y vencerás. El
+perfil de cada función se guarda por su texto: al editar, solo se vuelve
+a analizar la función que cambió.
+"""
+
+import hashlib
+import math
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+
+from Backend.callgraph import build_call_graph, strongly_connected_components
+from Backend.functions import build_function_table
+from Backend.loops import TRIP_COUNTS, analyze_loops, bound_to_complexity, match_brackets
+from Backend.patterns import (
+    CALL_SITE,
+    DECLARATION_KEYWORD,
+    CONDITION_VARIABLE,
+    PARAMETER_LIST,
+    DIVISOR,
+    DOUBLING,
+    PARTITION_CALL,
+    SLICE_CALL,
+    CONSTANT_OFFSET,
+    CONSTANT_SLICE,
+    ELEMENT_REMOVAL,
+    PROPERTY_ACCESS,
+    BARE_IDENTIFIER,
+    FOR_OF_VARIABLE,
+    LINEAR_WORK,
+    SORT_WORK,
+    RETURN_KEYWORD,
+    STATEMENT_SEPARATOR,
+    VARIABLE_WRITE,
+    ASSIGNMENT,
+    counter_step_pattern,
+)
+
+
+# Coste: (exponencial, grado de n, grado de log n). Las tuplas se comparan
+# en ese orden, así max() da el término dominante de una suma.
+CONSTANT_COST = (0, 0, 0)
+LINEAR_COST = (0, 1, 0)
+SORT_COST = (0, 1, 1)
+EXPONENTIAL_COST = (1, 0, 0)
+
+# Prioridad al combinar los argumentos de una llamada: manda el que más
+# dice sobre el tamaño del problema
+SHRINK_RANK = {'unknown': 0, 'structural': 1, 'subtract': 2, 'divide': 3}
+
+# Tolerancia al comparar el exponente crítico con el grado del trabajo
+_EPSILON = 1e-9
+
+# Texto anterior a una llamada en el que se busca `function` (definición anidada)
+_DECLARATION_LOOKBEHIND = 16
+
+# Asignaciones que se siguen para saber de dónde sale un argumento (mid -> (lo + hi) / 2)
+_MAX_RESOLVE_DEPTH = 3
+
+
+def multiply(outer, inner):
+    """Coste de repetir `inner` tantas veces como indica `outer`"""
+    return (max(outer[0], inner[0]), outer[1] + inner[1], outer[2] + inner[2])
+
+
+def cost_to_complexity(cost):
+    """Etiqueta de ComplexityMapper más cercana (por arriba si el grado no es entero)"""
+    exponential, degree, log_degree = cost
+    if exponential:
+        return 'O(2ⁿ)'
+    rounded = round(degree)
+    if abs(degree - rounded) > _EPSILON:
+        rounded = math.ceil(degree)
+    return bound_to_complexity(rounded, log_degree)
+
+
+# ============================================================================
+# RESOLUCIÓN
+# ============================================================================
+
+def critical_exponent(factors):
+    """p tal que Σ (1/b)^p = 1 para llamadas que dividen el tamaño entre cada b
+
+    Con un solo divisor es el log_b(a) del Teorema Maestro; si no, se
+    busca por bisección (Akra–Bazzi: la suma decrece con p).
+    """
+    if len(set(factors)) == 1:
+        return math.log(len(factors)) / math.log(factors[0])
+    low, high = 0.0, 1.0
+    while sum(b ** -high for b in factors) > 1:
+        high *= 2
+    for _ in range(60):
+        middle = (low + high) / 2
+        if sum(b ** -middle for b in factors) > 1:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+
+def solve_recurrence(calls, work):
+    """Coste de T(n) = Σ T(tamaño tras cada llamada) + work y método usado
+
+    `calls` son las llamadas recursivas de una invocación, cada una con
+    shrink (('divide', b), ('subtract', c), ('structural', 1) o
+    ('unknown', 1)) y varies (su argumento cambia con el contador de un
+    bucle que la rodea).
+    """
+    if work[0]:
+        return EXPONENTIAL_COST, 'exponential-work'
+
+    # Una llamada con un argumento distinto en cada vuelta de un bucle sobre n:
+    # n · T(n - 1) (permutaciones), vuelta atrás... Cada vuelta es una rama más.
+    # Salvo las estructurales: ese bucle recorre las partes del nodo.
+    for call in calls:
+        if call['varies'] and call['shrink'][0] != 'structural':
+            return EXPONENTIAL_COST, 'loop'
+
+    subtracting = [call for call in calls if call['shrink'][0] == 'subtract']
+    if len(subtracting) >= 2:
+        return EXPONENTIAL_COST, 'subtract'  # T(n) = a·T(n - c) + f(n), a >= 2
+    if subtracting:
+        return multiply(LINEAR_COST, work), 'subtract'  # T(n) = T(n - c) + f(n)
+
+    factors = [call['shrink'][1] for call in calls if call['shrink'][0] == 'divide']
+    if factors:
+        # Las llamadas estructurales junto a otras que dividen: como una mitad más
+        factors += [2] * sum(1 for call in calls if call['shrink'][0] != 'divide')
+        p = critical_exponent(factors)
+        method = 'master' if len(set(factors)) == 1 else 'akra-bazzi'
+        _, degree, log_degree = work
+        if p > degree + _EPSILON:
+            return (0, p, 0), method
+        if abs(p - degree) <= _EPSILON:
+            return (0, degree, log_degree + 1), method
+        return work, method
+
+    # Partes de una estructura que suman n (o tamaño desconocido): cada elemento una vez
+    return multiply(LINEAR_COST, work), 'structural'
+
+
+def effective_calls(calls):
+    """Llamadas recursivas que se ejecutan en una misma invocación
+
+    Las que están en sentencias `return` distintas son alternativas (solo
+    se ejecuta una); las demás se ejecutan todas.
+    """
+    always = [call for call in calls if call['statement'] is None]
+    alternatives = {}
+    for call in calls:
+        if call['statement'] is not None:
+            alternatives.setdefault(call['statement'], []).append(call)
+    return always + max(alternatives.values(), key=len, default=[])
+
+
+# ============================================================================
+# PERFIL DE UNA FUNCIÓN
+# ============================================================================
+
+def _enclosing_loops(loops, positions, excluded=()):
+    """(coste, bucles abiertos) en cada posición de `positions`, que van en orden creciente
+
+    Un solo recorrido con la pila de los bucles cuyo cuerpo contiene la
+    posición (como `enclosing` en analyze_loops): cada entrada es (bucle,
+    coste de los bucles hasta él salvo `excluded`). La pila se reutiliza:
+    hay que leerla antes de pedir la siguiente posición.
+    """
+    pending = sorted(loops, key=lambda loop: loop['body_start'])
+    stack = []
+    k = 0
+    for pos in positions:
+        while k < len(pending) and pending[k]['body_start'] <= pos:
+            loop = pending[k]
+            k += 1
+            while stack and stack[-1][0]['body_end'] <= loop['body_start']:
+                stack.pop()
+            outer = stack[-1][1] if stack else CONSTANT_COST
+            if loop['start'] in excluded:
+                stack.append((loop, outer))
+            else:
+                loop_degree, loop_log = TRIP_COUNTS[loop['trip']]
+                stack.append((loop, (0, outer[1] + loop_degree, outer[2] + loop_log)))
+        while stack and stack[-1][0]['body_end'] <= pos:
+            stack.pop()
+        yield (stack[-1][1] if stack else CONSTANT_COST), stack
+
+
+def _loop_products(loops, positions):
+    """Coste de los bucles que contienen cada posición de `positions` (en orden creciente)"""
+    return [cost for cost, _ in _enclosing_loops(loops, positions)]
+
+
+def _return_statement(separators, returns, pos):
+    """Posición del `return` de la sentencia que contiene `pos`, o None si no lo hay
+
+    `separators` son las posiciones de ; { } y saltos de línea del cuerpo y
+    `returns` los (inicio, fin) de cada `return`, ambos en orden: se buscan
+    por bisección en lugar de recorrer el texto anterior en cada llamada.
+    """
+    index = bisect_left(separators, pos)
+    start = separators[index - 1] + 1 if index else 0
+    index = bisect_left(returns, (start,))
+    if index < len(returns) and returns[index][1] <= pos:
+        return returns[index][0]
+    return None
+
+
+def _without_loops(call, trips, excluded):
+    """product de la llamada sin las vueltas de los bucles `excluded` que la rodean"""
+    _, degree, log_degree = call['product']
+    for start in call['loops']:
+        if start in excluded:
+            loop_degree, loop_log = TRIP_COUNTS[trips[start]]
+            degree -= loop_degree
+            log_degree -= loop_log
+    return (0, degree, log_degree)
+
+
+def _nest_work(loops, excluded):
+    """Coste del anidamiento de bucles más caro sin contar los bucles `excluded`"""
+    positions = sorted(loop['body_start'] for loop in loops)
+    return max((cost for cost, _ in _enclosing_loops(loops, positions, excluded)), default=CONSTANT_COST)
+
+
+def _split_arguments(arguments):
+    """Argumentos de una llamada separados por las comas de primer nivel"""
+    parts = []
+    depth = start = 0
+    for pos, char in enumerate(arguments):
+        if char in '([{':
+            depth += 1
+        elif char in ')]}':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(arguments[start:pos])
+            start = pos + 1
+    parts.append(arguments[start:])
+    return [part for part in parts if part.strip()]
+
+
+def _assignments(profile):
+    """{variable: valores que se le asignan} del cuerpo, de una pasada (se guarda en el perfil)
+
+    Cada búsqueda sigue desde el valor de la anterior, así que también se
+    ven las asignaciones encadenadas (a = b = 0).
+    """
+    assignments = profile['assignments']
+    if assignments is None:
+        assignments, ends = {}, {}
+        body = profile['body']
+        match = ASSIGNMENT.search(body)
+        while match:
+            name = match.group(1)
+            if match.start() >= ends.get(name, 0):
+                assignments.setdefault(name, []).append(match.group('value'))
+                ends[name] = match.end()
+            match = ASSIGNMENT.search(body, match.start('value'))
+        profile['assignments'] = assignments
+    return assignments
+
+
+def _is_halved(name, profile):
+    """True si alguna asignación a `name` divide un valor (mid = (lo + hi) / 2)"""
+    return any(DIVISOR.search(value) for value in _assignments(profile).get(name, ()))
+
+
+def argument_shrink(text, profile, depth=0):
+    """Cómo encoge el tamaño al pasar `text` como argumento en una llamada recursiva"""
+    params = profile['params']
+
+    divisor = DIVISOR.search(text)
+    if divisor:
+        factor = int(divisor.group(1)) if divisor.group(1) else 2 ** int(divisor.group(2))
+        if factor >= 2:
+            return ('divide', factor)
+    if DOUBLING.search(text) or PARTITION_CALL.search(text):
+        return ('divide', 2)  # índices 2i + 1 (montículos) o partición tipo quicksort
+    if ELEMENT_REMOVAL.search(text):
+        return ('subtract', 1)  # arr.slice(0, i).concat(arr.slice(i + 1)), permutaciones
+    slice_call = SLICE_CALL.search(text)
+    if slice_call and any(_is_halved(name, profile) for name in CONDITION_VARIABLE.findall(slice_call.group(1))):
+        return ('divide', 2)  # slice(0, mid), slice(mid)
+    if CONSTANT_SLICE.search(text):
+        return ('subtract', 1)  # slice(1)
+
+    offset = CONSTANT_OFFSET.match(text)
+    identifier = BARE_IDENTIFIER.match(text)
+    name = offset.group(1) if offset else identifier.group(1) if identifier else None
+    if offset and name in params:
+        return ('subtract', 1)  # n - 1, i + 1
+    if name is not None and name not in params:
+        if name in profile['loop_variables']:
+            return ('structural', 1)  # for (const child of node.children)
+        if depth < _MAX_RESOLVE_DEPTH:
+            # Variable local: encoge como los valores que se le asignan
+            best = ('unknown', 1)
+            for value in _assignments(profile).get(name, ()):
+                shrink = argument_shrink(value, profile, depth + 1)
+                if SHRINK_RANK[shrink[0]] > SHRINK_RANK[best[0]]:
+                    best = shrink
+            return best
+
+    if PROPERTY_ACCESS.match(text):
+        return ('structural', 1)  # node.left, tree[i]
+    return ('unknown', 1)
+
+
+def _loop_counters(loop, body):
+    """Variables que cambian en cada vuelta de `loop`; vacío si sus vueltas son fijas o desconocidas"""
+    if loop['trip'] in ('constant', 'unknown'):
+        return set()
+    if loop['kind'] == 'for':
+        parts = loop['header'].split(';')
+        if len(parts) != 3:
+            return set(FOR_OF_VARIABLE.findall(loop['header']))  # for (const x of xs)
+        return set(CONDITION_VARIABLE.findall(parts[2]))  # i++, j *= 2
+    loop_body = body[loop['body_start']:loop['body_end']]
+    return {name for name in CONDITION_VARIABLE.findall(loop['header'])
+            if counter_step_pattern(name).search(loop_body)}
+
+
+def loop_dependents(profile, start):
+    """Contador del bucle que empieza en `start` y variables que su cuerpo escribe a partir de él
+
+    rest = a.slice(0, i).concat(...), path.push(i), used[i] = true: cambian
+    en cada vuelta. Se calcula una vez por bucle y se guarda en el perfil.
+    """
+    dependents = profile['dependents'].get(start)
+    if dependents is None:
+        loop, body = profile['loop_index'][start], profile['body']
+        dependents = _loop_counters(loop, body)
+        if dependents:
+            writes = [(match.group(1), set(CONDITION_VARIABLE.findall(
+                match.group('value') or match.group('args') or match.group('index') or '')))
+                for match in VARIABLE_WRITE.finditer(body, loop['body_start'], loop['body_end'])]
+            for _ in range(_MAX_RESOLVE_DEPTH):
+                added = {name for name, used in writes if name not in dependents and used & dependents}
+                if not added:
+                    break
+                dependents |= added
+        profile['dependents'][start] = dependents
+    return dependents
+
+
+def call_shrink(call, profile):
+    """El argumento que más encoge el tamaño en una llamada (se guarda en la llamada)
+
+    También guarda varies: si algún argumento cambia con el contador de un
+    bucle que rodea la llamada (una rama distinta en cada vuelta).
+    """
+    if call['shrink'] is None:
+        best = ('unknown', 1)
+        for argument in _split_arguments(call['arguments']):
+            shrink = argument_shrink(argument, profile)
+            if SHRINK_RANK[shrink[0]] > SHRINK_RANK[best[0]]:
+                best = shrink
+        names = set(CONDITION_VARIABLE.findall(call['arguments']))
+        call['varies'] = any(names & loop_dependents(profile, start) for start in call['loops'])
+        call['shrink'] = best
+    return call['shrink']
+
+
+def profile_function(header, body):
+    """Perfil de una función que solo depende de su texto
+
+    Devuelve un dict con params, body, loop_variables, loops (los de
+    Backend.loops, con trip), loop_index (bucle por su inicio), array_work
+    (operaciones de array por los bucles que las rodean), calls (callee,
+    position, arguments, product, loops (inicio de los bucles que la
+    rodean), statement, y shrink y varies, que se calculan al resolver),
+    dependents (de loop_dependents) y assignments (valores asignados a
+    cada variable), estos dos también al resolver.
+    """
+    params_match = PARAMETER_LIST.search(header)
+    params = set()
+    if params_match:
+        params = set(CONDITION_VARIABLE.findall(params_match.group(1) or params_match.group(2) or ''))
+
+    loops = analyze_loops(body)['loops']
+    _, pairs = match_brackets(body)
+
+    array_work = CONSTANT_COST
+    for product in _loop_products(loops, [match.start() for match in LINEAR_WORK.finditer(body)]):
+        array_work = max(array_work, multiply(product, LINEAR_COST))
+    for product in _loop_products(loops, [match.start() for match in SORT_WORK.finditer(body)]):
+        array_work = max(array_work, multiply(product, SORT_COST))
+
+    sites = [match for match in CALL_SITE.finditer(body)
+             if not DECLARATION_KEYWORD.search(body, max(0, match.start() - _DECLARATION_LOOKBEHIND), match.start())]
+    separators = [match.start() for match in STATEMENT_SEPARATOR.finditer(body)]
+    returns = [match.span() for match in RETURN_KEYWORD.finditer(body)]
+    calls = []
+    for match, (product, enclosing) in zip(sites, _enclosing_loops(loops, [match.start() for match in sites])):
+        start = match.start()
+        open_pos = match.end() - 1
+        close = pairs.get(open_pos)
+        calls.append({
+            'callee': match.group('callee'),
+            'position': start,
+            'arguments': body[open_pos + 1:close] if close is not None else '',
+            'product': product,
+            'loops': [loop['start'] for loop, _ in enclosing],
+            'statement': _return_statement(separators, returns, start),
+            'shrink': None,
+            'varies': None,
+        })
+
+    return {
+        'params': params,
+        'body': body,
+        'loop_variables': set(FOR_OF_VARIABLE.findall(body)),
+        'loops': loops,
+        'loop_index': {loop['start']: loop for loop in loops},
+        'array_work': array_work,
+        'calls': calls,
+        'dependents': {},
+        'assignments': None,
+    }
+
+
+# ============================================================================
+# SOLVER CON CACHÉ
+# ============================================================================
+
+class RecurrenceSolver:
+    """Coste de todas las funciones de un código, con los perfiles cacheados por función
+
+    Las funciones se resuelven por componentes del grafo de llamadas en
+    orden topológico inverso: cuando se resuelve una, ya se conoce el
+    coste de todas las funciones a las que llama fuera de su componente.
+    """
+
+    def __init__(self, max_functions=4096):
+        self.max_functions = max_functions
+        self._profiles = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def solve(self, code):
+        """{nombre: resultado} con complexity, cost, recursive, method, calls, shrinks y certain"""
+        table = build_function_table(code)
+        profiles = [self._profile(code[function['start']:function['body_start']],
+                                  code[function['body_start']:function['body_end']]) for function in table]
+        return self.solve_profiles(table, profiles)
+
+    def solve_profiles(self, table, profiles):
+        """Como solve, con la tabla de funciones y el perfil de cada una (en el mismo orden)
+
+        Los perfiles pueden venir de reduce_profile: así no hace falta tener
+        el código entero en memoria.
+        """
+        graph = build_call_graph(table)
+        by_name = {}
+        for function, profile in zip(table, profiles):
+            by_name.setdefault(function['name'], []).append(profile)
+
+        costs = {}
+        results = {}
+        for component in strongly_connected_components(graph):
+            members = set(component)
+            recursive = len(component) > 1 or component[0] in graph[component[0]]
+            for name in component:
+                result = None
+                for profile in by_name[name]:
+                    candidate = self._solve_profile(profile, members if recursive else set(), costs)
+                    if result is None or candidate['cost'] > result['cost']:
+                        result = candidate
+                results[name] = result
+            # Los miembros de un ciclo se llaman entre sí: comparten el coste mayor
+            component_cost = max(results[name]['cost'] for name in component)
+            for name in component:
+                costs[name] = component_cost
+
+        return results
+
+    def dominant(self, code):
+        """(complejidad, segura) del código si tiene funciones recursivas; None si no
+
+        Es la mayor entre el coste de cada función y los bucles del resto del código.
+        """
+        results = self.solve(code)
+        if not any(result['recursive'] for result in results.values()):
+            return None
+        structure = analyze_loops(code)
+        return dominant_bound(results, structure['degree'], structure['log_degree'])
+
+    def _solve_profile(self, profile, members, costs):
+        """Coste de una función: recurrencia si llama a su componente, trabajo propio si no"""
+        loops = profile['loops']
+        recursive_calls = [call for call in profile['calls'] if call['callee'] in members]
+
+        # Un bucle que reparte llamadas estructurales (for (const child of node.children))
+        # recorre la estructura junto con la recursión: no es trabajo de cada llamada.
+        # Tampoco uno de vueltas desconocidas con una llamada que no cambia con él
+        # (while (lo < hi) { p = partition(...); qs(arr, lo, p - 1); lo = p + 1; }):
+        # sus vueltas son las llamadas de la recursión sobre el resto.
+        excluded = set()
+        trips = {loop['start']: loop['trip'] for loop in loops}
+        for call in recursive_calls:
+            if call_shrink(call, profile)[0] == 'structural':
+                excluded.update(call['loops'])
+            elif not call['varies']:
+                excluded.update(start for start in call['loops'] if trips[start] == 'unknown')
+
+        work = max(profile['array_work'], _nest_work(loops, excluded))
+        for call in profile['calls']:
+            if call['callee'] in costs and call['callee'] not in members:
+                product = _without_loops(call, trips, excluded) if excluded else call['product']
+                work = max(work, multiply(product, costs[call['callee']]))
+
+        if not recursive_calls:
+            return {'complexity': cost_to_complexity(work), 'cost': work, 'recursive': False,
+                    'method': None, 'calls': 0, 'shrinks': [], 'certain': True}
+
+        calls = effective_calls(recursive_calls)
+        cost, method = solve_recurrence(calls, work)
+        return {
+            'complexity': cost_to_complexity(cost),
+            'cost': cost,
+            'recursive': True,
+            'method': method,
+            'calls': len(calls),
+            'shrinks': [call['shrink'] for call in calls],
+            'certain': all(call['shrink'][0] != 'unknown' for call in calls),
+        }
+
+    def _profile(self, header, body):
+        """Perfil de la función (de la caché si su texto ya se analizó)"""
+        key = hashlib.blake2b(f"{header}\0{body}".encode('utf-8', 'surrogatepass'), digest_size=20).digest()
+        with self._lock:
+            profile = self._profiles.get(key)
+            if profile is not None:
+                self._profiles.move_to_end(key)
+                self.hits += 1
+                return profile
+            self.misses += 1
+
+        profile = profile_function(header, body)
+        with self._lock:
+            self._profiles[key] = profile
+            while len(self._profiles) > self.max_functions:
+                self._profiles.popitem(last=False)
+        return profile
+
+    def clear(self):
+        """Vacía la caché de perfiles"""
+        with self._lock:
+            self._profiles.clear()
+
+
+def dominant_bound(results, degree, log_degree):
+    """(complejidad, segura) de RecurrenceSolver.dominant a partir de solve y de los bucles"""
+    recursive = [result for result in results.values() if result['recursive']]
+    cost = max([result['cost'] for result in results.values()] + [(0, degree, log_degree)])
+    return cost_to_complexity(cost), all(result['certain'] for result in recursive)
+
+
+def reduce_profile(profile, names, recursive):
+    """Lo que solve_profiles necesita de un perfil, sin el texto de la función
+
+    Solo se guardan las llamadas a `names` (las funciones del código). Si
+    la función es `recursive` se calcula ya cómo encoge cada llamada; si
+    no, basta el bucle más caro alrededor de cada función llamada y el
+    trabajo de sus bucles.
+    """
+    calls = [call for call in profile['calls'] if call['callee'] in names]
+    if recursive:
+        for call in calls:
+            call_shrink(call, profile)
+        loops = [{key: loop[key] for key in ('start', 'body_start', 'body_end', 'trip')} for loop in profile['loops']]
+        return {'loops': loops, 'array_work': profile['array_work'], 'calls': calls}
+
+    # Sin recursión: el coste es el trabajo propio o una llamada por sus bucles
+    strongest = {}
+    for call in calls:
+        if call['callee'] not in strongest or call['product'] > strongest[call['callee']]['product']:
+            strongest[call['callee']] = call
+    work = max(profile['array_work'], _nest_work(profile['loops'], ()))
+    return {'loops': [], 'array_work': work, 'calls': list(strongest.values())}
+
+
+# Perfil de una función de la que no se tiene el texto (sin coste propio)
+EMPTY_PROFILE = {'loops': [], 'array_work': CONSTANT_COST, 'calls': []}
+
+
+# Solver compartido (con su caché) para SimpleNeuralNetwork.predict
+DEFAULT_SOLVER = RecurrenceSolver()
+
+
+def solve_recurrences(code):
+    """RecurrenceSolver.solve con el solver compartido"""
+    return DEFAULT_SOLVER.solve(code)
+
+
+def recurrence_bound(code):
+    """RecurrenceSolver.dominant con el solver compartido"""
+    return DEFAULT_SOLVER.dominant(code)
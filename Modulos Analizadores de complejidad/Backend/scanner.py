@@ -0,0 +1,682 @@
+"""
+SCANNER - Extracción de características en una sola pasada
+Recorre el código JavaScript una única vez con un patrón maestro
+y acumula los 20 contadores que usa CodeFeatureExtractor. El código
+puede llegar por trozos (archivos, flujos o mmap) sin cargarlo entero.
+En el mismo recorrido se construye la tabla de funciones (nombre,
+cuerpo y llamadas que hace) emparejando llaves; de ella sale el grafo
+de llamadas que cuenta la recursión directa y mutua.
+"""
+
+import codecs
+import io
+import mmap
+import os
+from collections import deque
+
+from Backend.callgraph import build_call_graph, recursion_metrics
+from Backend.patterns import (
+    TOKEN_PATTERN,
+    LEADING_WHITESPACE,
+    FUNCTION_TAILS,
+    FUNCTION_ASSIGNMENT,
+    FUNCTION_HEADER,
+    FUNCTION_HEADER_PREFIX,
+    EXPRESSION_TOKEN,
+    SCOPE_TOKEN,
+    CALL_SITE,
+    DECLARATION_KEYWORD,
+    RANGE_VARIABLE,
+    MIDPOINT_VARIABLE,
+)
+
+
+# Versión del vector de características: incrementarla cuando cambie
+# cualquiera de los 20 valores (invalida las cachés de resultados)
+FEATURE_VERSION = 4
+
+# Longitud del vector de características
+FEATURE_COUNT = 20
+
+# Caracteres que se leen por trozo y margen que se deja sin procesar al
+# final del búfer: las coincidencias cuyos lookaheads (cuerpo de función,
+# espacios) no excedan este margen dan el mismo resultado que scan()
+DEFAULT_CHUNK_SIZE = 1 << 20
+LOOKAHEAD_WINDOW = 1 << 16
+
+# Longitud máxima de las palabras de RANGE_VARIABLE / MIDPOINT_VARIABLE
+_HINT_OVERLAP = 8
+
+# Un comentario de bloque o una plantilla sin cerrar al final del búfer se
+# deja para el siguiente trozo mientras no supere este tamaño
+MAX_DEFERRED_TOKEN = 1 << 22
+
+# Margen tras el texto procesado para reconocer `nombre  (` en el límite
+_CALL_OVERLAP = 256
+
+# Texto anterior a una llamada en el que se busca `function` (definición anidada)
+_DECLARATION_LOOKBEHIND = 16
+
+# Una expresión sigue en la línea siguiente si la línea acaba en uno de
+# estos caracteres (operador pendiente) o la siguiente empieza por otro
+_CONTINUES_BEFORE = frozenset('=+-*/%&|^<>!?:.,([{~')
+_CONTINUES_AFTER = frozenset('=+-*/%&|^<>?:.,([`')
+
+
+# ============================================================================
+# CLASIFICACIÓN DE COINCIDENCIAS
+# ============================================================================
+
+ARRAY_METHODS = frozenset(('push', 'pop', 'map', 'filter', 'reduce', 'forEach', 'find', 'some', 'every'))
+SEARCH_METHODS = frozenset(('indexOf', 'includes', 'findIndex'))
+SORT_METHODS = frozenset(('sort', 'reverse'))
+STRING_METHODS = frozenset(('substring', 'slice', 'split', 'replace', 'charAt', 'charCodeAt'))
+
+# Coincidencias que no exigen límite de palabra antes del literal
+UNBOUNDED_KINDS = frozenset(('function', 'fib', 'promise', 'object', 'json', 'colon', 'arrow'))
+
+
+def _is_word_char(char):
+    """Equivalente a `\\w` de `re` para un carácter"""
+    return char.isalnum() or char == '_'
+
+
+# ============================================================================
+# TABLA DE FUNCIONES
+# ============================================================================
+
+def _expression_end(code, pos, limit, final):
+    """Fin del cuerpo sin llaves de una flecha que empieza en `pos` (relativo)
+
+    Es el primer `;`, `,` o cierre sin pareja fuera de paréntesis, llaves y
+    corchetes, o el primer salto de línea tras el que la expresión no sigue.
+    Si no hay ninguno es el final del código. Mientras no sea el último
+    trozo, solo vale lo que empieza antes de `limit`: si no, devuelve None
+    y se vuelve a buscar con el trozo siguiente.
+    """
+    length = len(code)
+    if not final and length - pos > MAX_DEFERRED_TOKEN:
+        final = True  # expresión demasiado larga: termina con el búfer
+    depth = 0
+    for match in EXPRESSION_TOKEN.finditer(code, pos):
+        start = match.start()
+        if not final and start >= limit:
+            return None
+        kind = match.lastgroup
+        if kind is None:
+            if not final and match.end() == length:
+                return None  # comentario o plantilla que quizá sigue
+        elif kind == 'open':
+            depth += 1
+        elif kind == 'close':
+            if not depth:
+                return start
+            depth -= 1
+        elif depth:
+            continue
+        elif kind == 'separator':
+            return start
+        else:
+            before = start - 1
+            while code[before].isspace():
+                before -= 1
+            after = start + 1
+            while after < length and code[after].isspace():
+                after += 1
+            if after == length:
+                return start if final else None
+            if code[before] not in _CONTINUES_BEFORE and code[after] not in _CONTINUES_AFTER:
+                return start
+    return length if final else None
+
+
+class FunctionTableBuilder:
+    """Empareja llaves y registra las funciones de un código que llega por trozos
+
+    Cada entrada terminada es un dict con name, start y end (la definición
+    completa), body_start y body_end (entre las llaves, o la expresión de
+    una flecha sin llaves), depth (llaves que la encierran) y calls
+    ({nombre: veces} de las llamadas hechas en su propio cuerpo, sin contar
+    cadenas, comentarios ni funciones con nombre anidadas). Además de las
+    declaraciones y asignaciones de funciones y flechas se registran los
+    métodos de clases y objetos. Todas las posiciones son absolutas. Las
+    llamadas se cuentan a medida que avanza el texto, así el cuerpo no
+    tiene que seguir en memoria cuando se cierra la función.
+    """
+
+    __slots__ = ('functions', '_stack', '_open', '_headers', '_methods', '_arrows', '_expressions',
+                 '_header_end', '_header_resume', '_scope_resume', '_call_resume')
+
+    def __init__(self):
+        self.functions = []
+        self._stack = []
+        self._open = []
+        self._headers = {}
+        self._methods = set()
+        self._arrows = deque()
+        self._expressions = []
+        self._header_end = 0
+        self._header_resume = 0
+        self._scope_resume = 0
+        self._call_resume = 0
+
+    @property
+    def resume(self):
+        """Primera posición absoluta que todavía hay que conservar en el búfer"""
+        return min(self._header_resume, self._scope_resume, self._call_resume)
+
+    def table(self):
+        """Funciones terminadas ordenadas por posición"""
+        return sorted(self.functions, key=lambda function: function['start'])
+
+    def consume(self, code, base, limit, final):
+        """Procesa las cabeceras y llaves de `code` que empiezan antes de `limit`"""
+        length = len(code)
+
+        # Cabeceras con `{`: posición de su `{` -> (nombre, inicio); flechas
+        # sin llaves: en _arrows hasta que el recorrido llega a su cuerpo
+        pos = self._header_resume - base
+        while True:
+            match = FUNCTION_HEADER.search(code, pos)
+            if not match or match.start() >= limit:
+                break
+            start = match.start()
+            end = match.end()
+            name = match.group('name') or match.group('var') or match.group('method')
+            if code[end - 1] == '{':
+                self._headers[base + end - 1] = (name, base + start)
+                if match.group('method'):
+                    # `parse(...) {` no es una llamada a parse
+                    self._methods.add(base + start)
+            elif base + start >= self._header_end:
+                body_end = _expression_end(code, end, limit, final)
+                if body_end is None:
+                    # El final de la expresión llega con el siguiente trozo
+                    limit = start
+                    break
+                self._arrows.append({
+                    'name': name,
+                    'start': base + start,
+                    'end': base + body_end,
+                    'body_start': base + end,
+                    'body_end': base + body_end,
+                    'depth': None,
+                    'calls': {},
+                })
+            self._header_end = base + end
+            pos = end
+        resume = max(pos, min(limit, length))
+        if not final:
+            # Una cabecera cortada al final del búfer se busca de nuevo con el siguiente trozo
+            partial = FUNCTION_HEADER_PREFIX.search(code, pos)
+            if partial and partial.start() < resume:
+                resume = partial.start()
+            # Llaves y llamadas solo hasta donde ya se conocen las cabeceras
+            limit = min(limit, resume)
+        self._header_resume = base + resume
+
+        stack = self._stack
+        open_functions = self._open
+        arrows, expressions = self._arrows, self._expressions
+        pos = self._scope_resume - base
+        deferred = None
+        for match in SCOPE_TOKEN.finditer(code, pos):
+            start = match.start()
+            if start >= limit:
+                break
+            end = match.end()
+            kind = match.lastgroup
+
+            if kind is None and not final and end == length and end - start <= MAX_DEFERRED_TOKEN:
+                # Comentario o plantilla que quizá sigue en el próximo trozo
+                deferred = start
+                break
+
+            if arrows or expressions:
+                self._expression_events(code, base, base + start)
+
+            # El texto anterior al token pertenece a la función más interna
+            if open_functions:
+                self._search_calls(code, base, start)
+            self._call_resume = base + end
+
+            if kind == 'open':
+                header = self._headers.pop(base + start, None)
+                if header is None:
+                    stack.append(None)
+                else:
+                    frame = {
+                        'name': header[0],
+                        'start': header[1],
+                        'end': None,
+                        'body_start': base + end,
+                        'body_end': None,
+                        'depth': len(stack),
+                        'calls': {},
+                    }
+                    stack.append(frame)
+                    open_functions.append(frame)
+            elif kind == 'close' and stack:
+                frame = stack.pop()
+                if frame is not None:
+                    if open_functions[-1] is frame:
+                        open_functions.pop()
+                    else:
+                        # Con paréntesis sin cerrar, una flecha sin llaves puede seguir abierta
+                        open_functions.remove(frame)
+                    frame['body_end'] = base + start
+                    frame['end'] = base + end
+                    self.functions.append(frame)
+            pos = end
+
+        if deferred is not None:
+            self._scope_resume = base + deferred
+        else:
+            self._scope_resume = base + max(pos, min(limit, length))
+        if arrows or expressions:
+            self._expression_events(code, base, self._scope_resume)
+        self._search_calls(code, base, self._scope_resume - base)
+
+        # Al final del código, las funciones sin `}` terminan con él
+        if final:
+            end = base + length
+            while stack:
+                frame = stack.pop()
+                if frame is not None:
+                    frame['body_end'] = frame['end'] = end
+                    self.functions.append(frame)
+            open_functions.clear()
+
+        # Cabeceras que ya no pueden abrir ninguna llave pendiente
+        if self._headers:
+            self._headers = {brace: header for brace, header in self._headers.items()
+                             if brace >= self._scope_resume}
+        if self._methods:
+            self._methods = {method for method in self._methods if method >= self._call_resume}
+
+    def _expression_events(self, code, base, upto):
+        """Abre y cierra los cuerpos de flechas sin llaves que empiezan o acaban hasta `upto`"""
+        arrows = self._arrows
+        expressions = self._expressions
+        while True:
+            closing = expressions[-1]['body_end'] if expressions else None
+            opening = arrows[0]['body_start'] if arrows else None
+            if closing is not None and closing <= upto and (opening is None or closing <= opening):
+                self._search_calls(code, base, closing - base)
+                frame = expressions.pop()
+                self._open.remove(frame)
+                self.functions.append(frame)
+            elif opening is not None and opening <= upto:
+                self._search_calls(code, base, opening - base)
+                frame = arrows.popleft()
+                frame['depth'] = len(self._stack)
+                expressions.append(frame)
+                self._open.append(frame)
+            else:
+                break
+
+    def _search_calls(self, code, base, upto):
+        """Cuenta las llamadas entre lo ya buscado y `upto` (relativo al búfer)"""
+        start = self._call_resume - base
+        if upto <= start:
+            return
+        resume = upto
+        if self._open:
+            calls = self._open[-1]['calls']
+            methods = self._methods
+            for match in CALL_SITE.finditer(code, start, min(len(code), upto + _CALL_OVERLAP)):
+                if match.start() >= upto:
+                    break
+                call_start = match.start()
+                if (not (methods and base + call_start in methods) and
+                        not DECLARATION_KEYWORD.search(code, max(0, call_start - _DECLARATION_LOOKBEHIND), call_start)):
+                    callee = match.group('callee')
+                    calls[callee] = calls.get(callee, 0) + 1
+                resume = max(resume, match.end())
+        self._call_resume = base + resume
+
+
+# ============================================================================
+# SCANNER INCREMENTAL
+# ============================================================================
+
+class StreamingScanner:
+    """Acumula las 20 características sobre código que llega por trozos
+
+    El estado (contadores, anidación de la línea en curso, fin de la última
+    coincidencia de cada tipo) se conserva entre trozos. Del búfer solo se
+    guarda la parte aún no procesada y un poco de contexto anterior.
+    Con track_hints=True también registra si aparecen variables de rango y
+    de punto medio (las pistas de búsqueda binaria de predict).
+    """
+
+    __slots__ = (
+        'track_hints', 'window', 'has_range_variable', 'has_midpoint_variable', '_hint_tail', '_features',
+        '_buffer', '_base', '_resume', '_started',
+        'lines', 'for_loops', 'while_loops', 'array_ops', 'search_ops', 'sort_ops', 'string_methods',
+        'var_decls', 'if_count', 'switch_count', 'func_count', 'object_ops', 'json_ops', 'try_catch',
+        'async_ops', 'recursion_count', 'has_fib_call', 'nesting', 'max_nesting', 'line_opens',
+        'line_closes', 'max_indent', 'decl_end', 'func_end', 'function_table', 'recursion',
+    )
+
+    def __init__(self, track_hints=False, window=LOOKAHEAD_WINDOW):
+        self.track_hints = track_hints
+        self.window = window
+        self.has_range_variable = False
+        self.has_midpoint_variable = False
+        self._hint_tail = ''
+        self._features = None
+
+        # Búfer y posiciones absolutas (desde el inicio del código)
+        self._buffer = ''
+        self._base = 0
+        self._resume = 0
+        self._started = False
+
+        self.lines = 1
+        self.for_loops = self.while_loops = 0
+        self.array_ops = self.search_ops = self.sort_ops = self.string_methods = 0
+        self.var_decls = self.if_count = self.switch_count = self.func_count = 0
+        self.object_ops = self.json_ops = self.try_catch = self.async_ops = 0
+        self.recursion_count = 0
+        self.has_fib_call = False
+        self.nesting = self.max_nesting = self.line_opens = self.line_closes = 0
+        self.max_indent = 0
+        self.decl_end = self.func_end = 0
+        self.function_table = FunctionTableBuilder()
+        self.recursion = None
+
+    def feed(self, text):
+        """Añade un trozo de código y procesa lo que ya no puede cambiar"""
+        if self._features is not None:
+            raise ValueError("El scanner ya terminó: no admite más código")
+        if not text:
+            return
+
+        if self.track_hints and not (self.has_range_variable and self.has_midpoint_variable):
+            window = self._hint_tail + text
+            self.has_range_variable = self.has_range_variable or RANGE_VARIABLE.search(window) is not None
+            self.has_midpoint_variable = self.has_midpoint_variable or MIDPOINT_VARIABLE.search(window) is not None
+            self._hint_tail = window[-_HINT_OVERLAP:]
+
+        self._buffer = self._buffer + text if self._buffer else text
+        if len(self._buffer) - (self._resume - self._base) > self.window:
+            self._consume(final=False)
+            self._trim()
+
+    def feed_stream(self, stream, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Lee un objeto archivo (texto o binario UTF-8) hasta el final"""
+        decoder = None
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            if isinstance(chunk, bytes):
+                decoder = decoder or _utf8_decoder()
+                chunk = decoder.decode(chunk)
+            self.feed(chunk)
+        if decoder is not None:
+            self.feed(decoder.decode(b'', final=True))
+
+    def feed_file(self, path, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Lee un archivo mapeándolo en memoria, trozo a trozo"""
+        for text in read_file_chunks(path, chunk_size):
+            self.feed(text)
+
+    def finish(self):
+        """Procesa el resto del búfer y devuelve el vector de 20 características"""
+        if self._features is None:
+            self._consume(final=True)
+            self.recursion = recursion_metrics(build_call_graph(self.function_table.functions))
+            self.recursion_count = self.recursion['recursive_functions']
+            self._features = self._vector()
+            self._buffer = ''
+        return list(self._features)
+
+    def functions(self):
+        """Tabla de funciones terminadas (ver FunctionTableBuilder), ordenada por posición"""
+        return self.function_table.table()
+
+    def _trim(self):
+        """Descarta el texto procesado, conservando el contexto que se mira hacia atrás"""
+        code = self._buffer
+        keep = min(self._resume, self.function_table.resume) - self._base
+        # Los nombres (`nombre: function`) y el límite de palabra se buscan
+        # hacia atrás sobre letras y espacios: conservar hasta el delimitador
+        while keep and (code[keep - 1].isspace() or _is_word_char(code[keep - 1])):
+            keep -= 1
+        keep = max(keep - 1, 0)
+        if keep:
+            self._buffer = code[keep:]
+            self._base += keep
+
+    def _consume(self, final):
+        """Procesa las coincidencias del búfer que empiezan antes del margen"""
+        code = self._buffer
+        base = self._base
+        length = len(code)
+        limit = length if final else length - self.window
+
+        if not self._started:
+            first_indent = LEADING_WHITESPACE.match(code).end()
+            if first_indent == length and not final:
+                return
+            self.max_indent = first_indent if first_indent < length and not code[first_indent].isspace() else 0
+            self._started = True
+
+        lines = self.lines
+        for_loops, while_loops = self.for_loops, self.while_loops
+        array_ops, search_ops = self.array_ops, self.search_ops
+        sort_ops, string_methods = self.sort_ops, self.string_methods
+        var_decls, if_count = self.var_decls, self.if_count
+        switch_count, func_count = self.switch_count, self.func_count
+        object_ops, json_ops = self.object_ops, self.json_ops
+        try_catch, async_ops = self.try_catch, self.async_ops
+        has_fib_call = self.has_fib_call
+
+        # Anidación por línea: se aplican aperturas y cierres al final de cada línea
+        nesting, max_nesting = self.nesting, self.max_nesting
+        line_opens, line_closes = self.line_opens, self.line_closes
+
+        # Indentación máxima entre las líneas no vacías
+        max_indent = self.max_indent
+
+        # Fin de la última coincidencia contada, para no contar solapamientos
+        # (mismo comportamiento que `re.findall` patrón por patrón)
+        decl_end = self.decl_end - base
+        func_end = self.func_end - base
+
+        resume = self._resume - base
+        for match in TOKEN_PATTERN.finditer(code, resume):
+            start = match.start()
+            if start >= limit:
+                break
+            resume = match.end()
+            kind = match.lastgroup
+
+            if kind == 'indent':
+                lines += 1
+                if line_opens or line_closes:
+                    nesting = max(0, nesting + line_opens - line_closes)
+                    max_nesting = max(max_nesting, nesting)
+                    line_opens = line_closes = 0
+                end = match.end()
+                indent = end - start - 1
+                if indent > max_indent and end < length and not code[end].isspace():
+                    max_indent = indent
+                continue
+
+            if kind == 'close':
+                line_closes += 1
+                continue
+
+            if kind == 'method_ws':
+                name = match.group('method')
+                if name in ARRAY_METHODS:
+                    array_ops += 1
+                elif name in SEARCH_METHODS:
+                    search_ops += 1
+                elif name in SORT_METHODS:
+                    sort_ops += 1
+                elif name in STRING_METHODS:
+                    string_methods += 1
+                elif name in ('then', 'catch') and not match.group('method_ws'):
+                    async_ops += 1
+                continue
+
+            # Las palabras clave deben empezar en un límite de palabra (\b)
+            if kind not in UNBOUNDED_KINDS and start and _is_word_char(code[start - 1]):
+                continue
+
+            if kind == 'for_br':
+                if match.group('for_br') == '(':
+                    for_loops += 1
+                if '\n' not in match.group('for_ws'):
+                    line_opens += 1
+            elif kind == 'while_br':
+                if match.group('while_br') == '(':
+                    while_loops += 1
+                if '\n' not in match.group('while_ws'):
+                    line_opens += 1
+            elif kind == 'do_ws':
+                if '\n' not in match.group('do_ws'):
+                    line_opens += 1
+            elif kind == 'if_':
+                if_count += 1
+            elif kind == 'switch':
+                switch_count += 1
+            elif kind == 'try_':
+                try_catch += 1
+            elif kind in ('let_', 'const', 'var'):
+                if start >= decl_end:
+                    var_decls += 1
+                    decl_end = match.end(kind)
+            elif kind in ('async_', 'promise'):
+                async_ops += 1
+            elif kind == 'object':
+                object_ops += 1
+            elif kind == 'json':
+                json_ops += 1
+            elif kind == 'fib':
+                has_fib_call = True
+            elif kind in ('colon', 'arrow'):
+                # `nombre: function` o `nombre = ()`: buscar el nombre hacia atrás
+                name_end = start
+                while name_end and code[name_end - 1].isspace():
+                    name_end -= 1
+                name_start = name_end
+                while name_start and _is_word_char(code[name_start - 1]):
+                    name_start -= 1
+                if name_start == name_end or name_start < func_end:
+                    continue
+                func_count += 1
+                func_end = FUNCTION_TAILS[kind].match(code, match.end()).end()
+                # `nombre: functionX = ()` continúa a mitad de palabra
+                while func_end < length and _is_word_char(code[func_end]):
+                    tail = FUNCTION_ASSIGNMENT.match(code, func_end)
+                    if not tail:
+                        break
+                    func_count += 1
+                    func_end = tail.end()
+            elif kind == 'function':
+                if start >= func_end and not (start and _is_word_char(code[start - 1])):
+                    func_count += 1
+                    func_end = match.end('func_sig')
+
+        if final and (line_opens or line_closes):
+            nesting = max(0, nesting + line_opens - line_closes)
+            max_nesting = max(max_nesting, nesting)
+            line_opens = line_closes = 0
+
+        self._resume = base + max(resume, min(limit, length))
+        self.lines = lines
+        self.for_loops, self.while_loops = for_loops, while_loops
+        self.array_ops, self.search_ops = array_ops, search_ops
+        self.sort_ops, self.string_methods = sort_ops, string_methods
+        self.var_decls, self.if_count = var_decls, if_count
+        self.switch_count, self.func_count = switch_count, func_count
+        self.object_ops, self.json_ops = object_ops, json_ops
+        self.try_catch, self.async_ops = try_catch, async_ops
+        self.has_fib_call = has_fib_call
+        self.nesting, self.max_nesting = nesting, max_nesting
+        self.line_opens, self.line_closes = line_opens, line_closes
+        self.max_indent = max_indent
+        self.decl_end = base + decl_end
+        self.func_end = base + func_end
+
+        self.function_table.consume(code, base, limit, final)
+
+    def _vector(self):
+        """Vector final de características a partir de los contadores"""
+        recursion_count = 1 if self.has_fib_call else self.recursion_count
+        total_loops = self.for_loops + self.while_loops
+        complexity_multiplier = total_loops * max(1, self.max_nesting) if total_loops > 0 else 1
+
+        return [
+            self.lines,                 # 1. Número de líneas
+            self.for_loops,             # 2. Bucles for
+            self.while_loops,           # 3. Bucles while
+            self.max_nesting,           # 4. Bucles anidados
+            recursion_count,            # 5. Llamadas recursivas
+            self.array_ops,             # 6. Operaciones de array
+            self.search_ops,            # 7. Operaciones de búsqueda
+            self.sort_ops,              # 8. Operaciones de ordenamiento
+            self.max_indent // 4,       # 9. Profundidad máxima de indentación
+            self.var_decls,             # 10. Variables declaradas
+            self.if_count,              # 11. Condicionales if
+            self.switch_count,          # 12. Switch statements
+            self._base + len(self._buffer),  # 13. Longitud del código
+            self.func_count,            # 14. Número de funciones
+            self.string_methods,        # 15. Métodos de string
+            self.object_ops,            # 16. Operaciones de objeto
+            self.json_ops,              # 17. Operaciones de JSON
+            self.try_catch,             # 18. Try-catch
+            self.async_ops,             # 19. Promesas/async
+            complexity_multiplier,      # 20. Multiplicador de complejidad
+        ]
+
+
+def _utf8_decoder():
+    """Decodificador UTF-8 incremental con saltos de línea universales (como open())"""
+    return io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(errors='replace'), translate=True)
+
+
+def read_file_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Texto de un archivo por trozos, mapeándolo en memoria (decodificado como open())"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        decoder = _utf8_decoder()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            for offset in range(0, len(buffer), chunk_size):
+                yield decoder.decode(buffer[offset:offset + chunk_size])
+        yield decoder.decode(b'', final=True)
+
+
+# ============================================================================
+# SCANNER
+# ============================================================================
+
+class JavaScriptScanner:
+    """Calcula las 20 características de CodeFeatureExtractor en un solo recorrido"""
+
+    @staticmethod
+    def scan(code):
+        """Devuelve el vector de 20 características recorriendo el código una vez"""
+        scanner = StreamingScanner()
+        scanner.feed(code)
+        return scanner.finish()
+
+    @staticmethod
+    def scan_stream(stream, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Vector de características de un objeto archivo leído por trozos"""
+        scanner = StreamingScanner()
+        scanner.feed_stream(stream, chunk_size)
+        return scanner.finish()
+
+    @staticmethod
+    def scan_file(path, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Vector de características de un archivo mapeado en memoria"""
+        scanner = StreamingScanner()
+        scanner.feed_file(path, chunk_size)
+        return scanner.finish()
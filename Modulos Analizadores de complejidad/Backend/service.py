@@ -0,0 +1,296 @@
+"""
+SERVICE - Servicio HTTP/JSON local de análisis
+Servidor asyncio (sin dependencias externas) que mantiene un pool de
+procesos con el modelo ya cargado y atiende análisis sueltos o por lotes.
+Limita el tamaño de las peticiones y el número de análisis en curso:
+cuando el pool está saturado responde 503 con Retry-After en lugar de
+acumular trabajo sin límite.
+
+Rutas:
+    GET  /health          estado, procesos y análisis en curso
+    POST /analyze         {"code": "...", "functions": false}
+    POST /analyze/batch   {"codes": ["...", ...], "functions": false}
+"""
+
+import asyncio
+import json
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from http import HTTPStatus
+
+from Backend.backend import DEFAULT_MODEL_PATH
+from Backend.batch import analyze_code, init_worker
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Límites por defecto de cada petición
+DEFAULT_MAX_BODY = 4 * 1024 * 1024
+DEFAULT_MAX_BATCH = 256
+
+# Línea de petición o cabecera más larga y número máximo de cabeceras
+MAX_LINE = 16 * 1024
+MAX_HEADERS = 64
+
+# Segundos para recibir una petición completa (evita conexiones colgadas)
+REQUEST_TIMEOUT = 30
+
+
+async def _shutdown_pool(pool):
+    """Cierra el pool sin esperar, cancelando lo que siga en cola"""
+    try:
+        pool.shutdown(wait=False, cancel_futures=True)
+    except TypeError:
+        # Python < 3.9 no tiene cancel_futures, y cerrar sin esperar deja
+        # colgada la salida del intérprete: se espera a que terminen, pero
+        # en el ejecutor por defecto para no bloquear el bucle de eventos
+        await asyncio.get_running_loop().run_in_executor(None, partial(pool.shutdown, wait=True))
+
+
+def _init_service_worker(model_path, cache_path=None):
+    """init_worker, ignorando Ctrl+C: el proceso principal es quien cierra el pool"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    init_worker(model_path, cache_path)
+
+
+class HTTPError(Exception):
+    """Error que se devuelve al cliente con su código de estado"""
+
+    def __init__(self, status, message=None, close=False, headers=None):
+        super().__init__(message or status.phrase)
+        self.status = status
+        self.message = message or status.phrase
+        self.close = close
+        self.headers = headers or {}
+
+
+class AnalysisService:
+    """Servicio de análisis con un pool de procesos que cargan el modelo una vez
+
+    `max_pending` es el máximo de fragmentos en análisis o en cola (por
+    defecto, 4 por proceso); un lote cuenta tantos como fragmentos tiene.
+    Por eso `max_batch` nunca supera a `max_pending`: un lote más grande no
+    cabría ni con el servicio libre y se rechaza con 413, no con un 503
+    que el cliente reintentaría sin fin.
+    """
+
+    def __init__(self, model_path=DEFAULT_MODEL_PATH, workers=None, cache_path=None,
+                 max_body=DEFAULT_MAX_BODY, max_batch=DEFAULT_MAX_BATCH, max_pending=None):
+        self.model_path = model_path
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_path = cache_path
+        self.max_body = max_body
+        self.max_pending = max_pending or 4 * self.workers
+        self.max_batch = min(max_batch, self.max_pending)
+        self.pending = 0
+        self.served = 0
+        self.rejected = 0
+        self._pool = None
+        self._server = None
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    def _new_pool(self):
+        return ProcessPoolExecutor(self.workers, initializer=_init_service_worker,
+                                   initargs=(self.model_path, self.cache_path))
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Arranca el pool (precargando el modelo en cada proceso) y el servidor"""
+        self._pool = self._new_pool()
+        # Un análisis vacío por proceso: el modelo queda cargado antes de la primera petición
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._pool, analyze_code, '') for _ in range(self.workers)))
+        self._server = await asyncio.start_server(self._handle_connection, host, port, limit=MAX_LINE)
+        return self._server
+
+    @property
+    def address(self):
+        """(host, puerto) en el que escucha el servidor"""
+        return self._server.sockets[0].getsockname()[:2] if self._server else None
+
+    async def serve_forever(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Atiende peticiones hasta que se cancele (llama a start() si hace falta)"""
+        if self._server is None:
+            await self.start(host, port)
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Cierra el servidor y el pool de procesos"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await _shutdown_pool(pool)
+
+    # ------------------------------------------------------------------
+    # Análisis
+    # ------------------------------------------------------------------
+
+    async def analyze(self, codes, functions=False):
+        """Resultados de analizar `codes` en el pool, en el mismo orden
+
+        Lanza HTTPError 503 si no caben en el límite de análisis en curso.
+        """
+        if self.pending + len(codes) > self.max_pending:
+            self.rejected += 1
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Servicio saturado, reintente más tarde",
+                            headers={'Retry-After': '1'})
+
+        self.pending += len(codes)
+        loop = asyncio.get_running_loop()
+        # El pool al que se envía el trabajo: otra petición puede sustituirlo mientras se espera
+        pool = self._pool
+        try:
+            work = partial(analyze_code, functions=functions)
+            return await asyncio.gather(*(loop.run_in_executor(pool, work, code) for code in codes))
+        except BrokenProcessPool:
+            # Un proceso murió (p. ej. sin memoria): se crea un pool nuevo para las
+            # siguientes, solo una vez aunque fallen a la vez varias peticiones
+            if self._pool is pool:
+                self._pool = self._new_pool()
+                await _shutdown_pool(pool)
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "El pool de análisis se reinició",
+                            headers={'Retry-After': '1'})
+        except asyncio.CancelledError:
+            # Cerrar el pool roto cancela lo que seguía en cola: si es eso (y no
+            # que se cancele esta petición) se responde como a un pool roto
+            if self._pool is pool:
+                raise
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "El pool de análisis se reinició",
+                            headers={'Retry-After': '1'})
+        finally:
+            self.pending -= len(codes)
+
+    async def route(self, method, path, body):
+        """(estado, objeto JSON) de la respuesta a una petición"""
+        if path == '/health':
+            if method != 'GET':
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+            return HTTPStatus.OK, {'status': 'ok', 'workers': self.workers, 'pending': self.pending,
+                                   'max_pending': self.max_pending, 'max_batch': self.max_batch,
+                                   'served': self.served,
+                                   'rejected': self.rejected}
+
+        if path not in ('/analyze', '/analyze/batch'):
+            raise HTTPError(HTTPStatus.NOT_FOUND)
+        if method != 'POST':
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+
+        try:
+            request = json.loads(body)
+        except (UnicodeDecodeError, ValueError):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "El cuerpo no es JSON válido")
+        if not isinstance(request, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Se esperaba un objeto JSON")
+        functions = bool(request.get('functions', False))
+
+        if path == '/analyze':
+            code = request.get('code')
+            if not isinstance(code, str):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "Falta 'code' (texto)")
+            result, = await self.analyze([code], functions)
+            self.served += 1
+            return (HTTPStatus.INTERNAL_SERVER_ERROR if 'error' in result else HTTPStatus.OK), result
+
+        codes = request.get('codes')
+        if not isinstance(codes, list) or not all(isinstance(code, str) for code in codes):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Falta 'codes' (lista de textos)")
+        if len(codes) > self.max_batch:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Como máximo {self.max_batch} fragmentos por lote")
+        results = await self.analyze(codes, functions)
+        self.served += len(codes)
+        return HTTPStatus.OK, {'results': results}
+
+    # ------------------------------------------------------------------
+    # HTTP/1.1
+    # ------------------------------------------------------------------
+
+    async def _read_request(self, reader, writer):
+        """(método, ruta, cuerpo, keep_alive) de la siguiente petición, o None si se cerró"""
+        try:
+            request_line = await reader.readline()
+        except (ValueError, asyncio.LimitOverrunError):
+            raise HTTPError(HTTPStatus.REQUEST_URI_TOO_LONG, close=True)
+        if not request_line:
+            return None
+
+        parts = request_line.decode('latin-1').split()
+        if len(parts) != 3 or not parts[2].startswith('HTTP/1.'):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Línea de petición no válida", close=True)
+        method, target, version = parts
+
+        headers = {}
+        while True:
+            try:
+                line = await reader.readline()
+            except (ValueError, asyncio.LimitOverrunError):
+                raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, close=True)
+            if line in (b'\r\n', b'\n', b''):
+                break
+            if len(headers) >= MAX_HEADERS:
+                raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, close=True)
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+        if 'transfer-encoding' in headers:
+            raise HTTPError(HTTPStatus.LENGTH_REQUIRED, "Se requiere Content-Length", close=True)
+        try:
+            length = int(headers.get('content-length', '0'))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Content-Length no válido", close=True)
+        if length < 0:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Content-Length no válido", close=True)
+        if length > self.max_body:
+            # Se rechaza antes de leer el cuerpo (y de aceptar un Expect: 100-continue)
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                            f"Como máximo {self.max_body} bytes por petición", close=True)
+
+        if length and headers.get('expect', '').lower() == '100-continue':
+            writer.write(b'HTTP/1.1 100 Continue\r\n\r\n')
+            await writer.drain()
+        body = await reader.readexactly(length) if length else b''
+        return method, target.split('?', 1)[0], body, keep_alive
+
+    async def _respond(self, writer, status, payload, keep_alive, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = [f'HTTP/1.1 {status.value} {status.phrase}',
+                'Content-Type: application/json; charset=utf-8',
+                f'Content-Length: {len(body)}',
+                'Connection: ' + ('keep-alive' if keep_alive else 'close')]
+        head += [f'{name}: {value}' for name, value in (headers or {}).items()]
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+    async def _handle_connection(self, reader, writer):
+        """Atiende las peticiones de una conexión de una en una (keep-alive)"""
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader, writer), REQUEST_TIMEOUT)
+                    if request is None:
+                        break
+                    method, path, body, keep_alive = request
+                    status, payload = await self.route(method, path, body)
+                    await self._respond(writer, status, payload, keep_alive)
+                except HTTPError as e:
+                    keep_alive = keep_alive and not e.close
+                    await self._respond(writer, e.status, {'error': e.message}, keep_alive, e.headers)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
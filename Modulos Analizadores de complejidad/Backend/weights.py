@@ -0,0 +1,134 @@
+"""
+WEIGHTS - Formato binario versionado para los pesos de la red
+Guarda pesos, sesgos, tamaños de capa y estadísticas de normalización
+como arreglos float32 planos que se pueden mapear en memoria (sin pickle).
+Los checkpoints de entrenamiento usan float64 (FLAG_FLOAT64) para poder
+reanudar exactamente donde se quedaron.
+
+Estructura del archivo (little-endian):
+    cabecera   '<4sHHII'  magic, versión, flags, nº de capas, nº de estadísticas
+    tamaños    uint32 × nº de capas (incluye entrada y salida)
+    relleno    hasta múltiplo de 16 bytes
+    datos      float32 (float64 con FLAG_FLOAT64): por cada capa, pesos
+               (salida × entrada) y sesgos; después las estadísticas de
+               normalización
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+WEIGHTS_MAGIC = b'CXNW'
+WEIGHTS_VERSION = 1
+FLAG_TRAINED = 1
+FLAG_FLOAT64 = 2
+
+HEADER = struct.Struct('<4sHHII')
+DATA_ALIGNMENT = 16
+
+
+def _data_offset(layer_count):
+    """Desplazamiento (alineado) donde empiezan los float32"""
+    offset = HEADER.size + 4 * layer_count
+    return (offset + DATA_ALIGNMENT - 1) // DATA_ALIGNMENT * DATA_ALIGNMENT
+
+
+def _float_bytes(values, typecode='f'):
+    """Convierte una secuencia de números a bytes float32 ('f') o float64 ('d') little-endian"""
+    data = array(typecode, values)
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return data.tobytes()
+
+
+def _float_list(buffer, start, count, typecode='f'):
+    """Lee `count` float32 ('f') o float64 ('d') little-endian a partir de `start`"""
+    data = array(typecode)
+    data.frombytes(buffer[start:start + data.itemsize * count])
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return data.tolist()
+
+
+def write_weights(filepath, layer_sizes, weights, biases, feature_stats=(), is_trained=True, double=False):
+    """Escribe pesos y sesgos (listas de filas o matrices) en formato binario
+
+    Con double=True los valores se guardan en float64, sin pérdida.
+    """
+    layer_sizes = [int(size) for size in layer_sizes]
+    feature_stats = [float(v) for v in feature_stats]
+    flags = (FLAG_TRAINED if is_trained else 0) | (FLAG_FLOAT64 if double else 0)
+    typecode = 'd' if double else 'f'
+
+    with open(filepath, 'wb') as f:
+        f.write(HEADER.pack(WEIGHTS_MAGIC, WEIGHTS_VERSION, flags, len(layer_sizes), len(feature_stats)))
+        f.write(struct.pack(f'<{len(layer_sizes)}I', *layer_sizes))
+        f.write(b'\0' * (_data_offset(len(layer_sizes)) - f.tell()))
+
+        for layer_idx, (w, b) in enumerate(zip(weights, biases)):
+            rows, cols = layer_sizes[layer_idx + 1], layer_sizes[layer_idx]
+            flat = [float(v) for row in w for v in row]
+            if len(flat) != rows * cols or len(b) != rows:
+                raise ValueError(f"La capa {layer_idx} no coincide con los tamaños {layer_sizes}")
+            f.write(_float_bytes(flat, typecode))
+            f.write(_float_bytes((float(v) for v in b), typecode))
+
+        f.write(_float_bytes(feature_stats, typecode))
+
+
+def read_weights(filepath, as_numpy=False):
+    """Lee un archivo de pesos mapeándolo en memoria
+
+    Devuelve un dict con layer_sizes, weights, biases, feature_stats e
+    is_trained. Lee tanto archivos float32 como float64. Con as_numpy=True los pesos son matrices float64 de NumPy;
+    si no, listas de filas como las del motor de listas.
+    """
+    with open(filepath, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if len(buffer) < HEADER.size:
+                raise ValueError("Archivo de pesos no válido: demasiado corto")
+
+            magic, version, flags, layer_count, stats_count = HEADER.unpack_from(buffer, 0)
+            if magic != WEIGHTS_MAGIC:
+                raise ValueError("Archivo de pesos no válido: firma desconocida")
+            if version != WEIGHTS_VERSION:
+                raise ValueError(f"Versión de pesos no soportada: {version}")
+
+            typecode, dtype = ('d', '<f8') if flags & FLAG_FLOAT64 else ('f', '<f4')
+            itemsize = 8 if typecode == 'd' else 4
+            layer_sizes = list(struct.unpack_from(f'<{layer_count}I', buffer, HEADER.size))
+            offset = _data_offset(layer_count)
+            expected = offset + itemsize * (sum(layer_sizes[i] * layer_sizes[i + 1] + layer_sizes[i + 1]
+                                         for i in range(layer_count - 1)) + stats_count)
+            if len(buffer) != expected:
+                raise ValueError("Archivo de pesos no válido: tamaño inesperado")
+
+            if as_numpy:
+                import numpy as np
+
+            weights, biases = [], []
+            for layer_idx in range(layer_count - 1):
+                rows, cols = layer_sizes[layer_idx + 1], layer_sizes[layer_idx]
+                if as_numpy:
+                    # astype copia los datos: el mmap puede cerrarse al terminar
+                    weights.append(np.frombuffer(buffer, dtype=dtype, count=rows * cols, offset=offset)
+                                   .reshape(rows, cols).astype(np.float64))
+                    offset += itemsize * rows * cols
+                    biases.append(np.frombuffer(buffer, dtype=dtype, count=rows, offset=offset).astype(np.float64))
+                else:
+                    flat = _float_list(buffer, offset, rows * cols, typecode)
+                    weights.append([flat[r * cols:(r + 1) * cols] for r in range(rows)])
+                    offset += itemsize * rows * cols
+                    biases.append(_float_list(buffer, offset, rows, typecode))
+                offset += itemsize * rows
+
+            feature_stats = _float_list(buffer, offset, stats_count, typecode)
+
+    return {
+        'layer_sizes': layer_sizes,
+        'weights': weights,
+        'biases': biases,
+        'feature_stats': feature_stats,
+        'is_trained': bool(flags & FLAG_TRAINED),
+    }
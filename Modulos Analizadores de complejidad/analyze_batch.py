@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Análisis por lotes sin interfaz gráfica
+
+Recorre uno o más directorios, analiza cada archivo JavaScript en un pool
+de procesos (el modelo se carga una vez por proceso) y escribe un
+resultado por archivo en formato JSON Lines.
+
+Uso:
+    python analyze_batch.py proyecto/ otro/archivo.js --workers 8 > resultados.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+sys.path.insert(0, os.path.dirname(__file__))
+
+from Backend.backend import DEFAULT_MODEL_PATH
+from Backend.batch import (
+    DEFAULT_EXTENSIONS,
+    DEFAULT_EXCLUDED_DIRS,
+    analyze_files,
+    analyze_functions,
+    ensure_model,
+    iter_source_files,
+)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Analiza la complejidad de archivos JavaScript en lote (JSON Lines)")
+    parser.add_argument('paths', nargs='+', help="directorios o archivos a analizar")
+    parser.add_argument('--model', default=DEFAULT_MODEL_PATH, help="archivo de pesos (se entrena si no existe)")
+    parser.add_argument('--workers', type=int, default=None, help="número de procesos (por defecto, uno por CPU)")
+    parser.add_argument('--ext', action='append', default=None,
+                        help=f"extensión a incluir, repetible (por defecto {' '.join(DEFAULT_EXTENSIONS)})")
+    parser.add_argument('--exclude', action='append', default=None,
+                        help=f"directorio a omitir, repetible (por defecto {' '.join(DEFAULT_EXCLUDED_DIRS)})")
+    parser.add_argument('--ordered', action='store_true', help="emitir los resultados en el orden de los archivos")
+    parser.add_argument('--chunksize', type=int, default=16, help="archivos por envío a cada proceso")
+    parser.add_argument('--output', '-o', default=None, help="archivo de salida (por defecto, stdout)")
+    parser.add_argument('--cache', default=None, help="base SQLite de resultados para reutilizar entre ejecuciones")
+    parser.add_argument('--functions', action='store_true',
+                        help="incluir la complejidad de cada función de nivel superior con su rango de líneas "
+                             "(con un solo archivo, las funciones se reparten entre los procesos)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    extensions = tuple(args.ext or DEFAULT_EXTENSIONS)
+    excluded = tuple(args.exclude or DEFAULT_EXCLUDED_DIRS)
+
+    ensure_model(args.model)
+    if args.functions and len(args.paths) == 1 and os.path.isfile(args.paths[0]):
+        # Un solo archivo: se reparten sus funciones entre los procesos
+        results = iter([analyze_functions(args.paths[0], args.model, args.workers)])
+    else:
+        files = (path for root in args.paths for path in iter_source_files(root, extensions, excluded))
+        results = analyze_files(files, args.model, args.workers, args.ordered, args.chunksize, args.cache,
+                                args.functions)
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    start = time.perf_counter()
+    analyzed = errors = cached = approximate = 0
+    try:
+        for result in results:
+            out.write(json.dumps(result, ensure_ascii=False) + '\n')
+            out.flush()
+            analyzed += 1
+            errors += 'error' in result
+            cached += result.get('cached', False)
+            approximate += result.get('approximate', False)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"✓ {analyzed} archivos analizados ({errors} con error) en {elapsed:.2f} s", file=sys.stderr)
+    if args.cache:
+        print(f"✓ Caché: {cached} aciertos, {analyzed - errors - cached} fallos", file=sys.stderr)
+    if approximate:
+        print(f"⚠️  {approximate} resultados aproximados (sentencias demasiado largas para acotar sus bucles)",
+              file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Benchmark del tiempo de arranque (importación en frío)
+
+Ejecuta cada escenario en un proceso nuevo con `python -X importtime`,
+suma el tiempo acumulado de los módulos importados y comprueba que los
+puntos de entrada sin interfaz no carguen módulos pesados (tkinter,
+NumPy, SQLite, multiprocessing). Mismo dato que:
+
+    python -X importtime -c "import Backend" 2> importtime.log
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+REPETICIONES = 5
+
+# Módulos que un arranque sin interfaz no debería cargar
+PESADOS = ('tkinter', 'numpy', 'sqlite3', 'multiprocessing')
+
+ESCENARIOS = [
+    ("import Backend", "import Backend", True),
+    ("import Backend.backend", "import Backend.backend", True),
+    ("Backend.analyze (1er análisis)", "import Backend; Backend.analyze('let x = 1;')", True),
+    ("import interface.interfaz (GUI)", "import interface.interfaz", False),
+]
+
+
+def importtime(sentencia):
+    """(ms totales, {módulo: ms acumulados}) de ejecutar `sentencia` en un proceso nuevo"""
+    proceso = subprocess.run([sys.executable, '-X', 'importtime', '-c', sentencia], cwd=DIRECTORIO,
+                             capture_output=True, text=True)
+    if proceso.returncode != 0:
+        raise RuntimeError(proceso.stderr.strip().splitlines()[-1])
+
+    modulos = {}
+    total = 0
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith('import time:') or 'cumulative' in linea:
+            continue
+        _, acumulado, nombre = linea[len('import time:'):].split('|')
+        modulos[nombre.strip()] = int(acumulado) / 1000
+        # Los módulos de nivel superior (sin sangría) suman todo lo demás
+        if not nombre.startswith('  '):
+            total += int(acumulado) / 1000
+    return total, modulos
+
+
+print("=" * 70)
+print("BENCHMARK: TIEMPO DE IMPORTACIÓN EN FRÍO")
+print("=" * 70)
+print(f"\n{'Escenario':34} {'mediana (ms)':>13} {'mín (ms)':>10}  módulos pesados")
+print("-" * 70)
+
+fallos = 0
+for nombre, sentencia, sin_interfaz in ESCENARIOS:
+    try:
+        medidas = [importtime(sentencia) for _ in range(REPETICIONES)]
+    except RuntimeError as e:
+        print(f"{nombre:34} {'—':>13} {'—':>10}  no disponible ({e})")
+        continue
+    tiempos = [total for total, _ in medidas]
+    cargados = sorted({raiz for raiz in PESADOS for modulo in medidas[0][1] if modulo.split('.')[0] == raiz})
+    marca = ''
+    if sin_interfaz and cargados:
+        marca = '  ❌'
+        fallos += 1
+    print(f"{nombre:34} {statistics.median(tiempos):13.1f} {min(tiempos):10.1f}  "
+          f"{', '.join(cargados) or 'ninguno'}{marca}")
+
+print("-" * 70)
+print("\nMódulos más lentos de 'import Backend.backend' (ms acumulados):")
+_, modulos = importtime("import Backend.backend")
+for modulo, ms in sorted(modulos.items(), key=lambda item: -item[1])[:8]:
+    print(f"  {modulo:40} {ms:8.1f}")
+
+print("\n" + "=" * 70)
+if fallos:
+    print(f"❌ {fallos} escenario(s) sin interfaz cargan módulos pesados")
+    sys.exit(1)
+print("✓ Los puntos de entrada sin interfaz no cargan tkinter, NumPy, SQLite ni multiprocessing")
+print("=" * 70)
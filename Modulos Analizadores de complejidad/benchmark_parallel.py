@@ -0,0 +1,137 @@
+"""
+Benchmark del entrenamiento en paralelo (train_simple con workers > 1)
+
+Repartir un lote entre procesos solo compensa si el cálculo que se ahorra
+supera el coste fijo de cada paso (enviar los rangos por las tuberías,
+esperar a todos los trabajadores y sumar sus gradientes). Para cada motor
+mide:
+
+  - el paso en serie de un lote de B muestras, s(B);
+  - el coste fijo de un paso con W procesos, o(W): el paso en paralelo de
+    un lote de W muestras (una por proceso) menos s(W).
+
+Con W núcleos libres un paso en paralelo cuesta unos s(B) / W + o(W), así
+que el lote mínimo que compensa es el menor B con s(B) · (1 - 1/W) > o(W).
+Si la máquina tiene al menos W núcleos, mide además el paso en paralelo
+real de cada B y termina con error si con el lote mínimo documentado
+(Backend.parallel.min_parallel_batch, el que exige train_500_epochs.py)
+el paso en paralelo no es más rápido que en serie.
+
+Uso:
+    python benchmark_parallel.py --workers 4 --hidden 128 64 32
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from Backend.backend import NUMPY_AVAILABLE, SimpleNeuralNetwork
+from Backend.matrix import FeatureMatrix
+from Backend.parallel import ParallelTrainer, min_parallel_batch
+
+MUESTRAS = 4096
+LOTES = (8, 16, 32, 64, 128, 256, 512, 1024, 2048)
+
+
+def datos(muestras, columnas):
+    """Muestras sintéticas deterministas (el valor no importa, solo el tamaño)"""
+    X = FeatureMatrix.from_rows([[((i * 31 + j * 17) % 97) / 97 for j in range(columnas)]
+                                 for i in range(muestras)], columnas)
+    return X, [(i % 7) / 7 for i in range(muestras)]
+
+
+def red(use_numpy, hidden):
+    return SimpleNeuralNetwork(input_size=20, hidden_layers=hidden, use_numpy=use_numpy, deterministic=True)
+
+
+def paso_serie(net, X, y, lote, repeticiones):
+    """Mediana (s) de un paso en serie con las primeras `lote` muestras"""
+    if net.use_numpy:
+        import numpy as np
+        filas, etiquetas = X.to_numpy()[:lote], np.asarray(y[:lote], dtype=np.float64)
+        entrenar = net._train_batch_matrix
+    else:
+        filas, etiquetas = [X.row(i) for i in range(lote)], y[:lote]
+        entrenar = net._train_batch_lists
+    medidas = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        entrenar(filas, etiquetas)
+        medidas.append(time.perf_counter() - inicio)
+    return statistics.median(medidas)
+
+
+def paso_paralelo(trainer, lote, repeticiones):
+    """Mediana (s) de un paso repartido con las primeras `lote` muestras"""
+    medidas = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        trainer.step(0, lote)
+        medidas.append(time.perf_counter() - inicio)
+    return statistics.median(medidas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lote mínimo a partir del cual compensa train_simple(workers=W)")
+    parser.add_argument('--workers', type=int, default=4, help="procesos entre los que se reparte cada lote")
+    parser.add_argument('--hidden', type=int, nargs='+', default=[128, 64, 32], help="capas ocultas de la red")
+    parser.add_argument('--repeticiones', type=int, default=15, help="pasos medidos por lote (se toma la mediana)")
+    args = parser.parse_args()
+    workers, hidden = args.workers, tuple(args.hidden)
+    nucleos = os.cpu_count() or 1
+    X, y = datos(MUESTRAS, 20)
+    fallos = []
+
+    print("=" * 70)
+    print(f"BENCHMARK: ENTRENAMIENTO EN PARALELO ({workers} procesos, red {list(hidden)}, {nucleos} núcleo(s))")
+    print("=" * 70)
+
+    for use_numpy in ([True, False] if NUMPY_AVAILABLE else [False]):
+        motor = 'NumPy' if use_numpy else 'listas'
+        serie = {lote: paso_serie(red(use_numpy, hidden), X, y, lote, args.repeticiones) for lote in LOTES}
+        serie[workers] = paso_serie(red(use_numpy, hidden), X, y, workers, args.repeticiones)
+
+        net = red(use_numpy, hidden)
+        with ParallelTrainer(net, X, y, workers) as trainer:
+            trainer.set_order(range(MUESTRAS))
+            fijo = max(0.0, paso_paralelo(trainer, workers, args.repeticiones) - serie[workers])
+            real = ({lote: paso_paralelo(trainer, lote, args.repeticiones) for lote in LOTES}
+                    if nucleos >= workers else {})
+
+        print(f"\nMotor {motor}: coste fijo por paso con {workers} procesos o({workers}) = {fijo * 1000:.2f} ms")
+        print(f"{'lote':>6} {'serie (ms)':>11} {'estimado (ms)':>14} {'medido (ms)':>12}  compensa")
+        print("-" * 70)
+        minimo = None
+        documentado = min_parallel_batch(use_numpy)
+        for lote in LOTES:
+            estimado = serie[lote] / workers + fijo
+            medido = real.get(lote)
+            compensa = (medido if medido is not None else estimado) < serie[lote]
+            if compensa and minimo is None:
+                minimo = lote
+            if lote == documentado and medido is not None and not compensa:
+                fallos.append((motor, documentado))
+            print(f"{lote:6} {serie[lote] * 1000:11.2f} {estimado * 1000:14.2f} "
+                  f"{medido * 1000 if medido is not None else float('nan'):12.2f}  {'sí' if compensa else 'no'}")
+        if minimo is None:
+            print(f"→ Con {workers} procesos no compensa para ningún lote de hasta {LOTES[-1]} muestras")
+        else:
+            print(f"→ Con {workers} procesos compensa a partir de lotes de {minimo} muestras")
+        print(f"  (mínimo documentado para el motor {motor}: {documentado} muestras)")
+
+    if nucleos < workers:
+        print(f"\n⚠️  Solo hay {nucleos} núcleo(s): la columna 'medido' no se rellena y 'estimado' supone "
+              f"{workers} núcleos libres")
+    for motor, documentado in fallos:
+        print(f"\n❌ Motor {motor}: con lotes de {documentado} muestras (el mínimo documentado) el paso en "
+              f"paralelo no es más rápido que en serie")
+    print("=" * 70)
+    return 1 if fallos else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
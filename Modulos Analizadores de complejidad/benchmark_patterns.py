@@ -0,0 +1,64 @@
+"""
+Micro-benchmark del registro de patrones precompilados
+
+Compara el costo por llamada de cada patrón de Backend/patterns.py:
+  - antes (caché frío): re.search(fuente) con la caché de `re` vacía,
+    lo que ocurre cuando miles de fragmentos la saturan
+  - antes (caché tibio): re.search(fuente) encontrando el patrón en caché
+  - después: PATRON.search() sobre el objeto ya compilado
+"""
+
+import sys
+import os
+import re
+import timeit
+sys.path.insert(0, os.path.dirname(__file__))
+
+from Backend import patterns
+
+REPETICIONES = 2000
+
+codigo = """function binarySearch(arr, target) {
+  let left = 0, right = arr.length - 1;
+  while (left <= right) {
+    let mid = Math.floor((left + right) / 2);
+    if (arr[mid] === target) return mid;
+    else if (arr[mid] < target) left = mid + 1;
+    else right = mid - 1;
+  }
+  return -1;
+}"""
+
+
+def por_llamada(funcion, setup=None):
+    """Microsegundos por llamada"""
+    total = 0.0
+    for _ in range(REPETICIONES):
+        if setup:
+            setup()
+        total += timeit.timeit(funcion, number=1)
+    return total / REPETICIONES * 1e6
+
+
+print("=" * 70)
+print("MICRO-BENCHMARK: PATRONES PRECOMPILADOS")
+print("=" * 70)
+print(f"\n{'Patrón':28} {'frío (µs)':>11} {'tibio (µs)':>11} {'compilado (µs)':>15}")
+print("-" * 70)
+
+total_frio = total_tibio = total_compilado = 0.0
+for nombre, patron in sorted(patterns.ALL_PATTERNS.items()):
+    fuente, flags = patron.pattern, patron.flags
+    frio = por_llamada(lambda: re.search(fuente, codigo, flags), setup=re.purge)
+    tibio = por_llamada(lambda: re.search(fuente, codigo, flags))
+    compilado = por_llamada(lambda: patron.search(codigo))
+    total_frio += frio
+    total_tibio += tibio
+    total_compilado += compilado
+    print(f"{nombre:28} {frio:11.2f} {tibio:11.2f} {compilado:15.2f}")
+
+print("-" * 70)
+print(f"{'TOTAL':28} {total_frio:11.2f} {total_tibio:11.2f} {total_compilado:15.2f}")
+print(f"\n✓ Aceleración frente a caché frío:  {total_frio / total_compilado:.1f}x")
+print(f"✓ Aceleración frente a caché tibio: {total_tibio / total_compilado:.1f}x")
+print("\n" + "=" * 70)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Construcción del conjunto de entrenamiento a partir de un corpus real
+
+Lee un corpus de archivos JavaScript etiquetados (manifest.jsonl o un
+subdirectorio por complejidad), extrae sus características en un pool de
+procesos y las guarda por fragmentos en un directorio que
+train_500_epochs.py --dataset lee un fragmento cada vez. Los fragmentos
+comprimidos (por defecto) se descomprimen enteros al leerlos; con
+--no-compress se mapean en memoria y se leen del disco a medida que se usan.
+
+Uso:
+    python build_dataset.py corpus/ dataset/ --workers 8
+    python train_500_epochs.py --dataset dataset/
+"""
+
+import argparse
+import os
+import sys
+import time
+sys.path.insert(0, os.path.dirname(__file__))
+
+from Backend.dataset import DEFAULT_SHARD_SIZE, build_dataset
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Extrae las características de un corpus etiquetado por fragmentos")
+    parser.add_argument('corpus', help="manifest.jsonl o directorio del corpus")
+    parser.add_argument('output', help="directorio del almacén (se sustituye al terminar)")
+    parser.add_argument('--workers', type=int, default=None, help="número de procesos (por defecto, uno por CPU)")
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE, help="muestras por fragmento")
+    parser.add_argument('--chunksize', type=int, default=64, help="archivos por envío a cada proceso")
+    parser.add_argument('--no-compress', action='store_true',
+                        help="fragmentos sin comprimir: ocupan más, pero se mapean en memoria en lugar de "
+                             "descomprimirse enteros")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    start = time.perf_counter()
+    try:
+        store = build_dataset(args.corpus, args.output, args.shard_size, args.workers, not args.no_compress,
+                              args.chunksize)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    elapsed = time.perf_counter() - start
+    size = sum(os.path.getsize(os.path.join(args.output, shard['name'])) for shard in store.shards)
+    print(f"✓ {len(store)} muestras en {store.shard_count} fragmentos ({size / 1024:.1f} KiB, "
+          f"{store.index['skipped']} archivos omitidos) en {elapsed:.2f} s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
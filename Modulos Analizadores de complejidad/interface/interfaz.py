@@ -7,7 +7,7 @@ con el usuario en la aplicación de análisis de complejidad.
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
-import re
+import queue
 import random
 import sys
 import os
@@ -15,13 +15,24 @@ import os
 # Agregar la ruta de Backend al path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from Backend import patterns
 from Backend.backend import (
     CodeFeatureExtractor,
     ComplexityMapper,
-    NeuralNetworkComplexityAnalyzer
+    NeuralNetworkComplexityAnalyzer,
+    DEFAULT_MODEL_PATH
 )
+from Backend.cache import ResultCache
+from Backend.incremental import IncrementalFeatureExtractor
+from interface.worker import AnalysisWorker
 import os
 
+# Espera tras la última tecla antes de analizar en vivo (ms)
+LIVE_DEBOUNCE_MS = 80
+
+# Intervalo con que el hilo de la interfaz vacía la cola de actualizaciones (~60 fps)
+UI_POLL_MS = 16
+
 
 # ============================================================================
 # INTERFAZ GRÁFICA MODERNA
@@ -50,8 +61,18 @@ class ComplexityAnalyzerGUI:
         self.last_code_analyzed = None
         self.last_confidence = 0
         
+        # Los hilos secundarios nunca tocan los widgets: encolan actualizaciones
+        # que el hilo de la interfaz aplica en drain_ui_queue
+        self.ui_queue = queue.Queue()
+        
+        # Análisis en vivo: un solo hilo trabajador y un temporizador de espera
+        self.worker = AnalysisWorker(self.on_worker_result)
+        self.live_after_id = None
+        self.live_enabled = tk.BooleanVar(value=True)
+        
         self.create_widgets()
         self.setup_styles()
+        self.root.after(UI_POLL_MS, self.drain_ui_queue)
         self.initialize_model()
         
         # Configurar cierre de la ventana
@@ -156,6 +177,12 @@ class ComplexityAnalyzerGUI:
                              relief=tk.FLAT, padx=12, pady=8, cursor='hand2')
         clear_btn.pack(side=tk.LEFT, padx=5)
         
+        live_check = tk.Checkbutton(button_frame, text="⚡ Análisis en vivo", variable=self.live_enabled,
+                                    command=self.on_code_change, bg=self.card_bg, fg=self.fg_color,
+                                    selectcolor=self.secondary_bg, activebackground=self.card_bg,
+                                    activeforeground=self.accent_color, font=('Segoe UI', 9, 'bold'))
+        live_check.pack(side=tk.RIGHT, padx=5)
+        
         # Editor de código
         editor_frame = tk.Frame(left_panel, bg=self.card_bg)
         editor_frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=(0, 12))
@@ -274,33 +301,69 @@ class ComplexityAnalyzerGUI:
         
         self.explanation_text.config(state=tk.DISABLED)
         
+    def post_ui(self, action, *args):
+        """Encola action(*args) para el hilo de la interfaz (seguro desde cualquier hilo)"""
+        self.ui_queue.put((action, args))
+    
+    def drain_ui_queue(self):
+        """Aplica las actualizaciones encoladas, en lote, una vez por intervalo
+        
+        Si la misma acción llegó varias veces desde el último intervalo,
+        solo se aplica la más reciente.
+        """
+        pending = {}
+        try:
+            while True:
+                action, args = self.ui_queue.get_nowait()
+                pending.pop(action, None)
+                pending[action] = args
+        except queue.Empty:
+            pass
+        
+        try:
+            for action, args in pending.items():
+                action(*args)
+        finally:
+            self.root.after(UI_POLL_MS, self.drain_ui_queue)
+    
+    def set_status(self, text, color=None):
+        """Actualiza la etiqueta de estado del encabezado"""
+        if color is None:
+            self.status_label.config(text=text)
+        else:
+            self.status_label.config(text=text, fg=color)
+    
     def initialize_model(self):
         """Inicializa el modelo en un thread separado"""
         def load_model_thread():
             try:
-                self.status_label.config(text="⏳ Cargando modelo entrenado...")
-                self.root.update()
+                self.post_ui(self.set_status, "⏳ Cargando modelo entrenado...")
                 
-                if os.path.exists("complexity_model.pkl"):
-                    self.analyzer = NeuralNetworkComplexityAnalyzer(epochs=500)
-                    self.analyzer.load_model("complexity_model.pkl")
+                # Determinista y con caché: el resultado no parpadea al teclear
+                if os.path.exists(DEFAULT_MODEL_PATH):
+                    self.analyzer = NeuralNetworkComplexityAnalyzer(epochs=500, cache=ResultCache(max_entries=256),
+                                                                    deterministic=True)
+                    self.analyzer.load_model(DEFAULT_MODEL_PATH)
+                    self.analyzer.feature_extractor = IncrementalFeatureExtractor()
                     self.is_model_loaded = True
-                    self.status_label.config(text="✅ Modelo cargado (archivo guardado)", 
-                                           fg=self.success_color)
+                    self.post_ui(self.set_status, "✅ Modelo cargado (archivo guardado)", self.success_color)
                 else:
-                    self.status_label.config(text="⏳ Entrenando modelo (500 épocas)...")
-                    self.root.update()
+                    self.post_ui(self.set_status, "⏳ Entrenando modelo (500 épocas)...")
                     
-                    self.analyzer = NeuralNetworkComplexityAnalyzer(epochs=500)
+                    self.analyzer = NeuralNetworkComplexityAnalyzer(epochs=500, cache=ResultCache(max_entries=256),
+                                                                    deterministic=True)
                     self.analyzer.train()
-                    self.analyzer.save_model("complexity_model.pkl")
+                    self.analyzer.save_model(DEFAULT_MODEL_PATH)
+                    self.analyzer.feature_extractor = IncrementalFeatureExtractor()
                     self.is_model_loaded = True
-                    self.status_label.config(text="✅ Modelo entrenado y listo", 
-                                           fg=self.success_color)
+                    self.post_ui(self.set_status, "✅ Modelo entrenado y listo", self.success_color)
+                
+                # Analizar lo que se haya escrito mientras cargaba el modelo
+                self.post_ui(self.on_code_change)
                     
             except Exception as e:
-                self.status_label.config(text=f"❌ Error al inicializar", fg=self.error_color)
-                messagebox.showerror("Error", f"Error al inicializar: {str(e)}")
+                self.post_ui(self.set_status, "❌ Error al inicializar", self.error_color)
+                self.post_ui(messagebox.showerror, "Error", f"Error al inicializar: {str(e)}")
         
         thread = threading.Thread(target=load_model_thread, daemon=True)
         thread.start()
@@ -332,6 +395,7 @@ class ComplexityAnalyzerGUI:
         goodbye_message = random.choice(goodbye_messages)
         
         if messagebox.askokcancel("¡Hasta Luego!", goodbye_message + "\n\n¿Deseas CERRAR la aplicación?"):
+            self.worker.close()
             self.root.destroy()
     
     def on_code_focus_in(self, event):
@@ -347,9 +411,73 @@ class ComplexityAnalyzerGUI:
             self.code_text.config(fg='#808080')
     
     def on_code_change(self, event=None):
-        """Se llama cuando hay cambios en el código"""
+        """Se llama cuando hay cambios en el código: reprograma el análisis en vivo"""
         if not self.analysis_in_progress:
             self.analyze_btn.config(state=tk.NORMAL, text="🔍 Analizar Complejidad")
+        
+        if self.live_after_id is not None:
+            self.root.after_cancel(self.live_after_id)
+            self.live_after_id = None
+        if self.live_enabled.get():
+            self.live_after_id = self.root.after(LIVE_DEBOUNCE_MS, self.run_live_analysis)
+    
+    def run_live_analysis(self):
+        """Envía el código actual al hilo trabajador si cambió desde el último análisis"""
+        self.live_after_id = None
+        if not self.is_model_loaded:
+            return
+        
+        code = self.code_text.get(1.0, tk.END).strip()
+        if not code or code == "// Pega aquí tu código JavaScript" or code == self.last_code_analyzed:
+            return
+        
+        self.worker.submit(self.compute_analysis, code, True)
+    
+    def compute_analysis(self, code, live):
+        """Análisis completo (hilo trabajador): validación, predicción y explicación"""
+        if live and not self.is_javascript_code(code):
+            return None
+        
+        # El extractor incremental solo recorre los bloques que cambiaron (características,
+        # cotas de los bucles y perfiles de las funciones de cada bloque)
+        result = self.analyzer.analyze(code)
+        return {
+            'code': code,
+            'complexity': result['complexity'],
+            'confidence': result['confidence'],
+            'explanation': self.generate_explanation(code, result['complexity'], result['features']),
+        }
+    
+    def on_worker_result(self, job_id, result, error):
+        """Recibe el resultado en el hilo trabajador y lo encola para la interfaz"""
+        self.post_ui(self.show_result, job_id, result, error)
+    
+    def show_result(self, job_id, result, error):
+        """Muestra un resultado (hilo de la interfaz) si no quedó obsoleto"""
+        if not self.worker.is_current(job_id):
+            return
+        
+        self.analysis_in_progress = False
+        self.analyze_btn.config(state=tk.NORMAL, text="🔍 ANALIZAR COMPLEJIDAD")
+        
+        if error is not None:
+            messagebox.showerror("Error", f"Error durante el análisis: {str(error)}")
+            return
+        if result is None:
+            return
+        
+        confidence_percent = int(result['confidence'] * 100)
+        self.complexity_result.config(text=result['complexity'])
+        self.confidence_var.set(confidence_percent)
+        self.confidence_text.config(text=f"{confidence_percent}%")
+        
+        self.explanation_text.config(state=tk.NORMAL)
+        self.explanation_text.delete(1.0, tk.END)
+        self.explanation_text.insert(tk.END, result['explanation'])
+        self.explanation_text.config(state=tk.DISABLED)
+        
+        self.last_code_analyzed = result['code']
+        self.last_confidence = confidence_percent
     
     def load_file(self):
         """Carga un archivo JavaScript"""
@@ -377,12 +505,19 @@ class ComplexityAnalyzerGUI:
                 self.code_text.insert(1.0, code)
                 self.code_text.config(fg='#d4d4d4')
                 self.analyze_btn.config(state=tk.NORMAL, text="🔍 Analizar Complejidad")
+                self.on_code_change()
                 messagebox.showinfo("Éxito", "✓ Archivo JavaScript cargado correctamente")
             except Exception as e:
                 messagebox.showerror("Error", f"No se pudo abrir el archivo: {str(e)}")
     
     def clear_code(self):
         """Limpia el área de código y la información anterior"""
+        if self.live_after_id is not None:
+            self.root.after_cancel(self.live_after_id)
+            self.live_after_id = None
+        self.worker.cancel()
+        self.analysis_in_progress = False
+        
         self.code_text.delete(1.0, tk.END)
         self.code_text.insert(tk.END, "// Pega aquí tu código JavaScript")
         self.code_text.config(fg='#808080')
@@ -424,7 +559,7 @@ class ComplexityAnalyzerGUI:
         # Python
         if 'def ' in code or '__name__' in code or 'self.' in code:
             return False
-        if re.search(r'\bdef\s+\w+\s*\(', code):
+        if patterns.PYTHON_DEF.search(code):
             return False
         
         # Java
@@ -440,23 +575,13 @@ class ComplexityAnalyzerGUI:
             return False
         
         # ACEPTAR: Verificar que tenga estructura JavaScript
-        js_patterns = [
-            r'\bfunction\s+\w+\s*\(',
-            r'\bconst\s+\w+\s*=',
-            r'\blet\s+\w+\s*=',
-            r'\bvar\s+\w+\s*=',
-            r'=>',
-            r'\bfor\s*\(',
-            r'\bwhile\s*\(',
-            r'\bif\s*\(',
-            r'\breturn\s+',
-            r'\.map\s*\(',
-            r'\.filter\s*\(',
-            r'\.forEach\s*\(',
-        ]
-        
-        matches = sum(1 for pattern in js_patterns if re.search(pattern, code))
-        return matches >= 2
+        # Basta con encontrar dos construcciones distintas
+        found = set()
+        for match in patterns.JAVASCRIPT_CONSTRUCT.finditer(code):
+            found.add(match.lastgroup)
+            if len(found) >= 2:
+                return True
+        return False
     
     def analyze_code(self):
         """Analiza el código JavaScript"""
@@ -488,51 +613,30 @@ class ComplexityAnalyzerGUI:
             )
             return
         
-        # Prevenir análisis concurrentes
+        # Prevenir análisis concurrentes (el hilo trabajador es el mismo del modo en vivo)
         self.analysis_in_progress = True
         self.analyze_btn.config(state=tk.DISABLED, text="⏳ ANALIZANDO...")
-        
-        def analyze_thread():
-            try:
-                complexity, confidence = self.analyzer.predict(code)
-                confidence_percent = int(confidence * 100)
-                
-                self.complexity_result.config(text=complexity)
-                self.confidence_var.set(confidence_percent)
-                self.confidence_text.config(text=f"{confidence_percent}%")
-                
-                explanation = self.generate_explanation(code, complexity)
-                self.explanation_text.config(state=tk.NORMAL)
-                self.explanation_text.delete(1.0, tk.END)
-                self.explanation_text.insert(tk.END, explanation)
-                self.explanation_text.config(state=tk.DISABLED)
-                
-                self.last_code_analyzed = code
-                self.last_confidence = confidence_percent
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Error durante el análisis: {str(e)}")
-            finally:
-                self.analysis_in_progress = False
-                self.analyze_btn.config(state=tk.NORMAL, text="🔍 ANALIZAR COMPLEJIDAD")
-        
-        thread = threading.Thread(target=analyze_thread, daemon=True)
-        thread.start()
+        self.worker.submit(self.compute_analysis, code, False)
     
-    def generate_explanation(self, code, complexity):
-        """Genera una explicación detallada del análisis"""
+    def generate_explanation(self, code, complexity, features=None):
+        """Genera una explicación detallada del análisis
+        
+        Si se pasan las características ya extraídas, se reutilizan en lugar
+        de volver a recorrer el código.
+        """
         explanation = f"┌─ ANÁLISIS COMPLETADO ─────────────────┐\n\n"
         explanation += f"🎯 COMPLEJIDAD: {complexity}\n\n"
         
         # Análisis detallado de características
-        for_loops = len(re.findall(r'\bfor\s*\(', code))
-        while_loops = len(re.findall(r'\bwhile\s*\(', code))
-        nested_loops = CodeFeatureExtractor.count_nested_loops(code)
-        recursion = CodeFeatureExtractor.count_recursion_calls(code)
-        array_methods = len(re.findall(r'\.(push|pop|map|filter|reduce|forEach|find|some|every)\s*\(', code))
-        search_methods = len(re.findall(r'\.(indexOf|includes|findIndex)\s*\(', code))
-        sort_methods = len(re.findall(r'\.(sort|reverse)\s*\(', code))
-        functions = len(re.findall(r'\bfunction\s+\w+|const\s+\w+\s*=\s*\(', code))
+        if features is not None:
+            for_loops, while_loops, nested_loops, recursion, array_methods, search_methods = features[1:7]
+        else:
+            for_loops = len(patterns.FOR_LOOP.findall(code))
+            while_loops = len(patterns.WHILE_LOOP.findall(code))
+            nested_loops = CodeFeatureExtractor.count_nested_loops(code)
+            recursion = CodeFeatureExtractor.count_recursion_calls(code)
+            array_methods = len(patterns.ARRAY_METHOD.findall(code))
+            search_methods = len(patterns.SEARCH_METHOD.findall(code))
         
         explanation += "📊 CARACTERÍSTICAS:\n"
         explanation += f"  FOR: {for_loops} | WHILE: {while_loops}\n"
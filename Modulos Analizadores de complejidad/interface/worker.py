@@ -0,0 +1,69 @@
+"""
+WORKER - Hilo de análisis en segundo plano
+Un único hilo trabajador, reutilizado durante toda la sesión, ejecuta
+los análisis que pide la interfaz. Solo interesa la petición más
+reciente: las pendientes se reemplazan y los resultados obsoletos se
+descartan sin llegar a la interfaz.
+"""
+
+import threading
+
+
+class AnalysisWorker:
+    """Ejecuta en un hilo propio la última tarea enviada
+
+    `on_result(job_id, result, error)` se llama desde el hilo trabajador
+    solo si la tarea sigue siendo la más reciente al terminar.
+    """
+
+    def __init__(self, on_result):
+        self.on_result = on_result
+        self._condition = threading.Condition()
+        self._pending = None
+        self._latest = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="AnalysisWorker", daemon=True)
+        self._thread.start()
+
+    def submit(self, func, *args):
+        """Programa func(*args) reemplazando la tarea pendiente; devuelve su id"""
+        with self._condition:
+            self._latest += 1
+            self._pending = (self._latest, func, args)
+            self._condition.notify()
+            return self._latest
+
+    def cancel(self):
+        """Descarta la tarea pendiente y deja obsoleta la que está en curso"""
+        with self._condition:
+            self._latest += 1
+            self._pending = None
+
+    def is_current(self, job_id):
+        """True si job_id es la última tarea enviada"""
+        return job_id == self._latest
+
+    def close(self):
+        """Detiene el hilo al terminar la tarea en curso"""
+        with self._condition:
+            self._closed = True
+            self._pending = None
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                job_id, func, args = self._pending
+                self._pending = None
+
+            try:
+                result, error = func(*args), None
+            except Exception as e:
+                result, error = None, e
+
+            if self.is_current(job_id):
+                self.on_result(job_id, result, error)
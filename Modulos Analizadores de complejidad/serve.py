@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Servicio HTTP local de análisis
+
+Carga el modelo una sola vez en un pool de procesos y atiende peticiones
+JSON, para que editores y CI compartan una instancia ya caliente en lugar
+de arrancar Python en cada análisis.
+
+Uso:
+    python serve.py --port 8765 --workers 4
+    curl -s localhost:8765/analyze -d '{"code": "for (let i = 0; i < n; i++) {}"}'
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+
+from Backend.backend import DEFAULT_MODEL_PATH
+from Backend.batch import ensure_model
+from Backend.service import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    DEFAULT_MAX_BODY,
+    DEFAULT_MAX_BATCH,
+    AnalysisService,
+)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio HTTP/JSON local de análisis de complejidad")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"dirección de escucha (por defecto {DEFAULT_HOST})")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"puerto (por defecto {DEFAULT_PORT})")
+    parser.add_argument('--model', default=DEFAULT_MODEL_PATH, help="archivo de pesos (se entrena si no existe)")
+    parser.add_argument('--workers', type=int, default=None, help="número de procesos (por defecto, uno por CPU)")
+    parser.add_argument('--cache', default=None, help="base SQLite de resultados compartida por los procesos")
+    parser.add_argument('--max-body', type=int, default=DEFAULT_MAX_BODY, help="bytes máximos por petición")
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH,
+                        help="fragmentos máximos por lote (nunca más que --max-pending)")
+    parser.add_argument('--max-pending', type=int, default=None,
+                        help="análisis en curso antes de responder 503 (por defecto, 4 por proceso)")
+    return parser.parse_args(argv)
+
+
+async def run(args):
+    service = AnalysisService(args.model, args.workers, args.cache, args.max_body, args.max_batch, args.max_pending)
+    await service.start(args.host, args.port)
+    host, port = service.address
+    print(f"✓ Escuchando en http://{host}:{port} ({service.workers} procesos, "
+          f"hasta {service.max_pending} análisis en curso, lotes de hasta {service.max_batch})", file=sys.stderr)
+    await service.serve_forever()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    ensure_model(args.model)
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        print("✓ Servicio detenido", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Cotas de bucles y recurrencias de archivos leídos por trozos (Backend.bounds)"""
+
+import pytest
+
+from Backend.batch import load_analyzer
+from Backend.bounds import StatementSplitter, StreamingBounds
+from Backend.functions import analyze_recursion, build_function_table
+
+CODES = [
+    "function sum(arr) {\n  let s = 0;\n  for (let i = 0; i < arr.length; i++) {\n    s += arr[i];\n  }\n"
+    "  return s;\n}\n",
+    "for (let i = 0; i < n; i++) {\n  for (let j = 0; j < n; j++) {\n    for (let k = 0; k < n; k++) {\n"
+    "      c[i][j] += a[i][k] * b[k][j];\n    }\n  }\n}\n",
+    "function search(arr, x) {\n  let lo = 0, hi = arr.length - 1;\n  while (lo <= hi) {\n"
+    "    const mid = Math.floor((lo + hi) / 2);\n    if (arr[mid] === x) return mid;\n"
+    "    if (arr[mid] < x) lo = mid + 1;\n    else hi = mid - 1;\n  }\n  return -1;\n}\n",
+    "const fib = n => n < 2 ? n : fib(n - 1) + fib(n - 2);\n",
+    "function mergeSort(arr) {\n  if (arr.length <= 1) return arr;\n  const mid = Math.floor(arr.length / 2);\n"
+    "  return merge(mergeSort(arr.slice(0, mid)), mergeSort(arr.slice(mid)));\n}\n"
+    "function merge(a, b) {\n  const out = [];\n  while (a.length && b.length) {\n"
+    "    out.push(a[0] < b[0] ? a.shift() : b.shift());\n  }\n  return out.concat(a, b);\n}\n",
+    # Sin las cotas, el modelo da O(n) a estos tres
+    "function bubbleSort(arr) { for (let i = 0; i < arr.length; i++) { for (let j = 0; j < arr.length - i - 1; j++) "
+    "{ if (arr[j] > arr[j + 1]) { [arr[j], arr[j + 1]] = [arr[j + 1], arr[j]]; } } } return arr; }",
+    "function cube(n) { for (let i = 0; i < n; i++) { for (let j = 0; j < n; j++) { for (let k = 0; k < n; k++) "
+    "{ console.log(i, j, k); } } } }",
+    "function a(n) { return a(n - 1) + b(n); }\nfunction b(n) { return b(n - 1); }",
+    "function perm(a) {\n  if (a.length <= 1) return [a];\n  const out = [];\n"
+    "  for (let i = 0; i < a.length; i++) {\n    for (const p of perm([...a.slice(0, i), ...a.slice(i + 1)])) {\n"
+    "      out.push([a[i], ...p]);\n    }\n  }\n  return out;\n}\n",
+    # Un bucle de nivel superior más caro que la recursión
+    "function f(n) {\n  return n ? f(n - 1) : 0;\n}\nfor (let i = 0; i < n; i++) {\n"
+    "  for (let j = 0; j < n; j++) {\n    f(j);\n  }\n}\n",
+]
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return load_analyzer()
+
+
+@pytest.mark.parametrize('code', CODES)
+@pytest.mark.parametrize('chunk_size', [5, 64, 1 << 20])
+def test_analyze_file_matches_analyze(analyzer, tmp_path, code, chunk_size):
+    path = tmp_path / 'code.js'
+    path.write_text(code, encoding='utf-8')
+    assert analyzer.analyze_file(str(path), chunk_size) == analyzer.analyze(code)
+
+
+@pytest.mark.parametrize('code, expected', [
+    ("let a = 1;\nlet b = 2;\n", ["let a = 1;\n", "let b = 2;\n"]),
+    # do { } while, else y las cadenas de métodos siguen en la misma sentencia
+    ("do {\n  i++;\n}\nwhile (i < n);\nx();\n", ["do {\n  i++;\n}\nwhile (i < n);\n", "x();\n"]),
+    ("if (a) {\n  b();\n}\nelse {\n  c();\n}\nd();", ["if (a) {\n  b();\n}\nelse {\n  c();\n}\n", "d();"]),
+    ("p.then(x => {\n  y();\n})\n.catch(e => {});\n", ["p.then(x => {\n  y();\n})\n.catch(e => {});\n"]),
+    # Ni dentro de llaves ni de cadenas o comentarios
+    ("function f() {\n  a();\n  b();\n}\n", ["function f() {\n  a();\n  b();\n}\n"]),
+    ("const s = `a;\nb`;\n/* c;\n*/ d();\n", ["const s = `a;\nb`;\n", "/* c;\n*/ d();\n"]),
+])
+@pytest.mark.parametrize('chunk_size', [1, 7, 1 << 20])
+def test_statement_splitter(code, expected, chunk_size):
+    splitter = StatementSplitter()
+    statements = []
+    for start in range(0, len(code), chunk_size):
+        statements += splitter.feed(code[start:start + chunk_size])
+    statements += splitter.finish()
+    assert [text for _, text in statements] == expected
+    assert [start for start, _ in statements] == [code.index(text) for text in expected]
+
+
+def test_long_statements_are_approximate():
+    code = CODES[4]
+    recursive = [name for component in analyze_recursion(code)['components'] for name in component]
+    bounds = StreamingBounds(build_function_table(code), recursive, max_statement=40)
+    for start in range(0, len(code), 16):
+        bounds.feed(code[start:start + 16])
+    # Sin el texto de las funciones no hay cotas, pero sí se avisa
+    assert bounds.finish() == {'loop_bound': None, 'recurrence': None, 'approximate': True}
@@ -0,0 +1,170 @@
+"""Corpus etiquetado y almacén de características por fragmentos (Backend.dataset)"""
+
+import json
+import os
+from array import array
+
+import pytest
+
+from Backend import dataset
+from Backend.backend import ComplexityMapper, SimpleNeuralNetwork
+from Backend.dataset import (
+    INDEX_NAME,
+    FeatureStore,
+    build_dataset,
+    label_value,
+    read_manifest,
+    read_shard,
+    write_shard,
+)
+from Backend.matrix import FeatureMatrix
+from Backend.scanner import JavaScriptScanner
+
+CORPUS = {
+    'O(1)/const.js': "let x = 5; x++;\n",
+    'O(n)/sum.js': "for (let i = 0; i < n; i++) { s += a[i]; }\n",
+    'O(n)/find.js': "function find(a, x) { return a.indexOf(x); }\n",
+    'O(n^2)/pairs.js': "for (const a of xs) { for (const b of xs) { f(a, b); } }\n",
+    'O(2^n)/fib.js': "function fib(n) { return n < 2 ? n : fib(n - 1) + fib(n - 2); }\n",
+}
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    root = tmp_path / 'corpus'
+    for name, code in CORPUS.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(code, encoding='utf-8')
+    return root
+
+
+@pytest.mark.parametrize('label, complexity', [
+    ('O(n)', 'O(n)'), (' O(log n) ', 'O(log n)'), ('O(n^2)', 'O(n²)'), ('O(n^3)', 'O(n³)'), ('O(2^n)', 'O(2ⁿ)'),
+])
+def test_label_value(label, complexity):
+    assert label_value(label) == ComplexityMapper.COMPLEXITY_MAP[complexity]
+
+
+def test_unknown_label_is_rejected():
+    with pytest.raises(ValueError):
+        label_value('O(n!)')
+
+
+def test_label_directories(corpus):
+    entries = sorted((os.path.relpath(path, corpus).replace(os.sep, '/'), value)
+                     for path, value in read_manifest(str(corpus)))
+    assert entries == sorted((name, label_value(name.split('/')[0])) for name in CORPUS)
+
+
+def test_manifest_takes_precedence(corpus):
+    (corpus / 'manifest.jsonl').write_text(
+        json.dumps({'path': 'O(n)/sum.js', 'complexity': 'O(n)'}) + '\n\n' +
+        json.dumps({'path': 'O(1)/const.js', 'complexity': 'O(n^2)'}) + '\n', encoding='utf-8')
+    assert list(read_manifest(str(corpus))) == [(os.path.join(str(corpus), 'O(n)/sum.js'), label_value('O(n)')),
+                                                (os.path.join(str(corpus), 'O(1)/const.js'), label_value('O(n²)'))]
+
+
+@pytest.mark.parametrize('line', ['no es JSON', '{"path": "a.js"}', '{"path": "a.js", "complexity": "O(n!)"}'])
+def test_invalid_manifest_lines_are_rejected(tmp_path, line):
+    manifest = tmp_path / 'manifest.jsonl'
+    manifest.write_text(line + '\n', encoding='utf-8')
+    with pytest.raises(ValueError, match='manifest.jsonl:1'):
+        list(read_manifest(str(manifest)))
+
+
+@pytest.mark.parametrize('compress', [True, False])
+def test_shard_round_trip(tmp_path, compress):
+    X = FeatureMatrix.from_rows([[1.5, -2.0, 0.0], [3.25, 1e9, -7.0]], 3)
+    y = array('d', [0.25, 0.75])
+    path = str(tmp_path / 'shard.bin')
+    write_shard(path, X, y, compress)
+    X_read, y_read = read_shard(path)
+    assert X_read.tolist() == X.tolist()
+    assert list(y_read) == list(y)
+
+
+def test_shard_size_mismatch_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        write_shard(str(tmp_path / 'shard.bin'), FeatureMatrix.from_rows([[1.0]], 1), array('d', [0.0, 1.0]))
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+@pytest.mark.parametrize('shard_size', [1, 2, 64])
+def test_build_dataset(corpus, tmp_path, workers, shard_size):
+    store = build_dataset(str(corpus), str(tmp_path / 'store'), shard_size=shard_size, workers=workers, chunksize=1)
+    assert len(store) == len(CORPUS)
+    assert store.shard_count == -(-len(CORPUS) // shard_size)
+
+    rows, labels = [], []
+    for X, y in store:
+        rows += X.tolist()
+        labels += list(y)
+    entries = list(read_manifest(str(corpus)))
+    assert rows == [[float(value) for value in JavaScriptScanner.scan_file(path)] for path, _ in entries]
+    assert labels == [value for _, value in entries]
+    assert store.column_scale() == FeatureMatrix.from_rows(rows, store.columns).column_scale()
+
+
+@pytest.mark.parametrize('content', [b'', b'CXFS', b'XXXX' + bytes(12)])
+def test_invalid_shards_are_rejected(tmp_path, content):
+    path = tmp_path / 'shard.bin'
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        read_shard(str(path))
+
+
+def shard_files(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith('.bin'))
+
+
+def test_rebuild_replaces_previous_shards(corpus, tmp_path):
+    directory = tmp_path / 'store'
+    build_dataset(str(corpus), str(directory), shard_size=1, workers=1)
+    store = build_dataset(str(corpus), str(directory), shard_size=2, workers=1)
+    assert shard_files(directory) == sorted(shard['name'] for shard in store.shards)
+    assert len(store) == len(CORPUS)
+
+
+def test_failed_rebuild_keeps_previous_store(corpus, tmp_path, monkeypatch):
+    directory = tmp_path / 'store'
+    previous = build_dataset(str(corpus), str(directory), shard_size=1, workers=1)
+    rows = [X.tolist() for X, _ in previous]
+    files = shard_files(directory)
+
+    write_shard = dataset.write_shard
+    written = []
+
+    def failing_write_shard(filepath, X, y, compress=True):
+        if written:
+            raise OSError("disco lleno")
+        written.append(filepath)
+        write_shard(filepath, X, y, compress)
+
+    monkeypatch.setattr(dataset, 'write_shard', failing_write_shard)
+    with pytest.raises(OSError):
+        build_dataset(str(corpus), str(directory), shard_size=1, workers=1)
+    assert written
+    assert shard_files(directory) == files
+    assert [X.tolist() for X, _ in FeatureStore(str(directory))] == rows
+
+
+def test_store_rejects_other_feature_versions(corpus, tmp_path):
+    directory = tmp_path / 'store'
+    build_dataset(str(corpus), str(directory), workers=1)
+    index = json.loads((directory / INDEX_NAME).read_text(encoding='utf-8'))
+    index['feature_version'] -= 1
+    (directory / INDEX_NAME).write_text(json.dumps(index), encoding='utf-8')
+    with pytest.raises(ValueError):
+        FeatureStore(str(directory))
+
+
+def test_training_from_store_matches_in_memory(corpus, tmp_path):
+    store = build_dataset(str(corpus), str(tmp_path / 'store'), shard_size=64, workers=1)
+    X, y = store.load_shard(0)
+    stored, memory = (SimpleNeuralNetwork(hidden_layers=(4,), epochs=2, batch_size=2, shuffle=False, use_numpy=False)
+                      for _ in range(2))
+    stored.train_simple(store=store)
+    memory.train_simple(X, y)
+    assert stored.weights == memory.weights
+    assert stored.feature_scale == memory.feature_scale
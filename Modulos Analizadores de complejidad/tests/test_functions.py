@@ -0,0 +1,77 @@
+"""Tabla de funciones, grafo de llamadas y recursión (Backend.functions, Backend.callgraph)"""
+
+import pytest
+
+from Backend.callgraph import build_call_graph, recursion_metrics
+from Backend.functions import analyze_recursion, build_function_table, split_functions
+from Backend.scanner import StreamingScanner
+
+# Código -> [(nombre, profundidad, cuerpo, llamadas)] de cada función por posición
+TABLES = [
+    ("function f(n) {\n  return f(n - 1);\n}",
+     [('f', 0, '\n  return f(n - 1);\n', {'f': 1})]),
+    ("const g = async (a, b) => {\n  return h(a) + h(b);\n};",
+     [('g', 0, '\n  return h(a) + h(b);\n', {'h': 2})]),
+    # Flechas sin llaves: el cuerpo acaba en `;`, `,`, un cierre o un salto de línea
+    ("const f = n => n <= 1 ? 1 : n * f(n - 1);",
+     [('f', 0, 'n <= 1 ? 1 : n * f(n - 1)', {'f': 1})]),
+    ("const fib = n => n < 2\n  ? n\n  : fib(n - 1) + fib(n - 2)\nfib(10)",
+     [('fib', 0, 'n < 2\n  ? n\n  : fib(n - 1) + fib(n - 2)', {'fib': 2})]),
+    ("const ops = { inc: x => x + 1, twice: (x) => g(g(x)) };",
+     [('inc', 1, 'x + 1', {}), ('twice', 1, 'g(g(x)) ', {'g': 2})]),
+    ("run(items.map(x => x * 2))", []),
+    # Métodos de clase y de objeto; su cabecera no es una llamada
+    ("class Parser {\n  parse(n) {\n    return this.parse(n - 1);\n  }\n}",
+     [('parse', 1, '\n    return this.parse(n - 1);\n  ', {'parse': 1})]),
+    ("function make() {\n  return { walk(node) { return walk(node.next); } };\n}",
+     [('make', 0, '\n  return { walk(node) { return walk(node.next); } };\n', {}),
+      ('walk', 2, ' return walk(node.next); ', {'walk': 1})]),
+    # Ni los bloques de control ni las llaves en cadenas o comentarios
+    ("if (x) {\n  y();\n}\nfor (;;) {}\nconst s = '{ f() {';  // g() {",
+     []),
+    ("function outer() {\n  function inner() {\n    return outer();\n  }\n  inner();\n}",
+     [('outer', 0, '\n  function inner() {\n    return outer();\n  }\n  inner();\n', {'inner': 1}),
+      ('inner', 1, '\n    return outer();\n  ', {'outer': 1})]),
+]
+
+
+@pytest.mark.parametrize('code, expected', TABLES)
+def test_function_table(code, expected):
+    table = build_function_table(code)
+    assert [(function['name'], function['depth'], code[function['body_start']:function['body_end']],
+             function['calls']) for function in table] == expected
+
+
+@pytest.mark.parametrize('code, expected', TABLES)
+@pytest.mark.parametrize('chunk_size', [1, 7, 64])
+def test_streaming_table_matches_whole_code(code, expected, chunk_size):
+    scanner = StreamingScanner(window=16)
+    for start in range(0, len(code), chunk_size):
+        scanner.feed(code[start:start + chunk_size])
+    scanner.finish()
+    assert scanner.functions() == build_function_table(code)
+
+
+@pytest.mark.parametrize('code, recursive, depth, branching, components', [
+    ("function f() { return 1; }", 0, 0, 0, []),
+    ("const fib = n => n < 2 ? n : fib(n - 1) + fib(n - 2);", 1, 1, 2, [['fib']]),
+    ("function even(n) { return n ? odd(n - 1) : true; }\n"
+     "function odd(n) { return n ? even(n - 1) : false; }", 2, 1, 1, [['even', 'odd']]),
+    # Una recursión que llama a otra se encadena
+    ("function a(n) { return a(n - 1) + b(n); }\nfunction b(n) { return b(n - 1); }", 2, 2, 1, [['b'], ['a']]),
+    ("class T {\n  size(node) { return node ? this.size(node.left) + this.size(node.right) : 0; }\n}",
+     1, 1, 2, [['size']]),
+])
+def test_recursion_metrics(code, recursive, depth, branching, components):
+    metrics = recursion_metrics(build_call_graph(build_function_table(code)))
+    assert metrics == analyze_recursion(code)
+    assert (metrics['recursive_functions'], metrics['recursion_depth'], metrics['branching_factor'],
+            metrics['components']) == (recursive, depth, branching, components)
+
+
+def test_split_functions_lists_top_level_functions():
+    code = ("function a() {\n  function inner() {}\n}\n\n"
+            "const b = x => x + 1;\n"
+            "class C {\n  m() {}\n}\n")
+    assert [(function['name'], function['start_line'], function['end_line'])
+            for function in split_functions(code)] == [('a', 1, 3), ('b', 5, 5)]
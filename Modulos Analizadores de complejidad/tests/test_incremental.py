@@ -0,0 +1,142 @@
+"""Paridad del análisis incremental por bloques con el recorrido completo"""
+
+import random
+
+import pytest
+
+from Backend import incremental
+from Backend.backend import NeuralNetworkComplexityAnalyzer
+from Backend.functions import analyze_recursion
+from Backend.incremental import IncrementalFeatureExtractor, split_blocks
+from Backend.loops import analyze_loops
+from Backend.patterns import MIDPOINT_VARIABLE, RANGE_VARIABLE
+from Backend.recurrence import RecurrenceSolver
+from Backend.scanner import JavaScriptScanner
+
+# Fragmentos con llaves en cadenas, plantillas y comentarios de varias
+# líneas, cuerpos sin sangría y llaves desbalanceadas
+PIECES = [
+    "function sumTo(n) {\nif (n <= 0) return 0;\nconst rest = sumTo(n - 1);\nreturn n + rest;\n}\n",
+    "const s = '{';\n",
+    "let t = `a {\n b;\n}`;\n",
+    "/* {\n x; */\n",
+    "// }\n",
+    "for (let i = 0; i < n; i++) {\n  for (let j = 0; j < n; j++) {\n    a[i] += j;\n  }\n}\n",
+    "function fib(n) {\n  if (n <= 1) return n;\n  return fib(n - 1) + fib(n - 2);\n}\n",
+    "const f = (x) => {\nlet y = x * 2;\nreturn g(y);\n};\n",
+    "function g(y) {\nreturn f(y - 1);\n}\n",
+    "while (lo <= hi) {\nconst mid = Math.floor((lo + hi) / 2);\nif (a[mid] < t) lo = mid + 1; else hi = mid - 1;\n}\n",
+    "class A {\n  run() {\n    return this.run();\n  }\n}\n",
+    "const fact = n => n <= 1 ? 1 : n * fact(n - 1);\n",
+    "const inc = x => x + 1\n",
+    "x.sort();\nJSON.parse(s);\n",
+    "}\n",
+    "{\n",
+    "if (a) {\n  b();\n} else {\n  c();\n}\n",
+    "try {\n  q();\n} catch (e) {\n}\n",
+    "\n\n",
+    "do {\n  i++;\n}\nwhile (i < n);\n",
+    "function bs(a, x, left, right) {\n  if (left > right) return -1;\n  const mid = (left + right) >> 1;\n"
+    "  return a[mid] < x ? bs(a, x, mid + 1, right) : bs(a, x, left, mid - 1);\n}\n",
+    "for (let i = 1; i < n; i *= 2) {\n  for (let j = 0; j < n; j++) { s++; }\n}\n",
+    "function h(n) {\n  for (let i = 0; i < n; i++) {\n    h(n - 1);\n  }\n}\n",
+]
+
+
+@pytest.mark.parametrize('code, blocks', [
+    ("let a = 1;\nlet b = 2;\n", 2),
+    # Cuerpo sin sangría: no se corta dentro de la función
+    ("function sumTo(n) {\nif (n <= 0) return 0;\nconst rest = sumTo(n - 1);\nreturn n + rest;\n}", 1),
+    # Llaves dentro de cadenas y comentarios no cuentan
+    ("const s = '{';\nlet x = 1;\n", 2),
+    ("// {\nlet x = 1;\nlet y = 2;\n", 2),
+    # Ni dentro de una plantilla de varias líneas
+    ("let t = `a;\nb;\n`;\nlet y = 2;\n", 2),
+    # Ni antes de una línea que continúa la sentencia: el bucle queda entero
+    ("do {\n  i++;\n}\nwhile (i < n);\nlet y = 2;\n", 2),
+    ("if (a) {\n  b();\n}\nelse {\n  c();\n}\n", 1),
+])
+def test_split_blocks(code, blocks):
+    parts = split_blocks(code)
+    assert ''.join(parts) == code
+    assert len(parts) == blocks
+
+
+def test_unindented_recursive_body_matches_full_scan():
+    code = PIECES[0]
+    features = IncrementalFeatureExtractor().extract_features(code)
+    assert features == JavaScriptScanner.scan(code)
+    assert features[4] == 1
+
+
+def test_edits_match_full_scan():
+    rng = random.Random(7)
+    extractor = IncrementalFeatureExtractor()
+    for _ in range(500):
+        lines = [rng.choice(PIECES) for _ in range(rng.randint(1, 8))]
+        for _ in range(4):
+            code = ''.join(lines)
+            assert extractor.extract_features(code) == JavaScriptScanner.scan(code), code
+            position = rng.randrange(len(lines) + 1)
+            if rng.random() < 0.5 or not lines:
+                lines.insert(position, rng.choice(PIECES))
+            else:
+                lines.pop(min(position, len(lines) - 1))
+    assert extractor.hits > extractor.misses
+
+
+def full_analysis(code):
+    """Lo que predict calcula desde el código entero cuando no recibe nada precalculado"""
+    features = JavaScriptScanner.scan(code)
+    recursion, total_loops = features[4], features[1] + features[2]
+    shape, loop_bound, recurrence = (0, 0), None, None
+    if recursion:
+        metrics = analyze_recursion(code)
+        shape = (metrics['recursion_depth'], metrics['branching_factor'])
+        recurrence = RecurrenceSolver().dominant(code)
+    elif total_loops:
+        structure = analyze_loops(code)
+        if structure['loops']:
+            loop_bound = (structure['degree'], structure['log_degree'], structure['certain'])
+    hints = (RANGE_VARIABLE.search(code) is not None, MIDPOINT_VARIABLE.search(code) is not None)
+    return features, {'hints': hints, 'recursion_shape': shape, 'loop_bound': loop_bound, 'recurrence': recurrence}
+
+
+def test_edits_match_full_analysis():
+    rng = random.Random(11)
+    extractor = IncrementalFeatureExtractor()
+    for _ in range(300):
+        lines = [rng.choice(PIECES) for _ in range(rng.randint(1, 8))]
+        for _ in range(4):
+            code = ''.join(lines)
+            assert extractor.analyze(code) == full_analysis(code), code
+            position = rng.randrange(len(lines) + 1)
+            if rng.random() < 0.5 or not lines:
+                lines.insert(position, rng.choice(PIECES))
+            else:
+                lines.pop(min(position, len(lines) - 1))
+
+
+def test_edit_only_profiles_changed_block(monkeypatch):
+    profiled = []
+    profile_function = incremental.profile_function
+    monkeypatch.setattr(incremental, 'profile_function',
+                        lambda header, body: profiled.append(header) or profile_function(header, body))
+    extractor = IncrementalFeatureExtractor()
+    code = PIECES[0] + PIECES[6] + PIECES[-1]
+    extractor.analyze(code)
+    assert len(profiled) == 3
+    extractor.analyze(code.replace("fib(n - 2)", "fib(n - 3)"))
+    assert profiled[3:] == ["function fib(n) {"]
+
+
+def test_analyzer_with_incremental_extractor_matches_full():
+    full = NeuralNetworkComplexityAnalyzer(hidden_layers=(8,), deterministic=True, use_numpy=False)
+    full.is_trained = True
+    blocks = NeuralNetworkComplexityAnalyzer(hidden_layers=(8,), deterministic=True, use_numpy=False)
+    blocks.is_trained = True
+    blocks.feature_extractor = IncrementalFeatureExtractor()
+    rng = random.Random(5)
+    for _ in range(100):
+        code = ''.join(rng.choice(PIECES) for _ in range(rng.randint(1, 6)))
+        assert blocks.analyze(code) == full.analyze(code), code
@@ -0,0 +1,71 @@
+"""Vueltas de cada bucle y cota por anidamiento (Backend.loops)"""
+
+import pytest
+
+from Backend.loops import analyze_loops, bound_to_complexity, classify_for, classify_while
+
+
+@pytest.mark.parametrize('header, trip', [
+    ("let i = 0; i < n; i++", 'linear'),
+    ("let i = n; i > 0; i--", 'linear'),
+    ("let i = 0; i < n; i += 2", 'linear'),
+    ("let i = 0; i < 10; i++", 'constant'),
+    ("let i = 1; i < n; i *= 2", 'log'),
+    ("let i = n; i > 0; i >>= 1", 'log'),
+    ("const x of xs", 'linear'),
+    ("let i = 0; i < n; ", 'unknown'),
+])
+def test_classify_for(header, trip):
+    assert classify_for(header) == trip
+
+
+@pytest.mark.parametrize('condition, body, trip', [
+    ("i < n", "i++;", 'linear'),
+    ("node", "node = node.left;", 'linear'),
+    ("i < n", "i = i * 3;", 'log'),
+    ("n > 0", "n = Math.floor(n / 10);", 'log'),
+    ("lo <= hi", "mid = (lo + hi) >> 1; lo = mid + 1;", 'log'),
+    ("x", "f();", 'unknown'),
+])
+def test_classify_while(condition, body, trip):
+    assert classify_while(condition, body) == trip
+
+
+@pytest.mark.parametrize('code, bound, trips', [
+    ("let x = 1;", (0, 0, True, 'O(1)'), []),
+    ("for (let i = 0; i < n; i++) { s += i; }", (1, 0, True, 'O(n)'), [('for', 'linear', 0)]),
+    ("for (let i = 0; i < 10; i++) { s += i; }", (0, 0, True, 'O(1)'), [('for', 'constant', 0)]),
+    ("for (let i = 1; i < n; i *= 2) { s += i; }", (0, 1, True, 'O(log n)'), [('for', 'log', 0)]),
+    ("for (let i = 0; i < n; i++) {\n  for (let j = 1; j < n; j *= 2) { s++; }\n}",
+     (1, 1, True, 'O(n log n)'), [('for', 'linear', 0), ('for', 'log', 1)]),
+    ("for (let i = 0; i < n; i++) {\n  for (let j = 0; j < n; j++) {\n    for (let k = 0; k < n; k++) { s++; }\n  }\n}",
+     (3, 0, True, 'O(n³)'), [('for', 'linear', 0), ('for', 'linear', 1), ('for', 'linear', 2)]),
+    ("for (const x of items) { for (const y of items) { f(x, y); } }",
+     (2, 0, True, 'O(n²)'), [('for', 'linear', 0), ('for', 'linear', 1)]),
+    # Búsqueda binaria y mitades
+    ("while (lo <= hi) {\n  const mid = Math.floor((lo + hi) / 2);\n"
+     "  if (a[mid] < x) lo = mid + 1; else hi = mid - 1;\n}",
+     (0, 1, True, 'O(log n)'), [('while', 'log', 0)]),
+    ("while (n > 1) { n = n / 2; }", (0, 1, True, 'O(log n)'), [('while', 'log', 0)]),
+    ("while (node) { node = node.next; }", (1, 0, True, 'O(n)'), [('while', 'linear', 0)]),
+    ("do { i++; } while (i < n);", (1, 0, True, 'O(n)'), [('do', 'linear', 0)]),
+    # Vueltas desconocidas: lineales, pero la cota no es segura
+    ("while (running) { poll(); }", (1, 0, False, 'O(n)'), [('while', 'unknown', 0)]),
+    ("for (let i = 0; i < n; i++) { while (busy) { wait(); } }",
+     (2, 0, False, 'O(n²)'), [('for', 'linear', 0), ('while', 'unknown', 1)]),
+    # Bucles seguidos: cuenta el más caro, no el producto
+    ("for (let i = 0; i < n; i++) { g(); }\nfor (let j = 1; j < n; j <<= 1) { h(); }",
+     (1, 0, True, 'O(n)'), [('for', 'linear', 0), ('for', 'log', 0)]),
+    ("// for (let i = 0; i < n; i++) {\nconst s = 'while (x) {}';", (0, 0, True, 'O(1)'), []),
+])
+def test_analyze_loops(code, bound, trips):
+    structure = analyze_loops(code)
+    assert (structure['degree'], structure['log_degree'], structure['certain'], structure['complexity']) == bound
+    assert [(loop['kind'], loop['trip'], loop['depth']) for loop in structure['loops']] == trips
+
+
+@pytest.mark.parametrize('degree, log_degree, complexity', [
+    (0, 0, 'O(1)'), (0, 2, 'O(log n)'), (1, 0, 'O(n)'), (1, 1, 'O(n log n)'), (2, 1, 'O(n²)'), (4, 0, 'O(n³)'),
+])
+def test_bound_to_complexity(degree, log_degree, complexity):
+    assert bound_to_complexity(degree, log_degree) == complexity
@@ -0,0 +1,86 @@
+"""Motores de la red: NumPy, listas y entrenamiento en paralelo (Backend.backend, Backend.parallel)"""
+
+import pytest
+
+import train_500_epochs
+from Backend.backend import NUMPY_AVAILABLE, NeuralNetworkComplexityAnalyzer, SimpleNeuralNetwork
+from Backend.parallel import min_parallel_batch
+
+needs_numpy = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy no está instalado")
+
+SAMPLES = 96
+
+
+@pytest.fixture(scope='module')
+def data():
+    return NeuralNetworkComplexityAnalyzer(hidden_layers=(8,)).generate_training_data(SAMPLES)
+
+
+def network(use_numpy, **options):
+    options = {'hidden_layers': (8, 4), 'epochs': 4, 'batch_size': 16, 'deterministic': True, **options}
+    return SimpleNeuralNetwork(input_size=20, use_numpy=use_numpy, **options)
+
+
+def parameters(model):
+    """Pesos y sesgos como listas planas (de cualquiera de los dos motores)"""
+    flat = []
+    for w, b in zip(model.weights, model.biases):
+        flat.extend(float(value) for row in w for value in row)
+        flat.extend(float(value) for value in b)
+    return flat
+
+
+@needs_numpy
+def test_same_initial_weights():
+    assert parameters(network(True)) == parameters(network(False))
+
+
+@needs_numpy
+@pytest.mark.parametrize('shuffle', [True, False])
+@pytest.mark.parametrize('batch_size', [1, 16, SAMPLES])
+def test_training_matches_between_engines(data, shuffle, batch_size):
+    X, y = data
+    matrix, lists = network(True, shuffle=shuffle, batch_size=batch_size), network(False, shuffle=shuffle,
+                                                                                   batch_size=batch_size)
+    matrix.train_simple(X, y)
+    lists.train_simple(X, y)
+    assert parameters(matrix) == pytest.approx(parameters(lists), rel=1e-9, abs=1e-12)
+    assert [entry['loss'] for entry in matrix.training_history] == \
+        pytest.approx([entry['loss'] for entry in lists.training_history], rel=1e-9)
+
+
+@needs_numpy
+def test_inference_matches_between_engines(data):
+    X, y = data
+    matrix, lists = network(True), network(False)
+    matrix.train_simple(X, y)
+    lists.train_simple(X, y)
+    assert list(matrix.forward_batch(X)) == pytest.approx(list(lists.forward_batch(X)), rel=1e-9)
+    for row in X.rows(0, 8):
+        assert matrix.predict(list(row)) == pytest.approx(lists.predict(list(row)), rel=1e-9)
+
+
+@pytest.mark.parametrize('use_numpy', [pytest.param(True, marks=needs_numpy), False])
+def test_infer_matches_forward_batch(data, use_numpy):
+    X, y = data
+    model = network(use_numpy)
+    model.train_simple(X, y)
+    scaled = X.scaled(model.feature_scale)
+    assert [model.infer(row) for row in scaled.rows(0, 8)] == pytest.approx(list(model.forward_batch(X))[:8], rel=1e-12)
+
+
+@pytest.mark.parametrize('use_numpy', [pytest.param(True, marks=needs_numpy), False])
+def test_parallel_training_matches_serial(data, use_numpy):
+    X, y = data
+    serial, parallel = network(use_numpy, epochs=2), network(use_numpy, epochs=2)
+    serial.train_simple(X, y)
+    parallel.train_simple(X, y, workers=2)
+    assert parameters(parallel) == pytest.approx(parameters(serial), rel=1e-9, abs=1e-12)
+
+
+def test_training_script_rejects_workers_below_min_batch():
+    minimum = min_parallel_batch(NUMPY_AVAILABLE)
+    assert train_500_epochs.parse_args(['--workers', '2', '--batch-size', str(minimum)]).workers == 2
+    assert train_500_epochs.parse_args(['--batch-size', '1']).workers == 1
+    with pytest.raises(SystemExit):
+        train_500_epochs.parse_args(['--workers', '2', '--batch-size', str(minimum - 1)])
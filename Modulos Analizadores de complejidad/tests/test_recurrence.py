@@ -0,0 +1,149 @@
+"""Recurrencias de las funciones recursivas (Backend.recurrence)"""
+
+import pytest
+
+from Backend.recurrence import (
+    CONSTANT_COST,
+    LINEAR_COST,
+    RecurrenceSolver,
+    critical_exponent,
+    profile_function,
+    recurrence_bound,
+    solve_recurrence,
+)
+
+# Recurrencias de libro: función -> (complejidad, método, llamadas por invocación)
+STANDARD = [
+    # T(n) = T(n - 1) + O(1)
+    ("function sum(n) { return n === 0 ? 0 : n + sum(n - 1); }", 'sum', ('O(n)', 'subtract', 1)),
+    # T(n) = 2T(n - 1) + O(1): Fibonacci, Hanói
+    ("function fib(n) { if (n <= 1) return n; return fib(n - 1) + fib(n - 2); }", 'fib', ('O(2ⁿ)', 'subtract', 2)),
+    ("function hanoi(n, a, b, c) { if (n === 0) return; hanoi(n - 1, a, c, b); hanoi(n - 1, c, b, a); }",
+     'hanoi', ('O(2ⁿ)', 'subtract', 2)),
+    # T(n) = T(n / 2) + O(1): búsqueda binaria, potencia rápida (las ramas del if son alternativas)
+    ("function bs(a, x, lo, hi) {\n  if (lo > hi) return -1;\n  const mid = Math.floor((lo + hi) / 2);\n"
+     "  if (a[mid] === x) return mid;\n  if (a[mid] < x) return bs(a, x, mid + 1, hi);\n"
+     "  return bs(a, x, lo, mid - 1);\n}",
+     'bs', ('O(log n)', 'master', 1)),
+    ("function pow(x, n) { if (n === 0) return 1; const h = pow(x, n >> 1); return n % 2 ? h * h * x : h * h; }",
+     'pow', ('O(log n)', 'master', 1)),
+    # T(n) = 2T(n / 2) + O(n): ordenación por mezcla y quicksort con filter
+    ("function mergeSort(arr) {\n  if (arr.length <= 1) return arr;\n  const mid = Math.floor(arr.length / 2);\n"
+     "  return merge(mergeSort(arr.slice(0, mid)), mergeSort(arr.slice(mid)));\n}",
+     'mergeSort', ('O(n log n)', 'master', 2)),
+    ("function qs(arr) {\n  if (arr.length <= 1) return arr;\n  const p = arr[0];\n"
+     "  return [...qs(arr.slice(1).filter(x => x < p)), p, ...qs(arr.slice(1).filter(x => x >= p))];\n}",
+     'qs', ('O(n log n)', 'master', 2)),
+    # T(n) = 2T(n / 2) + O(1) y T(n) = 3T(n / 2) + O(n): n^log2(3) se redondea hacia arriba
+    ("function count(n) { if (n <= 1) return 1; return count(n / 2) + count(n / 2); }", 'count', ('O(n)', 'master', 2)),
+    ("function k(n) { if (n <= 1) return 1; let s = 0; for (let i = 0; i < n; i++) s++;\n"
+     "  return k(n / 2) + k(n / 2) + k(n / 2) + s; }", 'k', ('O(n²)', 'master', 3)),
+    # Árboles: cada nodo una vez
+    ("function height(node) { if (!node) return 0; return 1 + Math.max(height(node.left), height(node.right)); }",
+     'height', ('O(n)', 'structural', 2)),
+    ("function walk(node) {\n  for (const child of node.children) {\n    walk(child);\n  }\n}",
+     'walk', ('O(n)', 'structural', 1)),
+]
+
+
+@pytest.mark.parametrize('code, name, expected', STANDARD)
+def test_standard_recurrences(code, name, expected):
+    result = RecurrenceSolver().solve(code)[name]
+    assert result['recursive']
+    assert (result['complexity'], result['method'], result['calls']) == expected
+
+
+@pytest.mark.parametrize('body, expected', [
+    # (callee, coste de los bucles que la rodean, cuántos bucles, dentro de un return)
+    ("g(); return h(n);", [('g', CONSTANT_COST, 0, False), ('h', CONSTANT_COST, 0, True)]),
+    ("for (let i = 0; i < n; i++) {\n  g(i);\n  for (let j = 1; j < n; j *= 2) { h(j); }\n}\nk();",
+     [('g', LINEAR_COST, 1, False), ('h', (0, 1, 1), 2, False), ('k', CONSTANT_COST, 0, False)]),
+    ("for (const x of xs) for (const y of ys) g(x, y);\nif (n) return h(n - 1), k(n);",
+     [('g', (0, 2, 0), 2, False), ('h', CONSTANT_COST, 0, True), ('k', CONSTANT_COST, 0, True)]),
+    # Código minificado: la sentencia termina en el `;`, no al principio de la línea
+    ("x=g(n);return h(n);y=k(n)", [('g', CONSTANT_COST, 0, False), ('h', CONSTANT_COST, 0, True),
+                                  ('k', CONSTANT_COST, 0, False)]),
+])
+def test_profile_call_sites(body, expected):
+    # CALL_SITE también ve `for (` e `if (`: el grafo de llamadas solo usa las de funciones conocidas
+    calls = [c for c in profile_function("function f(n) {", body)['calls'] if c['callee'] not in ('for', 'if')]
+    assert [(c['callee'], c['product'], len(c['loops']), c['statement'] is not None) for c in calls] == expected
+
+
+def call(kind, factor=1, varies=False):
+    return {'shrink': (kind, factor), 'varies': varies}
+
+
+@pytest.mark.parametrize('calls, work, expected', [
+    ([call('subtract')], CONSTANT_COST, ((0, 1, 0), 'subtract')),
+    ([call('subtract')], LINEAR_COST, ((0, 2, 0), 'subtract')),
+    ([call('subtract'), call('subtract')], CONSTANT_COST, ((1, 0, 0), 'subtract')),
+    ([call('divide', 2)], CONSTANT_COST, ((0, 0, 1), 'master')),
+    ([call('divide', 2), call('divide', 2)], LINEAR_COST, ((0, 1, 1), 'master')),
+    ([call('divide', 2)] * 4, LINEAR_COST, ((0, 2.0, 0), 'master')),
+    ([call('divide', 4)], LINEAR_COST, (LINEAR_COST, 'master')),
+    # T(n) = T(n / 3) + T(2n / 3) + n (Akra–Bazzi, p = 1)
+    ([call('divide', 3), call('divide', 1.5)], LINEAR_COST, ((0, 1, 1), 'akra-bazzi')),
+    ([call('structural'), call('structural')], CONSTANT_COST, (LINEAR_COST, 'structural')),
+    ([call('unknown')], CONSTANT_COST, (LINEAR_COST, 'structural')),
+    # Una llamada distinta en cada vuelta de un bucle sobre n: n · T(n - 1), vuelta atrás
+    ([call('subtract', varies=True)], CONSTANT_COST, ((1, 0, 0), 'loop')),
+    ([call('unknown', varies=True)], CONSTANT_COST, ((1, 0, 0), 'loop')),
+    ([call('structural', varies=True)], CONSTANT_COST, (LINEAR_COST, 'structural')),
+    ([call('divide', 2)], (1, 0, 0), ((1, 0, 0), 'exponential-work')),
+])
+def test_solve_recurrence(calls, work, expected):
+    cost, method = solve_recurrence(calls, work)
+    assert (tuple(round(value, 9) for value in cost), method) == expected
+
+
+@pytest.mark.parametrize('factors, exponent', [
+    ([2], 0.0), ([2, 2], 1.0), ([2, 2, 2, 2], 2.0), ([3, 1.5], 1.0), ([2, 2, 2], 1.584962500721156),
+])
+def test_critical_exponent(factors, exponent):
+    assert critical_exponent(factors) == pytest.approx(exponent)
+
+
+@pytest.mark.parametrize('code, expected', [
+    ("let x = 1;", None),
+    ("function f(n) { for (let i = 0; i < n; i++) {} }", None),
+    # Una función sin parámetros junto a la recursiva
+    ("function main() {\n  return f(10);\n}\nfunction f(n) {\n  return n ? f(n - 1) : 0;\n}", ('O(n)', True)),
+    ("class A {\n  m() { return 1; }\n  f(n) { return n ? this.f(n - 1) : 0; }\n}", ('O(n)', True)),
+    # Recursión mutua
+    ("function even(n) { return n ? odd(n - 1) : true; }\nfunction odd(n) { return n ? even(n - 1) : false; }",
+     ('O(n)', True)),
+    # Los bucles del resto del código cuentan si son más caros
+    ("function f(n) { return n ? f(n - 1) : 0; }\nfor (let i = 0; i < n; i++) { for (let j = 0; j < n; j++) {} }",
+     ('O(n²)', True)),
+    # Una llamada recursiva por vuelta de un bucle sobre n: permutaciones y vuelta atrás
+    ("function perm(a) {\n  if (a.length <= 1) return [a];\n  const out = [];\n"
+     "  for (let i = 0; i < a.length; i++) {\n    const rest = a.slice(0, i).concat(a.slice(i + 1));\n"
+     "    for (const p of perm(rest)) out.push([a[i], ...p]);\n  }\n  return out;\n}", ('O(2ⁿ)', True)),
+    ("function bt(path, used) {\n  if (path.length === n) return;\n  for (let i = 0; i < n; i++) {\n"
+     "    if (!used[i]) { used[i] = true; path.push(i); bt(path, used); path.pop(); used[i] = false; }\n  }\n}",
+     ('O(2ⁿ)', False)),
+    ("function f(n) {\n  for (let i = 0; i < n; i++) {\n    f(i);\n  }\n}", ('O(2ⁿ)', False)),
+    # Ni si el argumento no cambia con el contador: quicksort con el bucle de cola
+    ("function partition(arr, lo, hi) {\n  let i = lo;\n  for (let j = lo; j < hi; j++) {\n"
+     "    if (arr[j] < arr[hi]) { swap(arr, i, j); i++; }\n  }\n  swap(arr, i, hi);\n  return i;\n}\n"
+     "function quickSort(arr, lo, hi) {\n  while (lo < hi) {\n    const p = partition(arr, lo, hi);\n"
+     "    quickSort(arr, lo, p - 1);\n    lo = p + 1;\n  }\n}", ('O(n²)', False)),
+    ("function g(n) {\n  if (n === 0) return;\n  for (let i = 0; i < n; i++) {\n    g(n - 1);\n  }\n}",
+     ('O(n²)', True)),
+    # Pero no si el bucle recorre las partes de la estructura o tiene vueltas fijas
+    ("function walk(node) {\n  for (let i = 0; i < node.children.length; i++) {\n    walk(node.children[i]);\n  }\n}",
+     ('O(n)', True)),
+    ("function fill(g, x, y) {\n  if (g[x][y]) return;\n  g[x][y] = 1;\n"
+     "  for (let d = 0; d < 4; d++) {\n    fill(g, x + dx[d], y + dy[d]);\n  }\n}", ('O(n)', False)),
+])
+def test_recurrence_bound(code, expected):
+    assert recurrence_bound(code) == expected
+
+
+def test_solver_reuses_unchanged_function_profiles():
+    solver = RecurrenceSolver()
+    solver.solve("function a(n) { return a(n - 1); }\nfunction b(n) { return b(n / 2); }")
+    assert (solver.hits, solver.misses) == (0, 2)
+    solver.solve("function a(n) { return a(n - 1) + 1; }\nfunction b(n) { return b(n / 2); }")
+    assert (solver.hits, solver.misses) == (1, 3)
@@ -0,0 +1,112 @@
+"""Vector de 20 características en una pasada y por trozos (Backend.scanner)"""
+
+import re
+
+import pytest
+
+from Backend.backend import CodeFeatureExtractor
+from Backend.scanner import FEATURE_COUNT, JavaScriptScanner, StreamingScanner
+
+
+def reference_nesting(code):
+    """Anidamiento de bucles por líneas: aperturas de for/while/do menos llaves de cierre"""
+    nesting = max_nesting = 0
+    for line in code.split('\n'):
+        nesting += len(re.findall(r'\b(?:for|while|do)\s*[({]', line))
+        nesting = max(0, nesting - line.count('}'))
+        max_nesting = max(max_nesting, nesting)
+    return max_nesting
+
+
+def reference_features(code):
+    """Las 20 características con una expresión regular por característica (la definición original)"""
+    for_loops = len(re.findall(r'\bfor\s*\(', code))
+    while_loops = len(re.findall(r'\bwhile\s*\(', code))
+    nested_loops = reference_nesting(code)
+    indents = [len(line) - len(line.lstrip()) for line in code.split('\n') if line.strip()]
+    total_loops = for_loops + while_loops
+    return [
+        len(code.split('\n')),
+        for_loops,
+        while_loops,
+        nested_loops,
+        CodeFeatureExtractor.count_recursion_calls(code),
+        len(re.findall(r'\.(push|pop|map|filter|reduce|forEach|find|some|every)\s*\(', code)),
+        len(re.findall(r'\.(indexOf|includes|findIndex)\s*\(', code)),
+        len(re.findall(r'\.(sort|reverse)\s*\(', code)),
+        max(indents) // 4 if indents else 0,
+        len(re.findall(r'\b(let|const|var)\s+\w+', code)),
+        len(re.findall(r'\bif\s*\(', code)),
+        len(re.findall(r'\bswitch\s*\(', code)),
+        len(code),
+        len(re.findall(r'\bfunction\s+\w+|\w+\s*:\s*function|\w+\s*=\s*\(\s*\)', code)),
+        len(re.findall(r'\.(substring|slice|split|replace|charAt|charCodeAt)\s*\(', code)),
+        len(re.findall(r'Object\.(keys|values|entries|assign)', code)),
+        len(re.findall(r'JSON\.(parse|stringify)', code)),
+        len(re.findall(r'\btry\s*\{', code)),
+        len(re.findall(r'\basync\s*\(|Promise|\.then\(|\.catch\(', code)),
+        total_loops * max(1, nested_loops) if total_loops > 0 else 1,
+    ]
+
+
+CODES = [
+    "",
+    "let x = 5; x++;",
+    "function linearSearch(arr, target) { for (let i = 0; i < arr.length; i++) { if (arr[i] === target) return i; } "
+    "return -1; }",
+    "for (let i = 0; i < n; i++) {\n    for (let j = 0; j < n; j++) {\n        for (let k = 0; k < n; k++) {\n"
+    "            sum += a[i][k] * b[k][j];\n        }\n    }\n}\n",
+    "function binarySearch(arr, x) {\n  let left = 0, right = arr.length - 1;\n  while (left <= right) {\n"
+    "    const mid = Math.floor((left + right) / 2);\n    if (arr[mid] === x) return mid;\n"
+    "    if (arr[mid] < x) left = mid + 1; else right = mid - 1;\n  }\n  return -1;\n}\n",
+    "function fib(n) { if (n <= 1) return n; return fib(n - 1) + fib(n - 2); }",
+    "const even = n => n === 0 ? true : odd(n - 1);\nconst odd = n => n === 0 ? false : even(n - 1);\n",
+    "do {\n  i++;\n} while (i < n);\nswitch (x) { case 1: break; }\n",
+    "async function load(url) {\n  try {\n    const data = JSON.parse(await fetch(url).then(r => r.text()));\n"
+    "    return Object.keys(data).map(k => k.split('_')).sort();\n  } catch (e) {\n"
+    "    return Promise.reject(e);\n  }\n}\n",
+    "const obj = { run: function () { return items.filter(x => x.includes('a')).reverse(); } };\n"
+    "const make = () => [1, 2].indexOf(2);\n",
+    # Llaves y palabras clave en cadenas, comentarios y plantillas
+    "// for (;;) {\nconst s = 'while (x) {';\n/* function f() { f(); } */\nconst t = `${a}\n  for (b) {`;\n",
+    "class Tree {\n  size(node) {\n    return node ? this.size(node.left) + this.size(node.right) + 1 : 0;\n  }\n}\n",
+    "\tif (a) {\n\t\tb();\n\t}\n  \n   trailing();   ",
+]
+
+
+@pytest.mark.parametrize('code', CODES)
+def test_scan_matches_reference(code):
+    features = JavaScriptScanner.scan(code)
+    assert len(features) == FEATURE_COUNT
+    assert features == reference_features(code)
+    assert CodeFeatureExtractor.extract_features(code) == features
+    assert CodeFeatureExtractor.count_nested_loops(code) == features[3]
+
+
+@pytest.mark.parametrize('code', CODES)
+@pytest.mark.parametrize('chunk_size', [1, 3, 17, 4096])
+def test_streaming_matches_scan(code, chunk_size):
+    scanner = StreamingScanner()
+    for start in range(0, len(code), chunk_size):
+        scanner.feed(code[start:start + chunk_size])
+    assert scanner.finish() == JavaScriptScanner.scan(code)
+
+
+@pytest.mark.parametrize('code', CODES)
+def test_scan_file_matches_scan(tmp_path, code):
+    path = tmp_path / 'code.js'
+    path.write_bytes(code.encode('utf-8'))
+    assert JavaScriptScanner.scan_file(str(path), chunk_size=7) == JavaScriptScanner.scan(code)
+
+
+@pytest.mark.parametrize('raw, text', [
+    # Saltos de línea universales y UTF-8 partido entre trozos, como open()
+    (b"let a = 1;\r\nlet b = 2;\r\n", "let a = 1;\nlet b = 2;\n"),
+    (b"let a = 1;\rfor (;;) {}\r", "let a = 1;\nfor (;;) {}\n"),
+    ("const s = 'ñandú €';\n".encode('utf-8'), "const s = 'ñandú €';\n"),
+])
+@pytest.mark.parametrize('chunk_size', [1, 2, 5])
+def test_scan_file_decodes_like_open(tmp_path, raw, text, chunk_size):
+    path = tmp_path / 'code.js'
+    path.write_bytes(raw)
+    assert JavaScriptScanner.scan_file(str(path), chunk_size) == JavaScriptScanner.scan(text)
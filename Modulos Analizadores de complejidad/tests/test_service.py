@@ -0,0 +1,114 @@
+"""Códigos de estado del servicio HTTP/JSON (Backend.service)"""
+
+import asyncio
+import http.client
+import json
+import threading
+
+import pytest
+
+from Backend.service import AnalysisService, HTTPError
+
+WORKERS = 2
+MAX_BODY = 4096
+
+
+@pytest.fixture(scope='module')
+def service():
+    """Servicio con 2 procesos en un bucle asyncio propio (en otro hilo)"""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    service = AnalysisService(workers=WORKERS, max_body=MAX_BODY)
+    asyncio.run_coroutine_threadsafe(service.start('127.0.0.1', 0), loop).result(timeout=60)
+    service.loop = loop
+    yield service
+    asyncio.run_coroutine_threadsafe(service.close(), loop).result(timeout=60)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=10)
+
+
+def request(service, method, path, body=None):
+    """(estado, cabeceras, JSON) de una petición al servicio"""
+    connection = http.client.HTTPConnection(*service.address, timeout=60)
+    try:
+        connection.request(method, path, body=body)
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def batch(size):
+    return json.dumps({'codes': [f'let x{i} = {i};' for i in range(size)]})
+
+
+def test_defaults_keep_batches_within_pending_limit(service):
+    assert service.max_pending == 4 * WORKERS
+    assert service.max_batch == service.max_pending
+
+
+@pytest.mark.parametrize('method, path, body, status', [
+    ('GET', '/health', None, 200),
+    ('GET', '/nope', None, 404),
+    ('GET', '/analyze', None, 405),
+    ('POST', '/analyze', 'no es JSON', 400),
+    ('POST', '/analyze', json.dumps({'code': 1}), 400),
+    ('POST', '/analyze', json.dumps({'code': 'for (let i = 0; i < n; i++) {}'}), 200),
+    ('POST', '/analyze', 'x' * (MAX_BODY + 1), 413),
+    ('POST', '/analyze/batch', json.dumps({'codes': 'let x = 1;'}), 400),
+    # Límite del lote: max_pending fragmentos caben con el servicio libre,
+    # uno más es 413 (no 503, que el cliente reintentaría sin fin)
+    ('POST', '/analyze/batch', batch(4 * WORKERS), 200),
+    ('POST', '/analyze/batch', batch(4 * WORKERS + 1), 413),
+])
+def test_status(service, method, path, body, status):
+    assert request(service, method, path, body)[0] == status
+
+
+def test_batch_results_keep_order(service):
+    codes = ['let x = 1;', 'for (let i = 0; i < n; i++) {}']
+    status, _, payload = request(service, 'POST', '/analyze/batch', json.dumps({'codes': codes}))
+    assert status == 200
+    assert [result['complexity'] for result in payload['results']] == ['O(1)', 'O(n)']
+
+
+def test_saturated_service_answers_503_with_retry_after(service):
+    async def occupy(value):
+        service.pending = value
+
+    def set_pending(value):
+        asyncio.run_coroutine_threadsafe(occupy(value), service.loop).result()
+
+    set_pending(service.max_pending - 1)
+    try:
+        status, headers, _ = request(service, 'POST', '/analyze/batch', batch(2))
+    finally:
+        set_pending(0)
+    assert status == 503
+    assert headers['Retry-After'] == '1'
+    assert request(service, 'POST', '/analyze/batch', batch(2))[0] == 200
+
+
+def test_dead_worker_restarts_pool_once(service, monkeypatch):
+    """Si muere un proceso, las peticiones en curso reciben 503 y el pool se reinicia una sola vez"""
+    restarts = []
+    new_pool = service._new_pool
+    monkeypatch.setattr(service, '_new_pool', lambda: restarts.append(None) or new_pool())
+    pool = service._pool
+    code = 'for (let i = 0; i < n; i++) { for (let j = 0; j < n; j++) { s += i * j; } }\n' * 200
+
+    async def analyze_while_killing():
+        requests = [asyncio.ensure_future(service.analyze([code, code])) for _ in range(WORKERS * 2)]
+        await asyncio.sleep(0)
+        for process in list(pool._processes.values()):
+            process.kill()
+        return await asyncio.gather(*requests, return_exceptions=True)
+
+    results = asyncio.run_coroutine_threadsafe(analyze_while_killing(), service.loop).result(timeout=60)
+    failed = [result for result in results if not isinstance(result, list)]
+    assert failed and all(isinstance(result, HTTPError) and result.status == 503 for result in failed)
+    assert len(restarts) == 1 and service._pool is not pool
+    assert service.pending == 0
+    result, = asyncio.run_coroutine_threadsafe(service.analyze(['let x = 1;']), service.loop).result(timeout=60)
+    assert result['complexity'] == 'O(1)'
@@ -0,0 +1,84 @@
+"""Formato binario CXNW de los pesos (Backend.weights)"""
+
+import struct
+from array import array
+
+import pytest
+
+from Backend.backend import NUMPY_AVAILABLE, NeuralNetworkComplexityAnalyzer
+from Backend.weights import HEADER, WEIGHTS_MAGIC, WEIGHTS_VERSION, read_weights, write_weights
+
+LAYER_SIZES = [3, 2, 1]
+WEIGHTS = [[[0.1, -0.25, 1 / 3], [2.5, 0.0, -1e-8]], [[0.75, -1.125]]]
+BIASES = [[0.5, -0.1], [1e10]]
+STATS = [1.0, 7.0, 0.2]
+
+
+def float32(values):
+    """Los valores tal como quedan tras pasar por float32"""
+    return array('f', values).tolist()
+
+
+@pytest.mark.parametrize('double', [False, True])
+@pytest.mark.parametrize('is_trained', [False, True])
+def test_round_trip(tmp_path, double, is_trained):
+    path = str(tmp_path / 'model.bin')
+    write_weights(path, LAYER_SIZES, WEIGHTS, BIASES, STATS, is_trained, double=double)
+    data = read_weights(path)
+    exact = (lambda values: list(values)) if double else float32
+    assert data == {
+        'layer_sizes': LAYER_SIZES,
+        'weights': [[exact(row) for row in w] for w in WEIGHTS],
+        'biases': [exact(b) for b in BIASES],
+        'feature_stats': exact(STATS),
+        'is_trained': is_trained,
+    }
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy no está instalado")
+@pytest.mark.parametrize('double', [False, True])
+def test_numpy_matches_lists(tmp_path, double):
+    path = str(tmp_path / 'model.bin')
+    write_weights(path, LAYER_SIZES, WEIGHTS, BIASES, STATS, double=double)
+    lists, matrices = read_weights(path), read_weights(path, as_numpy=True)
+    assert [w.tolist() for w in matrices['weights']] == lists['weights']
+    assert [b.tolist() for b in matrices['biases']] == lists['biases']
+    assert [w.shape for w in matrices['weights']] == [(2, 3), (1, 2)]
+
+
+def test_layer_shape_mismatch_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        write_weights(str(tmp_path / 'model.bin'), [3, 2, 1], [[[0.0, 0.0], [0.0, 0.0]], [[0.0, 0.0]]], BIASES)
+
+
+def _corrupt(raw):
+    return {
+        'short': raw[:HEADER.size - 1],
+        'magic': b'XXXX' + raw[4:],
+        'version': HEADER.pack(WEIGHTS_MAGIC, WEIGHTS_VERSION + 1, *HEADER.unpack_from(raw)[2:]) + raw[HEADER.size:],
+        'truncated': raw[:-4],
+        'extra': raw + struct.pack('<f', 0.0),
+    }
+
+
+@pytest.mark.parametrize('kind', ['short', 'magic', 'version', 'truncated', 'extra'])
+def test_invalid_files_raise_value_error(tmp_path, kind):
+    path = tmp_path / 'model.bin'
+    write_weights(str(path), LAYER_SIZES, WEIGHTS, BIASES, STATS)
+    path.write_bytes(_corrupt(path.read_bytes())[kind])
+    with pytest.raises(ValueError):
+        read_weights(str(path))
+
+
+def test_analyzer_save_and_load_keep_predictions(tmp_path):
+    analyzer = NeuralNetworkComplexityAnalyzer(hidden_layers=(8,), epochs=3, deterministic=True, use_numpy=False)
+    analyzer.train()
+    path = str(tmp_path / 'model.bin')
+    analyzer.save_model(path)
+
+    loaded = NeuralNetworkComplexityAnalyzer(deterministic=True, use_numpy=False)
+    loaded.load_model(path)
+    assert loaded.model.layer_sizes == [20, 8, 1]
+    assert loaded.model.feature_scale == float32(analyzer.model.feature_scale)
+    for code in ["let x = 1;", "for (let i = 0; i < n; i++) {}", "function f(n) { return f(n - 1); }"]:
+        assert loaded.analyze(code)['complexity'] == analyzer.analyze(code)['complexity']
@@ -1,61 +1,141 @@
 #!/usr/bin/env python3
 """
 Script de entrenamiento con 500 épocas - Versión rápida
+
+Guarda un checkpoint cada 50 épocas en --checkpoints: si se interrumpe,
+al volver a ejecutarlo continúa desde el último. Se detiene antes si la
+pérdida de validación no mejora en --patience épocas y guarda la mejor
+red en --output. Con --workers N, cada lote se reparte entre N procesos;
+solo acelera con varios núcleos y lotes grandes (--batch-size): con NumPy
+y la red por defecto, a partir de 256 muestras por lote (con lotes de 32,
+dos procesos tardan el doble que uno), así que --workers > 1 con lotes
+más pequeños se rechaza. benchmark_parallel.py mide el lote mínimo en cada
+máquina. Con --dataset entrena con un corpus real preparado con
+build_dataset.py.
+
+Como los procesos de entrenamiento pueden volver a importar este script,
+todo el trabajo está dentro de main().
+
+Uso:
+    python train_500_epochs.py --checkpoints checkpoints/ --patience 50 --workers 4 --batch-size 512
 """
 
+import argparse
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
 
-from Backend.backend import NeuralNetworkComplexityAnalyzer
+from Backend.backend import NeuralNetworkComplexityAnalyzer, DEFAULT_MODEL_PATH, NUMPY_AVAILABLE
+from Backend.checkpoint import CheckpointManager
+from Backend.dataset import FeatureStore
+from Backend.parallel import min_parallel_batch
 import time
 
-print("=" * 70)
-print("ENTRENAMIENTO DE RED NEURONAL CON 500 ÉPOCAS")
-print("=" * 70)
-
-# Inicializar con 500 épocas
-analyzer = NeuralNetworkComplexityAnalyzer(epochs=500)
-
-print(f"\n✓ Parámetros configurados:")
-print(f"  - Épocas: {analyzer.model.epochs}")
-print(f"  - Capas ocultas: {analyzer.model.hidden_layers}")
-print(f"  - Learning rate: {analyzer.model.learning_rate}")
-print(f"  - Tamaño entrada: {analyzer.model.input_size}")
-
-# Generar datos de entrenamiento
-print(f"\n📊 Generando datos de entrenamiento (1000 muestras)...")
-X_train, y_train = analyzer.generate_training_data(samples=1000)
-print(f"✓ Datos generados: {len(X_train)} muestras")
-
-# Entrenar
-print(f"\n🧠 Iniciando entrenamiento con 500 épocas...")
-start_time = time.time()
-analyzer.train(X_train, y_train)
-elapsed = time.time() - start_time
-
-print(f"\n✓ Entrenamiento completado en {elapsed:.2f} segundos")
-print(f"✓ Modelo entrenado: {analyzer.is_trained}")
-
-# Probar predicciones
-print("\n" + "=" * 70)
-print("PRUEBAS DE PREDICCIÓN")
-print("=" * 70)
-
-test_cases = [
-    ("const x = 5; x++;", "O(1)"),
-    ("for (let i = 0; i < n; i++) { console.log(i); }", "O(n)"),
-]
-
-for code, expected in test_cases:
-    try:
-        complexity, confidence = analyzer.predict(code)
-        status = "✅" if complexity == expected else "⚠️ "
-        print(f"\n{status} Código: {code[:50]}...")
-        print(f"   Esperado: {expected} | Detectado: {complexity} ({confidence:.0%})")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-
-print("\n" + "=" * 70)
-print("✅ Entrenamiento finalizado exitosamente")
-print("=" * 70)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Entrena la red neuronal con checkpoints y parada temprana")
+    parser.add_argument('--output', default=DEFAULT_MODEL_PATH, help="archivo donde se guarda el modelo entrenado")
+    parser.add_argument('--checkpoints', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'checkpoints'),
+                        help="directorio de checkpoints (se reanuda desde el último)")
+    parser.add_argument('--checkpoint-every', type=int, default=50, help="épocas entre checkpoints")
+    parser.add_argument('--patience', type=int, default=50, help="épocas sin mejorar antes de parar (0: nunca)")
+    parser.add_argument('--validation', type=float, default=0.2, help="fracción de muestras para validación")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="procesos que calculan los gradientes de cada lote (con NumPy exige lotes de "
+                             f"{min_parallel_batch(True)} muestras o más; ver benchmark_parallel.py)")
+    parser.add_argument('--batch-size', type=int, default=32, help="muestras por mini-lote")
+    parser.add_argument('--dataset', default=None,
+                        help="almacén de build_dataset.py (por defecto, datos sintéticos); "
+                             "con --validation > 0 se reserva su último fragmento")
+    args = parser.parse_args(argv)
+
+    # Por debajo del lote mínimo, repartir cada lote entre procesos es más lento que un solo proceso
+    minimum = min_parallel_batch(NUMPY_AVAILABLE)
+    if args.workers > 1 and args.batch_size < minimum:
+        parser.error(f"--workers {args.workers} necesita --batch-size {minimum} o más "
+                     f"(con lotes más pequeños es más lento que --workers 1)")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 70)
+    print("ENTRENAMIENTO DE RED NEURONAL CON 500 ÉPOCAS")
+    print("=" * 70)
+
+    # Inicializar con 500 épocas
+    analyzer = NeuralNetworkComplexityAnalyzer(epochs=500, batch_size=args.batch_size)
+
+    print(f"\n✓ Parámetros configurados:")
+    print(f"  - Épocas: {analyzer.model.epochs}")
+    print(f"  - Capas ocultas: {analyzer.model.hidden_layers}")
+    print(f"  - Learning rate: {analyzer.model.learning_rate}")
+    print(f"  - Tamaño de lote: {analyzer.model.batch_size}")
+    print(f"  - Tamaño entrada: {analyzer.model.input_size}")
+    print(f"  - Procesos de entrenamiento: {args.workers}")
+
+    if args.dataset:
+        # Corpus real: se recorre fragmento a fragmento, mapeado en memoria
+        store = FeatureStore(args.dataset)
+        print(f"\n📊 Almacén {args.dataset}: {len(store)} muestras en {store.shard_count} fragmentos")
+        X_train = y_train = X_val = y_val = None
+        if args.validation > 0 and store.shard_count > 1:
+            X_val, y_val = store.load_shard(store.shard_count - 1)
+            store = store.select(range(store.shard_count - 1))
+    else:
+        # Generar datos de entrenamiento
+        print(f"\n📊 Generando datos de entrenamiento (1000 muestras)...")
+        X_train, y_train = analyzer.generate_training_data(samples=1000)
+        print(f"✓ Datos generados: {len(X_train)} muestras")
+        store = None
+
+        # Las últimas muestras se reservan para validación (vistas, sin copiar)
+        split = len(X_train) - int(len(X_train) * args.validation)
+        X_val, y_val = (X_train.rows(split, len(X_train)), y_train[split:]) if split < len(X_train) else (None, None)
+        X_train, y_train = X_train.rows(0, split), y_train[:split]
+
+    # Entrenar
+    print(f"\n🧠 Iniciando entrenamiento con 500 épocas...")
+    start_time = time.time()
+    analyzer.train(X_train, y_train, X_val=X_val, y_val=y_val, checkpoints=CheckpointManager(args.checkpoints),
+                   checkpoint_every=args.checkpoint_every, patience=args.patience or None, workers=args.workers,
+                   store=store)
+    elapsed = time.time() - start_time
+
+    print(f"\n✓ Entrenamiento completado en {elapsed:.2f} segundos")
+    epoch_times = [h['seconds'] for h in analyzer.model.training_history]
+    if epoch_times:
+        print(f"✓ Tiempo medio por época: {sum(epoch_times) / len(epoch_times) * 1000:.1f} ms")
+    print(f"✓ Épocas entrenadas: {len(epoch_times)}")
+    print(f"✓ Modelo entrenado: {analyzer.is_trained}")
+
+    analyzer.save_model(args.output)
+    print(f"✓ Modelo guardado en {args.output}")
+
+    # Probar predicciones
+    print("\n" + "=" * 70)
+    print("PRUEBAS DE PREDICCIÓN")
+    print("=" * 70)
+
+    test_cases = [
+        ("const x = 5; x++;", "O(1)"),
+        ("for (let i = 0; i < n; i++) { console.log(i); }", "O(n)"),
+    ]
+
+    for code, expected in test_cases:
+        try:
+            complexity, confidence = analyzer.predict(code)
+            status = "✅" if complexity == expected else "⚠️ "
+            print(f"\n{status} Código: {code[:50]}...")
+            print(f"   Esperado: {expected} | Detectado: {complexity} ({confidence:.0%})")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+
+    print("\n" + "=" * 70)
+    print("✅ Entrenamiento finalizado exitosamente")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()